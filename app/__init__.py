@@ -1 +1 @@
-from .models import Battle
+from .models import Battle, AsyncBattle
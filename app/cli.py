@@ -0,0 +1,321 @@
+import argparse
+import json
+import os
+import sys
+import time
+from typing import List, Union
+
+from .config import (
+    ROSTER_SNAPSHOT_PATH,
+    SUPERHERO_API_LAST_CHARACTER_ID,
+    TEAM_SIZE,
+    BATTLE_HISTORY_BATCH_SIZE,
+)
+from .models import Battle, FreeForAllBattle
+from .services import (
+    Character_Service,
+    Email_Service,
+    Battle_History,
+    BattleRecord,
+)
+from .simulation import BatchSimulation
+from .utils import (
+    TeamPopulationError,
+    ConsoleReporter,
+    JsonLinesReporter,
+    MultiReporter,
+    EventRecorder,
+    ALL_EVENTS,
+    Instrumentation,
+    print_header,
+)
+
+OUTPUT_FORMATS = ("text", "json")
+
+
+def parse_arguments(argv: Union[List[str], None] = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments of the simulation.
+
+    Args:
+        argv: The arguments to parse. Defaults to `sys.argv`.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m app.main",
+        description="Simula batallas entre equipos de Superhero API.",
+    )
+    parser.add_argument(
+        "--battles",
+        type=int,
+        default=1,
+        help="Number of battles to simulate",
+    )
+    parser.add_argument("--seed", type=int, help="Simulation seed")
+    parser.add_argument(
+        "--teams",
+        type=int,
+        default=2,
+        help="Number of teams, in a free-for-all if more than two",
+    )
+    parser.add_argument(
+        "--team-size",
+        type=int,
+        default=TEAM_SIZE,
+        help="Number of characters in each team",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for batches of battles",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="Format of the battle output",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only print the winners and the summary of the simulation",
+    )
+    parser.add_argument(
+        "--snapshot",
+        type=str,
+        default=ROSTER_SNAPSHOT_PATH,
+        help="Roster snapshot file path, used if it exists",
+    )
+    parser.add_argument(
+        "--record",
+        type=str,
+        help="Record the events of a single battle to a replay file",
+    )
+    parser.add_argument(
+        "--history",
+        action="store_true",
+        help="Append the battles to the battle history",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time the hot paths, in one process, and print them to stderr",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=str,
+        help="Write the hot path timings to a Prometheus text file",
+    )
+    parser.add_argument(
+        "-email",
+        "--email",
+        nargs="?",
+        type=str,
+        help="Email address",
+    )
+    args = parser.parse_args(argv)
+    if args.battles < 1:
+        parser.error("--battles must be at least 1")
+    if args.record and args.battles > 1:
+        parser.error("--record is only available for a single battle")
+    if args.teams < 2:
+        parser.error("--teams must be at least 2")
+    if args.team_size < 1:
+        parser.error("--team-size must be at least 1")
+    if args.teams * args.team_size > SUPERHERO_API_LAST_CHARACTER_ID:
+        parser.error(
+            f"--teams times --team-size cannot exceed the"
+            f" {SUPERHERO_API_LAST_CHARACTER_ID} available characters"
+        )
+    return args
+
+
+def main(argv: Union[List[str], None] = None) -> None:
+    """
+    Run the simulation from the command line.
+
+    A single battle is played with the full battle output, and its results
+    can be sent by email. Several battles are played as a batch between the
+    same rosters, printing one line per battle and the throughput.
+
+    Args:
+        argv: The command line arguments. Defaults to `sys.argv`.
+
+    Returns:
+        None.
+    """
+    args = parse_arguments(argv)
+
+    # Serve characters from the roster snapshot if one has been downloaded
+    if os.path.exists(args.snapshot):
+        Character_Service.load_snapshot(args.snapshot)
+
+    # Time the hot paths only if asked to, leaving them untouched otherwise
+    if args.profile or args.metrics_file:
+        Instrumentation.enable()
+        # Worker processes would time their battles where nobody reads them
+        if args.battles > 1 and args.workers != 1:
+            print(
+                "Las batallas se simulan en un solo proceso para medirlas.",
+                file=sys.stderr,
+            )
+            args.workers = 1
+
+    if args.battles == 1:
+        _run_battle(args)
+    else:
+        _run_batch(args)
+
+    # Let the background email delivery finish before exiting
+    Email_Service.wait_for_pending_emails()
+
+    if args.profile:
+        print(Instrumentation.summary(), file=sys.stderr)
+    if args.metrics_file:
+        Instrumentation.write_prometheus(args.metrics_file)
+
+
+###########################################################
+# AUXILIARY FUNCTIONS
+###########################################################
+
+
+def _run_battle(args: argparse.Namespace) -> None:
+    """
+    Play a single battle, reporting it in the requested format.
+
+    Args:
+        args: The parsed command line arguments.
+
+    Returns:
+        None.
+    """
+    events = ("winner",) if args.quiet else ALL_EVENTS
+    if args.output_format == "json":
+        reporter = JsonLinesReporter(sys.stdout, events)
+    else:
+        reporter = ConsoleReporter(events=events)
+    if args.record:
+        reporter = MultiReporter(reporter, EventRecorder(args.record))
+    history = Battle_History() if args.history else None
+    try:
+        if args.teams == 2:
+            battle = Battle(
+                reporter=reporter,
+                seed=args.seed,
+                email=args.email,
+                team_size=args.team_size,
+                history=history,
+            )
+        else:
+            if args.email:
+                print(
+                    "El envío de resultados por email solo está disponible"
+                    " para batallas entre dos equipos."
+                )
+            battle = FreeForAllBattle(
+                team_count=args.teams,
+                reporter=reporter,
+                seed=args.seed,
+                team_size=args.team_size,
+                history=history,
+            )
+    except ValueError as e:
+        # The loaded snapshot may have fewer characters than the API
+        print(f"A fallado la simulacion -> {str(e)}")
+        reporter.close()
+        return
+    battle.start_battle()
+
+
+def _run_batch(args: argparse.Namespace) -> None:
+    """
+    Play a batch of battles, printing each result and the throughput.
+
+    Args:
+        args: The parsed command line arguments.
+
+    Returns:
+        None.
+    """
+    batch = BatchSimulation(
+        args.battles,
+        workers=args.workers,
+        seed=args.seed,
+        team_count=args.teams,
+        team_size=args.team_size,
+    )
+    text_output = args.output_format == "text"
+    if text_output:
+        print_header("SIMULACION DE BATALLAS")
+        print(f"Semilla de la simulacion: {batch.seed}")
+        if args.email:
+            print(
+                "El envío de resultados por email solo está disponible para"
+                " una batalla."
+            )
+
+    try:
+        batch.build_teams()
+    except TeamPopulationError as e:
+        print(f"A fallado la simulacion -> {str(e)}")
+        return
+
+    history = Battle_History() if args.history else None
+    teams = {
+        name: [character_id for character_id, *_ in roster]
+        for name, roster in batch.rosters.items()
+    }
+    battle_records = []
+    wins = {name: 0 for name in batch.rosters}
+    for result in batch.run():
+        wins[result.winner] += 1
+        if history is not None:
+            battle_records.append(
+                BattleRecord(
+                    result.seed,
+                    result.winner,
+                    result.rounds,
+                    teams,
+                    time.time(),
+                )
+            )
+            if len(battle_records) == BATTLE_HISTORY_BATCH_SIZE:
+                history.record(battle_records)
+                battle_records = []
+        if args.quiet:
+            continue
+        if text_output:
+            print(
+                f"Batalla {result.battle} (semilla {result.seed}): gana"
+                f" {result.winner} en {result.rounds} rondas"
+            )
+        else:
+            print(json.dumps({"event": "battle", **result._asdict()}))
+
+    if battle_records:
+        history.record(battle_records)
+
+    if text_output:
+        print_header("RESUMEN")
+        for name, team_wins in wins.items():
+            print(f"{name}: {team_wins} victorias")
+        print(
+            f"{batch.battles} batallas en {batch.elapsed:.2f} segundos"
+            f" ({batch.battles_per_second:.1f} batallas/segundo)"
+        )
+    else:
+        print(
+            json.dumps(
+                {
+                    "event": "summary",
+                    "seed": batch.seed,
+                    "battles": batch.battles,
+                    "wins": wins,
+                    "elapsed": batch.elapsed,
+                    "battles_per_second": batch.battles_per_second,
+                }
+            )
+        )
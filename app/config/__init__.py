@@ -9,18 +9,70 @@ load_dotenv()
 SUPERHERO_API_KEY = os.getenv("SUPERHERO_API_KEY")
 MAILGUN_API_KEY = os.getenv("MAILGUN_API_KEY")
 MAILGUN_DOMAIN_NAME = os.getenv("MAILGUN_DOMAIN_NAME")
-SUPERHERO_API_URL = f"https://superheroapi.com/api/{SUPERHERO_API_KEY}"
-MAILGUN_API_URL = f"https://api.mailgun.net/v3/{MAILGUN_DOMAIN_NAME}/messages"
+SUPERHERO_API_URL = os.getenv(
+    "SUPERHERO_API_URL", f"https://superheroapi.com/api/{SUPERHERO_API_KEY}"
+)
+MAILGUN_API_URL = os.getenv(
+    "MAILGUN_API_URL",
+    f"https://api.mailgun.net/v3/{MAILGUN_DOMAIN_NAME}/messages",
+)
+SUPERHERO_API_MAX_CONCURRENT_REQUESTS = 10
+SUPERHERO_API_LAST_CHARACTER_ID = 731
+TEAM_SIZE = int(os.getenv("TEAM_SIZE", 5))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 10))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", 3))
+HTTP_BACKOFF_BASE = float(os.getenv("HTTP_BACKOFF_BASE", 0.5))
+HTTP_BACKOFF_MAX = float(os.getenv("HTTP_BACKOFF_MAX", 8))
+HTTP_CIRCUIT_BREAKER_THRESHOLD = int(
+    os.getenv("HTTP_CIRCUIT_BREAKER_THRESHOLD", 5)
+)
+HTTP_CIRCUIT_BREAKER_RESET = float(os.getenv("HTTP_CIRCUIT_BREAKER_RESET", 30))
+HTTP_POOL_SIZE = int(
+    os.getenv("HTTP_POOL_SIZE", SUPERHERO_API_MAX_CONCURRENT_REQUESTS)
+)
+EMAIL_QUEUE_BATCH_SIZE = 1000
 ROOT_DIRECTORY_PATH = os.path.join(
     os.path.dirname(__file__),
     "..",
     "..",
 )
+CHARACTER_CACHE_PATH = os.getenv(
+    "CHARACTER_CACHE_PATH",
+    os.path.join(ROOT_DIRECTORY_PATH, "character_cache.db"),
+)
+CHARACTER_CACHE_TTL = float(os.getenv("CHARACTER_CACHE_TTL", 30 * 24 * 60 * 60))
+CHARACTER_CACHE_MAX_ENTRIES = int(
+    os.getenv("CHARACTER_CACHE_MAX_ENTRIES", 1000)
+)
+CHARACTER_STATS_CACHE_SIZE = int(os.getenv("CHARACTER_STATS_CACHE_SIZE", 65536))
+DUEL_SOLVER_CACHE_SIZE = int(os.getenv("DUEL_SOLVER_CACHE_SIZE", 65536))
+DUEL_SOLVER_TOLERANCE = float(os.getenv("DUEL_SOLVER_TOLERANCE", 1e-12))
+DUEL_SOLVER_MAX_ATTACKS = int(os.getenv("DUEL_SOLVER_MAX_ATTACKS", 100_000))
+DUEL_SOLVER_BLOCK_SIZE = int(os.getenv("DUEL_SOLVER_BLOCK_SIZE", 256))
+ROSTER_SNAPSHOT_PATH = os.getenv(
+    "ROSTER_SNAPSHOT_PATH",
+    os.path.join(ROOT_DIRECTORY_PATH, "roster_snapshot.bin"),
+)
+BATTLE_LOG_PATH = os.getenv(
+    "BATTLE_LOG_PATH",
+    os.path.join(ROOT_DIRECTORY_PATH, "battle_log.jsonl"),
+)
+BATTLE_HISTORY_PATH = os.getenv(
+    "BATTLE_HISTORY_PATH",
+    os.path.join(ROOT_DIRECTORY_PATH, "battle_history"),
+)
+BATTLE_HISTORY_BATCH_SIZE = int(os.getenv("BATTLE_HISTORY_BATCH_SIZE", 1000))
 
-# Configure logging
-logging.basicConfig(
-    format="%(message)s",
-    level=logging.INFO,
-    filename="battle_log.txt",
-    filemode="w",
+# Configure the battle log on its own logger, so records of other libraries
+# going through the root logger never end up among the JSON lines. The file
+# is only opened, and emptied, when the first record is written, so entry
+# points that never play a battle leave the last log in place
+BATTLE_LOGGER_NAME = "superhero_battle.battle_log"
+_battle_log_handler = logging.FileHandler(
+    BATTLE_LOG_PATH, mode="w", encoding="utf-8", delay=True
 )
+_battle_log_handler.setFormatter(logging.Formatter("%(message)s"))
+_battle_logger = logging.getLogger(BATTLE_LOGGER_NAME)
+_battle_logger.addHandler(_battle_log_handler)
+_battle_logger.setLevel(logging.INFO)
+_battle_logger.propagate = False
@@ -0,0 +1,2 @@
+from .mailgun_server import Fake_Mailgun_Server
+from .superhero_api_server import Fake_Superhero_API_Server
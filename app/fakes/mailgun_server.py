@@ -0,0 +1,155 @@
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from urllib.parse import parse_qs
+
+
+class Fake_Mailgun_Server:
+    """
+    A local stand-in for the Mailgun messages API, for testing email delivery
+    without sending real emails.
+
+    Point MAILGUN_API_URL to `http://<host>:<port>/v3/<domain>/messages`.
+    """
+
+    ###########################################################
+    # CLASS CONSTRUCTOR
+    ###########################################################
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8025,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+    ) -> None:
+        """
+        Initialize a Fake_Mailgun_Server instance.
+
+        Args:
+            host: The host to listen on.
+            port: The port to listen on. Use 0 to pick a free port.
+            latency: The delay added to every response, in seconds.
+            error_rate: The fraction of requests answered with an HTTP 503.
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.messages: List[Dict[str, List[str]]] = []
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread = None
+
+    ###########################################################
+    # PUBLIC METHODS
+    ###########################################################
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v3/fake.domain/messages"
+
+    def start(self) -> None:
+        """
+        Serve requests in a background thread.
+
+        Returns:
+            None.
+        """
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        """
+        Serve requests in the current thread until interrupted.
+
+        Returns:
+            None.
+        """
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        """
+        Stop serving requests.
+
+        Returns:
+            None.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+    ###########################################################
+    # AUXILIARY METHODS
+    ###########################################################
+
+    def _make_handler(self) -> type:
+        """
+        Build the request handler class bound to this server.
+
+        Returns:
+            type: The request handler class.
+        """
+        fake_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                message = parse_qs(self.rfile.read(length).decode("utf-8"))
+                time.sleep(fake_server.latency)
+
+                if random.random() < fake_server.error_rate:
+                    self._respond(503, {"message": "Service Unavailable"})
+                    return
+
+                fake_server.messages.append(message)
+                print(
+                    "Email recibido para"
+                    f" {', '.join(message.get('to', []))}:"
+                    f" {message.get('subject', [''])[0]}"
+                )
+                self._respond(
+                    200,
+                    {
+                        "id": f"<{uuid.uuid4()}@fake.domain>",
+                        "message": "Queued. Thank you.",
+                    },
+                )
+
+            def _respond(self, status: int, body: dict) -> None:
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-port", type=int, default=8025, help="Port")
+    parser.add_argument(
+        "-latency", type=float, default=0.0, help="Response delay in seconds"
+    )
+    parser.add_argument(
+        "-error-rate", type=float, default=0.0, help="Fraction of failures"
+    )
+    args = parser.parse_args()
+
+    server = Fake_Mailgun_Server(
+        port=args.port, latency=args.latency, error_rate=args.error_rate
+    )
+    print(f"Mailgun falso escuchando en {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,282 @@
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Union
+
+from ..config import SUPERHERO_API_LAST_CHARACTER_ID
+
+POWERSTATS = (
+    "intelligence",
+    "strength",
+    "speed",
+    "durability",
+    "power",
+    "combat",
+)
+
+
+class Fake_Superhero_API_Server:
+    """
+    A local stand-in for the Superhero API, for load testing the character
+    fetching without calling superheroapi.com.
+
+    Characters are generated from their ID and the server seed, so the same
+    ID always has the same data, and are served with the JSON shape of the
+    real API, including "null" powerstats. Point SUPERHERO_API_URL to
+    `http://<host>:<port>/api/<key>`.
+    """
+
+    ###########################################################
+    # CLASS CONSTRUCTOR
+    ###########################################################
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8731,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: Union[float, None] = None,
+        null_rate: float = 0.05,
+        last_character_id: int = SUPERHERO_API_LAST_CHARACTER_ID,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initialize a Fake_Superhero_API_Server instance.
+
+        Args:
+            host: The host to listen on.
+            port: The port to listen on. Use 0 to pick a free port.
+            latency: The delay added to every response, in seconds.
+            error_rate: The fraction of requests answered with an HTTP 503.
+            rate_limit: The requests per second served, with bursts of up to
+                one second of requests, and of at least one request. Requests
+                above it are answered with an HTTP 429. Unlimited if not
+                provided.
+            null_rate: The fraction of powerstats served as "null".
+            last_character_id: The ID of the last character served.
+            seed: The seed the characters are generated from.
+
+        Raises:
+            ValueError: If the rate limit is not positive.
+        """
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError("El límite de solicitudes debe ser positivo.")
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.null_rate = null_rate
+        self.last_character_id = last_character_id
+        self.seed = seed
+        self.responses: Dict[int, int] = {}  # HTTP status -> responses
+        # The bucket holds at least one token, so limits below one request
+        # per second still serve requests
+        self._capacity = max(rate_limit or 0.0, 1.0)
+        self._tokens = self._capacity
+        self._refilled_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread = None
+
+    ###########################################################
+    # PUBLIC METHODS
+    ###########################################################
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/fake-key"
+
+    def start(self) -> None:
+        """
+        Serve requests in a background thread.
+
+        Returns:
+            None.
+        """
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        """
+        Serve requests in the current thread until interrupted.
+
+        Returns:
+            None.
+        """
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        """
+        Stop serving requests.
+
+        Returns:
+            None.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+    def character_data(self, character_id: int) -> dict:
+        """
+        Generate the data of a character as served by the Superhero API.
+
+        Args:
+            character_id: The ID of the character.
+
+        Returns:
+            dict: The character data, or an error response if the character
+            does not exist.
+        """
+        if not 1 <= character_id <= self.last_character_id:
+            return {"response": "error", "error": "invalid id"}
+
+        rng = random.Random(f"{self.seed}:{character_id}")
+        return {
+            "response": "success",
+            "id": str(character_id),
+            "name": f"Superhero {character_id}",
+            "powerstats": {
+                stat: (
+                    "null"
+                    if rng.random() < self.null_rate
+                    else str(rng.randint(1, 100))
+                )
+                for stat in POWERSTATS
+            },
+            "biography": {
+                "alignment": rng.choice(("good", "good", "bad", "neutral"))
+            },
+        }
+
+    ###########################################################
+    # AUXILIARY METHODS
+    ###########################################################
+
+    def _take_token(self) -> bool:
+        """
+        Take a token of the rate limit bucket, refilled at `rate_limit`
+        tokens per second.
+
+        Returns:
+            bool: True if the request can be served, False otherwise.
+        """
+        if self.rate_limit is None:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._refilled_at) * self.rate_limit,
+            )
+            self._refilled_at = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def _count_response(self, status: int) -> None:
+        """
+        Count a response by its HTTP status.
+
+        Args:
+            status: The HTTP status of the response.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            self.responses[status] = self.responses.get(status, 0) + 1
+
+    def _make_handler(self) -> type:
+        """
+        Build the request handler class bound to this server.
+
+        Returns:
+            type: The request handler class.
+        """
+        fake_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep connections open between requests, as the real API does,
+            # so the connection pooling of the clients is exercised. Every
+            # response has a Content-Length, so clients know where it ends
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                if not fake_server._take_token():
+                    self._respond(429, {"message": "Too Many Requests"})
+                    return
+
+                time.sleep(fake_server.latency)
+
+                if random.random() < fake_server.error_rate:
+                    self._respond(503, {"message": "Service Unavailable"})
+                    return
+
+                # Paths look like /api/<key>/<character id>
+                parts = self.path.strip("/").split("/")
+                if len(parts) != 3 or parts[0] != "api":
+                    self._respond(404, {"message": "Not Found"})
+                    return
+                try:
+                    character_id = int(parts[2])
+                except ValueError:
+                    character_id = 0
+                self._respond(200, fake_server.character_data(character_id))
+
+            def _respond(self, status: int, body: dict) -> None:
+                fake_server._count_response(status)
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-port", type=int, default=8731, help="Port")
+    parser.add_argument(
+        "-latency", type=float, default=0.0, help="Response delay in seconds"
+    )
+    parser.add_argument(
+        "-error-rate", type=float, default=0.0, help="Fraction of failures"
+    )
+    parser.add_argument(
+        "-rate-limit", type=float, help="Requests per second served"
+    )
+    parser.add_argument(
+        "-null-rate",
+        type=float,
+        default=0.05,
+        help="Fraction of null powerstats",
+    )
+    parser.add_argument("-seed", type=int, default=0, help="Characters seed")
+    args = parser.parse_args()
+    if args.rate_limit is not None and args.rate_limit <= 0:
+        parser.error("-rate-limit must be positive")
+
+    server = Fake_Superhero_API_Server(
+        port=args.port,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        null_rate=args.null_rate,
+        seed=args.seed,
+    )
+    print(f"Superhero API falsa escuchando en {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,39 @@
+import argparse
+from .services import Battle_History
+from .utils import print_header
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-character", type=int, help="Character ID")
+    parser.add_argument("-team", type=str, help="Team name")
+    parser.add_argument(
+        "-last", type=int, help="Most recent battles to count, all if omitted"
+    )
+    parser.add_argument(
+        "-reindex",
+        action="store_true",
+        help="Index battles appended by other processes first",
+    )
+    args = parser.parse_args()
+
+    # Answer win rates from the index of the battle history
+    history = Battle_History()
+    if args.reindex:
+        print(f"Batallas indexadas: {history.reindex()}")
+    print_header("HISTORIAL DE BATALLAS")
+    print(f"Batallas registradas: {history.count()}")
+    if args.character is not None:
+        win_rate = history.character_win_rate(args.character, args.last)
+        print(
+            f"Personaje con ID {args.character}: {win_rate.wins} victorias en"
+            f" {win_rate.battles} batallas ({win_rate.rate:.1%})"
+        )
+    if args.team is not None:
+        win_rate = history.team_win_rate(args.team, args.last)
+        print(
+            f"Equipo {args.team}: {win_rate.wins} victorias en"
+            f" {win_rate.battles} batallas ({win_rate.rate:.1%})"
+        )
+    if args.character is None and args.team is None:
+        for name, wins in history.wins_by_team(args.last).items():
+            print(f"{name}: {wins} victorias")
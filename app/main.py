@@ -1,7 +1,4 @@
-import sys
-from . import Battle
+from .cli import main
 
 if __name__ == "__main__":
-    # Create a Battle instance and start the battle simulation
-    battle = Battle()
-    battle.start_battle()
+    main()
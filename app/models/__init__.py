@@ -1,3 +1,6 @@
 from .character import Character
+from .roster import Roster
 from .team import Team
 from .battle import Battle
+from .free_for_all_battle import FreeForAllBattle
+from .async_battle import AsyncBattle
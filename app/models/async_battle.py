@@ -0,0 +1,157 @@
+import asyncio
+from typing import AsyncIterator, Iterable, List, Tuple, Union
+
+from . import Battle, Team
+from ..config import TEAM_SIZE
+from ..utils import (
+    TeamPopulationError,
+    BattleStartError,
+    Reporter,
+    ConsoleReporter,
+    BufferedReporter,
+    ALL_EVENTS,
+)
+from ..services import Battle_History
+
+
+class AsyncBattle(Battle):
+    """
+    A battle between two teams of superheroes for asyncio applications.
+
+    The battle follows the rules of Battle, but the characters are fetched
+    and the email is queued without blocking the event loop, and control
+    returns to the loop after every round, so a single loop can run many
+    battles concurrently. Events are buffered and handed out as they happen
+    instead of being sent to a reporter.
+    """
+
+    ###########################################################
+    # CLASS CONSTRUCTOR
+    ###########################################################
+
+    def __init__(
+        self,
+        team_1: Union[Team, None] = None,
+        team_2: Union[Team, None] = None,
+        events: Iterable[str] = ALL_EVENTS,
+        log: bool = False,
+        seed: Union[int, None] = None,
+        email: Union[str, None] = None,
+        team_size: int = TEAM_SIZE,
+        history: Union[Battle_History, None] = None,
+    ):
+        """
+        Initialize an AsyncBattle instance.
+
+        Args:
+            team_1: An already populated first team. A new one is created if not provided.
+            team_2: An already populated second team. A new one is created if not provided.
+            events: The event types handed out by the battle.
+            log: Whether the battle is written to the battle log. The log is
+                shared by the whole process, so concurrent battles should not
+                be logged. The email report is built from the records of the
+                battle itself either way.
+            seed: The seed of the battle RNG. A random one is chosen if not provided.
+            email: The address the results are sent to after the battle, if any.
+            team_size: The number of characters of the teams created by the battle.
+            history: The battle history the battle is appended to, if any.
+
+        Returns:
+            None.
+        """
+        super().__init__(
+            team_1,
+            team_2,
+            reporter=BufferedReporter(events),
+            log=log,
+            seed=seed,
+            email=email,
+            team_size=team_size,
+            history=history,
+        )
+        self.winner: Union[Team, None] = None
+
+    ###########################################################
+    # PUBLIC METHODS
+    ###########################################################
+
+    async def events(self) -> AsyncIterator[Tuple[str, tuple]]:
+        """
+        Run the battle, from the creation of the teams to the email
+        notification, handing out its events as they happen.
+
+        Returns:
+            AsyncIterator[Tuple[str, tuple]]: The type and the values of the
+            fields of each event, as listed in `EVENT_FIELDS`.
+        """
+        try:
+            self._report_preamble()
+            for event in self._drain():
+                yield event
+            try:
+                await Team.populate_teams_async(
+                    *self.teams, reporter=self.reporter
+                )
+            except TeamPopulationError as e:
+                raise BattleStartError(f"{str(e)}")
+            self._report_teams()
+
+            teams = self._begin_battle()
+            round_number = 1
+            while (
+                self.team_1.team_has_members()
+                and self.team_2.team_has_members()
+            ):
+                self._simulate_round(round_number)
+                round_number += 1
+                for event in self._drain():
+                    yield event
+                await asyncio.sleep(0)
+            self.winner = (
+                self.team_1 if self.team_1.team_has_members() else self.team_2
+            )
+            # The history and the email validation block on I/O
+            await asyncio.to_thread(self._finish_battle, self.winner, teams)
+        except BattleStartError as e:
+            self._report("message", " ")
+            self._report("message", f"A fallado la simulacion -> {str(e)}")
+
+        self._report("header", "TERMINO DE SIMULACION")
+        for event in self._drain():
+            yield event
+
+    async def run(
+        self, reporter: Union[Reporter, None] = None
+    ) -> Union[Team, None]:
+        """
+        Run the battle, sending its events to a reporter.
+
+        Args:
+            reporter: The sink of the battle events. Defaults to the console.
+
+        Returns:
+            Union[Team, None]: The winning team, or None if the battle could
+            not be started.
+        """
+        if reporter is None:
+            reporter = ConsoleReporter()
+        async for event, data in self.events():
+            if reporter.is_interested(event):
+                reporter.report(event, data)
+        reporter.close()
+        return self.winner
+
+    ###########################################################
+    # AUXILIARY METHODS
+    ###########################################################
+
+    def _drain(self) -> List[Tuple[str, tuple]]:
+        """
+        Take the events buffered since the last call.
+
+        Returns:
+            List[Tuple[str, tuple]]: The buffered events, in order.
+        """
+        records = self.reporter.records
+        self.reporter.records = []
+        return records
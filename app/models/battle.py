@@ -1,22 +1,21 @@
-from . import Character, Team
+import random
+import time
+from typing import Dict, List, Union
+
+from . import Character, Roster, Team
+from ..config import TEAM_SIZE
 from ..utils import (
     TeamPopulationError,
     BattleStartError,
-    print_header,
-    print_subheader,
-    print_team_stats,
-    print_intro_message,
-    print_and_return_round_details,
-    print_round_results,
-    print_move_details,
-    print_move_results,
-    print_battle_winner,
-    log_battle_teams,
-    log_battle_winner,
-    log_round_results,
+    Reporter,
+    ConsoleReporter,
+    team_stats_fields,
+    log_record,
+    battle_teams_record,
+    battle_winner_record,
+    round_results_record,
 )
-
-from ..services import Email_Service
+from ..services import Battle_History, BattleRecord, Email_Service
 
 
 class Battle:
@@ -28,15 +27,63 @@ class Battle:
     # CLASS CONSTRUCTOR
     ###########################################################
 
-    def __init__(self):
+    def __init__(
+        self,
+        team_1: Union[Team, None] = None,
+        team_2: Union[Team, None] = None,
+        reporter: Union[Reporter, None] = None,
+        log: bool = True,
+        seed: Union[int, None] = None,
+        email: Union[str, None] = None,
+        team_size: int = TEAM_SIZE,
+        history: Union[Battle_History, None] = None,
+    ):
         """
         Initialize a Battle instance.
 
+        Args:
+            team_1: An already populated first team. A new one is created if not provided.
+            team_2: An already populated second team. A new one is created if not provided.
+            reporter: The sink of the battle events. Defaults to the console.
+            log: Whether the battle is written to the battle log.
+            seed: The seed of the battle RNG. A random one is chosen if not provided.
+            email: The address the results are sent to after the battle, if any.
+            team_size: The number of characters of the teams created by the battle.
+            history: The battle history the battle is appended to, if any.
+
         Returns:
             None.
+
+        Raises:
+            ValueError: If the teams need more characters than are available.
         """
-        self.team_1 = Team("Team 1")
-        self.team_2 = Team("Team 2")
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        self.roster = Roster()
+        self.team_1 = (
+            team_1
+            if team_1 is not None
+            else Team("Team 1", self.rng, self.roster, team_size)
+        )
+        self.team_2 = (
+            team_2
+            if team_2 is not None
+            else Team("Team 2", self.rng, self.roster, team_size)
+        )
+        self.teams = [self.team_1, self.team_2]
+        self._check_available_characters()
+        self.reporter = reporter if reporter is not None else ConsoleReporter()
+        self.log = log
+        self.email = email
+        self.history = history
+        # Log records of this battle, for the email report
+        self.records: Union[List[Dict], None] = [] if email else None
+        self._logging = log or self.records is not None
+        self._report_rounds = self.reporter.is_interested("round")
+        self._report_moves = self.reporter.is_interested("move")
+        self._report_move_results = self.reporter.is_interested("move_result")
+        self._report_round_results = self.reporter.is_interested("round_result")
+        self._report_hp_resets = self.reporter.is_interested("hp_reset")
 
     ###########################################################
     # PUBLIC METHODS
@@ -53,19 +100,49 @@ class Battle:
             SimulationError: If the battle simulation cannot be started.
         """
         try:
-            print_intro_message()
+            self._report_preamble()
             self._create_teams()
             self._simulate_team_battle()
         except BattleStartError as e:
-            print(" ")
-            print(f"A fallado la simulacion -> {str(e)}")
+            self._report("message", " ")
+            self._report("message", f"A fallado la simulacion -> {str(e)}")
 
-        print_header("TERMINO DE SIMULACION")
+        self._report("header", "TERMINO DE SIMULACION")
+        self.reporter.close()
+
+    def simulate(self) -> Team:
+        """
+        Simulate the battle between already populated teams, without
+        email notification.
+
+        Returns:
+            Team: The winning team.
+        """
+        round_number = 1
+        while self.team_1.team_has_members() and self.team_2.team_has_members():
+            self._simulate_round(round_number)
+            round_number += 1
+
+        return self.team_1 if self.team_1.team_has_members() else self.team_2
 
     ###########################################################
     # PRIVATE METHODS
     ###########################################################
 
+    def _report_preamble(self) -> None:
+        """
+        Report the introduction and the seed of the battle, and announce the
+        creation of the teams.
+
+        Returns:
+            None.
+        """
+        self._report("intro", len(self.teams), self.teams[0].size)
+        self._report("message", f"Semilla de la batalla: {self.seed}")
+        self._report("header", "EQUIPOS")
+        self._report("message", "Agregando personajes a cada equipo...")
+        self._report("message", " ")
+
     def _create_teams(self) -> None:
         """
         Create the teams and populate them with characters.
@@ -76,21 +153,27 @@ class Battle:
         Raises:
             BattleStartError: If the teams cannot be created.
         """
-        print_header("EQUIPOS")
-        print("Agregando personajes a cada equipo...")
-        print(" ")
         try:
-            self.team_1.populate_team()
-            self.team_2.populate_team()
+            Team.populate_teams(*self.teams, reporter=self.reporter)
         except TeamPopulationError as e:
             raise BattleStartError(f"{str(e)}")
+        self._report_teams()
 
-        print(" ")
-        print("Equipos conformados...")
-        print(" ")
-        print_team_stats(self.team_1)
-        print(" ")
-        print_team_stats(self.team_2)
+    def _report_teams(self) -> None:
+        """
+        Report the members and stats of the populated teams.
+
+        Returns:
+            None.
+        """
+        self._report("message", " ")
+        self._report("message", "Equipos conformados...")
+        self._report("message", " ")
+        if self.reporter.is_interested("team"):
+            for team_number, team in enumerate(self.teams):
+                if team_number > 0:
+                    self._report("message", " ")
+                self.reporter.report("team", team_stats_fields(team))
 
     def _simulate_team_battle(
         self,
@@ -101,27 +184,78 @@ class Battle:
         Returns:
             None.
         """
-        print_header("COMIENZA LA BATALLA")
+        teams = self._begin_battle()
+        winner_team = self.simulate()
+        self._finish_battle(winner_team, teams)
 
-        round_number = 1
-        log_battle_teams(self.team_1, self.team_2)
-        while self.team_1.team_has_members() and self.team_2.team_has_members():
-            self._simulate_round(round_number)
-            round_number += 1
+    def _begin_battle(self) -> Dict[str, List[int]]:
+        """
+        Announce and log the start of the battle between the populated teams.
+
+        Returns:
+            Dict[str, List[int]]: The IDs of the members of each team.
+        """
+        self._report("header", "COMIENZA LA BATALLA")
+
+        if self._logging:
+            self._log(battle_teams_record(self.team_1, self.team_2, self.seed))
+        return {
+            team.name: [member.id for member in team.members]
+            for team in self.teams
+        }
+
+    def _finish_battle(
+        self, winner_team: Team, teams: Dict[str, List[int]]
+    ) -> None:
+        """
+        Report the winner, append the battle to the history, if any, and
+        queue the email with the results, if an address was provided.
+
+        Args:
+            winner_team: The winning team.
+            teams: The IDs of the members of each team at the start of the
+                battle.
 
-        if self.team_1.team_has_members():
-            print_battle_winner(self.team_1)
-            log_battle_winner(self.team_1)
-        elif self.team_2.team_has_members():
-            print_battle_winner(self.team_2)
-            log_battle_winner(self.team_2)
-
-        email = Email_Service.get_email_provided_by_user()
-        print_header("NOTIFICACION DE EMAIL")
-        if email:
-            Email_Service.process_email(email)
+        Returns:
+            None.
+        """
+        self._report_winner(winner_team)
+        if self.history is not None:
+            self.history.record(
+                [
+                    BattleRecord(
+                        self.seed,
+                        winner_team.name,
+                        sum(len(ids) for ids in teams.values())
+                        - len(winner_team.members),
+                        teams,
+                        time.time(),
+                    )
+                ]
+            )
+
+        self._report("header", "NOTIFICACION DE EMAIL")
+        if self.email:
+            Email_Service.process_email(self.email, self.records)
         else:
-            print("No se proporcionó ninguna dirección de correo electrónico.")
+            self._report(
+                "message",
+                "No se proporcionó ninguna dirección de correo electrónico.",
+            )
+
+    def _report_winner(self, winner_team: Team) -> None:
+        """
+        Report the winning team of the battle and log it.
+
+        Args:
+            winner_team: The winning team.
+
+        Returns:
+            None.
+        """
+        self._report("winner", winner_team.name)
+        if self._logging:
+            self._log(battle_winner_record(winner_team))
 
     def _simulate_round(self, round_number: int) -> None:
         """
@@ -133,15 +267,35 @@ class Battle:
         Returns:
             None.
         """
-        attacking_team = self.team_1
-        defending_team = self.team_2
+        self._simulate_duel(round_number, self.team_1, self.team_2)
+
+    def _simulate_duel(
+        self, round_number: int, attacking_team: Team, defending_team: Team
+    ) -> Team:
+        """
+        Simulate a duel between a random member of each team, until one of
+        them is defeated and removed from its team.
+
+        Args:
+            round_number: The number of the current round.
+            attacking_team: The team of the character attacking first.
+            defending_team: The team of the character attacking second.
+
+        Returns:
+            Team: The team that lost a member.
+        """
         attacking_character = attacking_team.select_random_character()
         defending_character = defending_team.select_random_character()
-        round_details = print_and_return_round_details(
-            round_number,
-            attacking_character,
-            defending_character,
-        )
+        if self._report_rounds or self._logging:
+            round_fields = (
+                round_number,
+                attacking_character.name,
+                attacking_character.HP,
+                defending_character.name,
+                defending_character.HP,
+            )
+            if self._report_rounds:
+                self.reporter.report("round", round_fields)
 
         move_number = 1
         while True:
@@ -149,27 +303,43 @@ class Battle:
                 attack_value,
                 attack_type,
             ) = attacking_character.attack(defending_character)
-            print_move_details(
-                move_number,
-                attacking_character,
-                defending_character,
-                attack_type,
-                attack_value,
-            )
-            if defending_character.is_defeated():
-                print_round_results(
-                    attacking_character,
-                    defending_character,
-                )
-                log_round_results(
-                    round_details,
-                    attacking_character,
+            if self._report_moves:
+                self.reporter.report(
+                    "move",
+                    (
+                        move_number,
+                        attacking_character.name,
+                        defending_character.name,
+                        attack_type,
+                        attack_value,
+                    ),
                 )
+            if defending_character.is_defeated():
+                if self._report_round_results:
+                    self.reporter.report(
+                        "round_result",
+                        (attacking_character.name, defending_character.name),
+                    )
+                if self._logging:
+                    self._log(
+                        round_results_record(
+                            *round_fields, attacking_character.name
+                        )
+                    )
                 defending_team.remove_member(defending_character)
                 attacking_character.reset_HP()
-                break
+                if self._report_hp_resets:
+                    self.reporter.report(
+                        "hp_reset",
+                        (attacking_character.name, attacking_character.HP),
+                    )
+                return defending_team
             else:
-                print_move_results(defending_character)
+                if self._report_move_results:
+                    self.reporter.report(
+                        "move_result",
+                        (defending_character.name, defending_character.HP),
+                    )
                 (
                     attacking_character,
                     defending_character,
@@ -185,3 +355,58 @@ class Battle:
                     attacking_team,
                 )
                 move_number += 1
+
+    ###########################################################
+    # AUXILIARY METHODS
+    ###########################################################
+
+    def _check_available_characters(self) -> None:
+        """
+        Check that there are enough characters to fill the teams without
+        repeating any of them. Already populated teams need none.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If the teams need more characters than are available.
+        """
+        needed = sum(
+            max(team.size - len(team.members), 0) for team in self.teams
+        )
+        available = len(self.roster.available_ids)
+        if needed > available:
+            raise ValueError(
+                f"Los equipos necesitan {needed} personajes, pero solo hay"
+                f" {available} disponibles."
+            )
+
+    def _log(self, record: Dict) -> None:
+        """
+        Write a record to the battle log, if the battle is logged, and keep it
+        for the email report, if one is sent.
+
+        Args:
+            record: The log record.
+
+        Returns:
+            None.
+        """
+        if self.log:
+            log_record(record)
+        if self.records is not None:
+            self.records.append(record)
+
+    def _report(self, event: str, *data) -> None:
+        """
+        Send an event to the reporter if it is interested in it.
+
+        Args:
+            event: The type of the event.
+            data: The values of the event fields.
+
+        Returns:
+            None.
+        """
+        if self.reporter.is_interested(event):
+            self.reporter.report(event, data)
@@ -1,12 +1,58 @@
 import random
-from typing import Dict, Tuple
+from functools import lru_cache
+from typing import Dict, Tuple, Union
+
+from ..config import CHARACTER_STATS_CACHE_SIZE
+
+# Fixed positions of the stats and attacks in the per-character tuples
+STAT_NAMES: Tuple[str, ...] = (
+    "intelligence",
+    "strength",
+    "speed",
+    "durability",
+    "power",
+    "combat",
+)
+ATTACK_TYPES: Tuple[str, ...] = ("mental", "strong", "fast")
+
+# Stat index and coefficient of each term of the attack formulas
+ATTACK_COEFFICIENTS: Tuple[Tuple[Tuple[int, float], ...], ...] = (
+    # mental: intelligence, speed, combat
+    ((0, 0.7), (2, 0.2), (5, 0.1)),
+    # strong: strength, power, combat
+    ((1, 0.6), (4, 0.2), (5, 0.2)),
+    # fast: speed, durability, strength
+    ((2, 0.55), (3, 0.25), (1, 0.2)),
+)
 
 
 class Character:
     """
     A class representing a character in the simulation.
+
+    Stats and attacks are stored as tuples indexed by `STAT_NAMES` and
+    `ATTACK_TYPES`; the `base_stats`, `stats` and `attacks` dictionaries are
+    built on access.
+
+    The stats, HP and attacks are derived from the base stats, AS and FB the
+    first time they are needed, so characters that never fight never compute
+    them. Changing the base stats, AS or FB discards them.
     """
 
+    __slots__ = (
+        "id",
+        "name",
+        "alignment",
+        "rng",
+        "_AS",
+        "_FB",
+        "_HP",
+        "_max_HP",
+        "_base_stats",
+        "_stats",
+        "_attacks",
+    )
+
     ###########################################################
     # CLASS CONSTRUCTOR
     ###########################################################
@@ -17,6 +63,7 @@ class Character:
         name: str,
         alignment: str,
         base_stats: Dict[str, float],
+        rng: Union[random.Random, None] = None,
     ) -> None:
         """
         Initialize a Character instance.
@@ -26,16 +73,84 @@ class Character:
             name: The name of the character.
             base_stats: The base stats of the character.
             alignment: The alignment of the character.
+            rng: The random number generator of the battle. A new one is created if not provided.
         """
         self.id = id
         self.name = name
-        self.base_stats = base_stats
+        self._base_stats = tuple(base_stats[stat] for stat in STAT_NAMES)
         self.alignment = alignment
-        self.AS: int = random.randint(0, 10)
-        self.FB: float = None
-        self.stats: Dict[str, float] = None
-        self.HP: float = None
-        self.attacks: Dict[str, float] = None
+        self.rng = rng if rng is not None else random.Random()
+        self._AS: int = self.rng.randint(0, 10)
+        self._FB: float = None
+        self._stats: Tuple[float, ...] = None
+        self._HP: float = None
+        self._max_HP: float = None
+        self._attacks: Tuple[float, ...] = None
+
+    ###########################################################
+    # PROPERTIES
+    ###########################################################
+
+    @property
+    def base_stats(self) -> Dict[str, float]:
+        return dict(zip(STAT_NAMES, self._base_stats))
+
+    @base_stats.setter
+    def base_stats(self, base_stats: Dict[str, float]) -> None:
+        self._base_stats = tuple(base_stats[stat] for stat in STAT_NAMES)
+        self.invalidate_derived_stats()
+
+    @property
+    def AS(self) -> int:
+        return self._AS
+
+    @AS.setter
+    def AS(self, AS: int) -> None:
+        self._AS = AS
+        self.invalidate_derived_stats()
+
+    @property
+    def FB(self) -> Union[float, None]:
+        return self._FB
+
+    @FB.setter
+    def FB(self, FB: float) -> None:
+        self._FB = FB
+        self.invalidate_derived_stats()
+
+    @property
+    def HP(self) -> Union[float, None]:
+        if self._HP is None:
+            self._derive_stats_HP_and_attacks()
+        return self._HP
+
+    @HP.setter
+    def HP(self, HP: float) -> None:
+        if self._max_HP is None:
+            self._derive_stats_HP_and_attacks()
+        self._HP = HP
+
+    @property
+    def max_HP(self) -> Union[float, None]:
+        if self._max_HP is None:
+            self._derive_stats_HP_and_attacks()
+        return self._max_HP
+
+    @property
+    def stats(self) -> Union[Dict[str, float], None]:
+        if self._stats is None:
+            self._derive_stats_HP_and_attacks()
+            if self._stats is None:
+                return None
+        return dict(zip(STAT_NAMES, self._stats))
+
+    @property
+    def attacks(self) -> Union[Dict[str, float], None]:
+        if self._attacks is None:
+            self._derive_stats_HP_and_attacks()
+            if self._attacks is None:
+                return None
+        return dict(zip(ATTACK_TYPES, self._attacks))
 
     ###########################################################
     # PUBLIC METHODS
@@ -43,7 +158,8 @@ class Character:
 
     def init_FB_stats_HP_and_attacks(self, team_alignment: str) -> None:
         """
-        Initialize the FB, stats, HP, and attacks of the character.
+        Initialize the FB of the character. The stats, HP, and attacks are
+        derived from it when first needed.
 
         Args:
             team_alignment: The alignment of the team the character belongs to.
@@ -51,9 +167,6 @@ class Character:
             None.
         """
         self._calculate_FB(team_alignment)
-        self._calculate_stats()
-        self._calculate_HP()
-        self._calculate_attack_values()
 
     def attack(self, opponent: "Character") -> Tuple[float, str]:
         """
@@ -65,10 +178,14 @@ class Character:
         Returns:
             A tuple containing the attack value and attack type.
         """
-        attack_type: str = random.choice(list(self.attacks.keys()))
-        attack_value: float = self.attacks[attack_type]
-        opponent.HP -= attack_value
-        return attack_value, attack_type
+        if self._attacks is None:
+            self._derive_stats_HP_and_attacks()
+        if opponent._HP is None:
+            opponent._derive_stats_HP_and_attacks()
+        attack_index = self.rng.randrange(3)
+        attack_value: float = self._attacks[attack_index]
+        opponent._HP -= attack_value
+        return attack_value, ATTACK_TYPES[attack_index]
 
     def is_defeated(self) -> bool:
         """
@@ -77,7 +194,7 @@ class Character:
         Returns:
             True if the character's HP is less than 0, False otherwise.
         """
-        return self.HP < 0
+        return self._HP is not None and self._HP < 0
 
     def reset_HP(self) -> None:
         """
@@ -86,12 +203,42 @@ class Character:
         Returns:
             None.
         """
-        self._calculate_HP()
+        self._HP = self.max_HP
+
+    def invalidate_derived_stats(self) -> None:
+        """
+        Discard the derived stats, HP, and attacks, so they are derived again
+        from the current base stats, AS, and FB when next needed.
+
+        Returns:
+            None.
+        """
+        self._stats = None
+        self._HP = None
+        self._max_HP = None
+        self._attacks = None
 
     ###########################################################
     # PRIVATE METHODS
     ###########################################################
 
+    def _derive_stats_HP_and_attacks(self) -> None:
+        """
+        Derive the stats, HP, and attacks of the character, starting at full
+        HP. Nothing is derived until the FB is initialized.
+
+        Returns:
+            None.
+        """
+        if self._FB is None:
+            return
+        (
+            self._stats,
+            self._max_HP,
+            self._attacks,
+        ) = derive_stats_HP_and_attacks(self._base_stats, self._AS, self._FB)
+        self._HP = self._max_HP
+
     def _calculate_FB(self, team_alignment: str) -> None:
         """
         Calculate the Filiation Coefficient (FB) of the character.
@@ -102,76 +249,46 @@ class Character:
             None. The calculated FB is assigned to the `self.FB` attribute of the character.
         """
         if self.alignment == team_alignment:
-            self.FB = 1 + random.randint(0, 9)
+            self._FB = 1 + self.rng.randint(0, 9)
         else:
-            self.FB = 1 / (1 + random.randint(0, 9))
+            self._FB = 1 / (1 + self.rng.randint(0, 9))
+        self.invalidate_derived_stats()
 
-    def _calculate_stats(self) -> None:
-        """
-        Calculate the stats of the character.
 
-        Args:
-            base_stats: The base stats of the character.
+###########################################################
+# DERIVED STATS
+###########################################################
 
-        Returns:
-            None. The calculated stats are assigned to the `self.stats` attribute of the character.
-        """
-        self.stats = {
-            k: ((2 * v + self.AS) / 1.1 * self.FB)
-            for k, v in self.base_stats.items()
-        }
 
-    def _calculate_HP(self) -> None:
-        """
-        Calculate the Health Points (HP) of the character.
+@lru_cache(maxsize=CHARACTER_STATS_CACHE_SIZE)
+def derive_stats_HP_and_attacks(
+    base_stats: Tuple[float, ...],
+    AS: int,
+    FB: float,
+) -> Tuple[Tuple[float, ...], float, Tuple[float, ...]]:
+    """
+    Derive the stats, full HP, and attack values of a character.
 
-        Returns:
-            None. The calculated HP is assigned to the `self.HP` attribute of the character.
-        """
-        strength: float = self.stats["strength"]
-        durability: float = self.stats["durability"]
-        power: float = self.stats["power"]
-        self.HP = (
-            (strength * 0.8 + durability * 0.7 + power) / 2 * (1 + self.AS / 10)
-        ) + 100
+    AS takes 11 values and FB 20, so the results are memoized and shared by
+    every character with the same base stats across teams and battles. Use
+    `derive_stats_HP_and_attacks.cache_info()` to inspect the hit rate.
 
-    def _calculate_attack_values(
-        self,
-    ) -> None:
-        """
-        Calculate the attack values for the character's attacks.
+    Args:
+        base_stats: The base stats, ordered as `STAT_NAMES`.
+        AS: The Actual Stamina of the character.
+        FB: The Filiation Coefficient of the character.
 
-        Returns:
-            None. The calculated attack values are assigned to the `self.attacks` attribute of the character.
-        """
-        attack_types: Dict[str, Dict[str, float]] = {
-            "mental": {
-                "intelligence": 0.7,
-                "speed": 0.2,
-                "combat": 0.1,
-            },
-            "strong": {
-                "strength": 0.6,
-                "power": 0.2,
-                "combat": 0.2,
-            },
-            "fast": {
-                "speed": 0.55,
-                "durability": 0.25,
-                "strength": 0.2,
-            },
-        }
-
-        self.attacks = {}
-        for (
-            attack_type,
-            coefficients,
-        ) in attack_types.items():
-            attack_value = (
-                sum(
-                    self.stats[stat] * coeff
-                    for stat, coeff in coefficients.items()
-                )
-                * self.FB
-            )
-            self.attacks[attack_type] = attack_value
+    Returns:
+        The stats ordered as `STAT_NAMES`, the full HP, and the attack values
+        ordered as `ATTACK_TYPES`.
+    """
+    stats = tuple(((2 * v + AS) / 1.1 * FB) for v in base_stats)
+    strength = stats[1]
+    durability = stats[3]
+    power = stats[4]
+    HP = ((strength * 0.8 + durability * 0.7 + power) / 2 * (1 + AS / 10)) + 100
+    attacks = tuple(
+        sum(stats[stat] * coeff for stat, coeff in coefficients) * FB
+        for coefficients in ATTACK_COEFFICIENTS
+    )
+    return stats, HP, attacks
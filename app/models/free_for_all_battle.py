@@ -0,0 +1,144 @@
+from . import Battle, Team
+from ..config import TEAM_SIZE
+from ..services import Battle_History
+from ..utils import Reporter
+from typing import Dict, List, Sequence, Union
+
+
+class FreeForAllBattle(Battle):
+    """
+    A battle between any number of teams of superheroes.
+
+    Each round two of the teams still standing are drawn at random, and a
+    random member of each one fights a duel with the rules of Battle, the
+    first drawn team attacking first. A team is eliminated once it has no
+    members left, and the last team standing wins. Standing teams are kept in
+    an indexed list, so drawing and eliminating them is constant-time however
+    many teams take part. The battle log and the email summary describe two
+    teams, so a free-for-all battle is never logged.
+    """
+
+    ###########################################################
+    # CLASS CONSTRUCTOR
+    ###########################################################
+
+    def __init__(
+        self,
+        teams: Union[Sequence[Team], None] = None,
+        team_count: int = 3,
+        reporter: Union[Reporter, None] = None,
+        seed: Union[int, None] = None,
+        team_size: int = TEAM_SIZE,
+        history: Union[Battle_History, None] = None,
+    ):
+        """
+        Initialize a FreeForAllBattle instance.
+
+        Args:
+            teams: The already populated teams. New ones are created if not
+                provided.
+            team_count: The number of teams created if none are provided.
+            reporter: The sink of the battle events. Defaults to the console.
+            seed: The seed of the battle RNG. A random one is chosen if not provided.
+            team_size: The number of characters of the teams created by the battle.
+            history: The battle history the battle is appended to, if any.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If fewer than two teams take part in the battle, or if
+                the teams need more characters than are available.
+        """
+        if teams is None:
+            super().__init__(
+                reporter=reporter,
+                log=False,
+                seed=seed,
+                team_size=team_size,
+                history=history,
+            )
+            self.teams.extend(
+                Team(f"Team {team_number}", self.rng, self.roster, team_size)
+                for team_number in range(3, team_count + 1)
+            )
+            self._check_available_characters()
+        else:
+            super().__init__(
+                *teams[:2],
+                reporter=reporter,
+                log=False,
+                seed=seed,
+                history=history,
+            )
+            self.teams = list(teams)
+        if len(self.teams) < 2:
+            raise ValueError(
+                "Una batalla necesita al menos dos equipos para comenzar."
+            )
+        self.standing_teams: List[Team] = []
+        # Position of each team in `standing_teams`, for constant-time removal
+        self._standing_positions: Dict[Team, int] = {}
+
+    ###########################################################
+    # PUBLIC METHODS
+    ###########################################################
+
+    def simulate(self) -> Team:
+        """
+        Simulate the battle between already populated teams.
+
+        Returns:
+            Team: The winning team.
+        """
+        self.standing_teams = [
+            team for team in self.teams if team.team_has_members()
+        ]
+        self._standing_positions = {
+            team: position for position, team in enumerate(self.standing_teams)
+        }
+
+        round_number = 1
+        while len(self.standing_teams) > 1:
+            self._simulate_round(round_number)
+            round_number += 1
+
+        return self.standing_teams[0]
+
+    ###########################################################
+    # PRIVATE METHODS
+    ###########################################################
+
+    def _simulate_round(self, round_number: int) -> None:
+        """
+        Simulate a round of attacks between two random standing teams.
+
+        Args:
+            round_number: The number of the current round.
+
+        Returns:
+            None.
+        """
+        attacking_team, defending_team = self.rng.sample(self.standing_teams, 2)
+        losing_team = self._simulate_duel(
+            round_number, attacking_team, defending_team
+        )
+        if not losing_team.team_has_members():
+            self._eliminate_team(losing_team)
+
+    def _eliminate_team(self, team: Team) -> None:
+        """
+        Remove a team without members from the standing teams.
+
+        Args:
+            team: The eliminated team.
+
+        Returns:
+            None.
+        """
+        position = self._standing_positions.pop(team)
+        last_team = self.standing_teams.pop()
+        if last_team is not team:
+            self.standing_teams[position] = last_team
+            self._standing_positions[last_team] = position
+        self._report("message", f"El equipo {team.name} ha sido eliminado.")
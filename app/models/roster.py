@@ -0,0 +1,126 @@
+import random
+from typing import List, Sequence, Set, Union
+
+from ..services import Character_Service
+
+
+class Roster:
+    """
+    The registry of the characters taken by the teams of a battle or a
+    tournament.
+
+    Taken IDs are kept in a set, so checking a candidate is constant-time, and
+    the registry is dropped together with the battle or tournament that owns
+    it, so memory stays flat however many battles are played.
+    """
+
+    ###########################################################
+    # CLASS CONSTRUCTOR
+    ###########################################################
+
+    def __init__(self, available_ids: Union[Sequence[int], None] = None):
+        """
+        Initialize a Roster instance.
+
+        Args:
+            available_ids: The IDs of the characters that can be drawn.
+                Defaults to the characters available in Character_Service.
+        """
+        self._available_ids = available_ids
+        self.taken: Set[int] = set()
+
+    def __contains__(self, character_id: int) -> bool:
+        return character_id in self.taken
+
+    def __len__(self) -> int:
+        return len(self.taken)
+
+    ###########################################################
+    # PROPERTIES
+    ###########################################################
+
+    @property
+    def available_ids(self) -> Sequence[int]:
+        if self._available_ids is not None:
+            return self._available_ids
+        return Character_Service.available_character_ids()
+
+    ###########################################################
+    # PUBLIC METHODS
+    ###########################################################
+
+    def draw(self, rng: random.Random) -> int:
+        """
+        Draw a random character ID among the available characters. The ID
+        may be already taken.
+
+        Args:
+            rng: The random number generator to draw the ID with.
+
+        Returns:
+            int: A random character ID.
+        """
+        return rng.choice(self.available_ids)
+
+    def sample(self, count: int, rng: random.Random) -> List[int]:
+        """
+        Draw distinct character IDs that are not taken yet, and take them.
+
+        Args:
+            count: The number of IDs to draw.
+            rng: The random number generator to draw the IDs with.
+
+        Returns:
+            List[int]: The drawn IDs.
+
+        Raises:
+            ValueError: If there are not enough characters left.
+        """
+        available_ids = self.available_ids
+        candidates = rng.sample(
+            available_ids, min(len(available_ids), count + len(self.taken))
+        )
+        character_ids = [
+            character_id
+            for character_id in candidates
+            if character_id not in self.taken
+        ][:count]
+        if len(character_ids) < count:
+            raise ValueError(
+                f"No quedan {count} personajes disponibles para sortear."
+            )
+        self.taken.update(character_ids)
+        return character_ids
+
+    def take(self, character_id: int) -> None:
+        """
+        Mark a character as taken.
+
+        Args:
+            character_id: The ID of the character.
+
+        Returns:
+            None.
+        """
+        self.taken.add(character_id)
+
+    def release(self, character_id: int) -> None:
+        """
+        Make a character available again.
+
+        Args:
+            character_id: The ID of the character.
+
+        Returns:
+            None.
+        """
+        self.taken.discard(character_id)
+
+    def clear(self) -> None:
+        """
+        Make every character available again.
+
+        Returns:
+            None.
+        """
+        self.taken.clear()
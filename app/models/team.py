@@ -1,15 +1,14 @@
 import random
-import time
-import requests
-from typing import Dict
+from typing import Dict, List, Tuple, Union
 
-from . import Character
+from . import Character, Roster
+from ..config import TEAM_SIZE
 from ..utils import (
     CharacterDataFetchError,
     TeamPopulationError,
-    print_character_info,
+    Reporter,
+    ConsoleReporter,
 )
-from ..config import SUPERHERO_API_URL
 from ..services import Character_Service
 
 
@@ -18,23 +17,36 @@ class Team:
     Class representing a team of characters in a superhero battle simulation.
     """
 
-    teams = []  # Class attribute
-
     ###########################################################
     # CLASS CONSTRUCTOR
     ###########################################################
 
-    def __init__(self, name: str):
+    def __init__(
+        self,
+        name: str,
+        rng: Union[random.Random, None] = None,
+        roster: Union[Roster, None] = None,
+        size: int = TEAM_SIZE,
+    ):
         """
         Initialize a Team instance.
 
         Args:
             name: The name of the team.
+            rng: The random number generator of the battle, shared with the
+                team members. A new one is created if not provided.
+            roster: The registry of the characters taken in the battle,
+                shared with the other teams to avoid repeating characters.
+            size: The number of characters the team is populated with.
         """
         self.name = name
-        self.members = []
+        self.rng = rng if rng is not None else random.Random()
+        self.size = size
+        self.members: List[Character] = []
         self.team_alignment = None
-        self.teams.append(self)
+        self.roster = roster
+        # Position of each member in `members`, for constant-time removal
+        self._positions: Dict[Character, int] = {}
 
     ###########################################################
     # PUBLIC METHODS
@@ -50,41 +62,123 @@ class Team:
         Raises:
             TeamPopulationError: If the team cannot be populated with characters.
         """
-        character_id = None
+        Team.populate_teams(self)
+
+    @classmethod
+    def populate_teams(
+        cls, *teams: "Team", reporter: Union[Reporter, None] = None
+    ) -> None:
+        """
+        Populate several teams with characters, fetching all their rosters in
+        parallel. Character IDs are drawn with the RNG of the first team, and
+        are not repeated within the roster of the first team, if any, or
+        within the given teams otherwise.
+
+        Args:
+            teams: The teams to populate.
+            reporter: The sink of the progress messages. Defaults to the console.
+
+        Returns:
+            None.
+
+        Raises:
+            TeamPopulationError: If the teams cannot be populated with characters.
+        """
+        if reporter is None:
+            reporter = ConsoleReporter()
+        roster, roster_ids = cls._draw_character_ids(teams)
+        try:
+            characters_data = Character_Service.get_many_character_data(
+                [
+                    character_id
+                    for team_ids in roster_ids
+                    for character_id in team_ids
+                ]
+            )
+        except CharacterDataFetchError as e:
+            cls._release_character_ids(roster, roster_ids)
+            raise TeamPopulationError(f"{str(e)}")
+        cls._add_fetched_characters(
+            teams, roster_ids, characters_data, reporter
+        )
+
+    @classmethod
+    async def populate_teams_async(
+        cls, *teams: "Team", reporter: Union[Reporter, None] = None
+    ) -> None:
+        """
+        Populate several teams with characters like `populate_teams`, without
+        blocking the event loop while their rosters are fetched.
+
+        Args:
+            teams: The teams to populate.
+            reporter: The sink of the progress messages. Defaults to the console.
 
-        while len(self.members) < 5:
-            if character_id is None:
-                character_id = Team._generate_random_character_id()
+        Returns:
+            None.
 
-            while Team._is_character_in_any_team(character_id):
-                print(
-                    f"El personaje con ID {character_id} ya está en un equipo."
+        Raises:
+            TeamPopulationError: If the teams cannot be populated with characters.
+        """
+        if reporter is None:
+            reporter = ConsoleReporter()
+        roster, roster_ids = cls._draw_character_ids(teams)
+        try:
+            characters_data = (
+                await Character_Service.get_many_character_data_async(
+                    [
+                        character_id
+                        for team_ids in roster_ids
+                        for character_id in team_ids
+                    ]
                 )
-                character_id = self._generate_random_character_id()
+            )
+        except CharacterDataFetchError as e:
+            cls._release_character_ids(roster, roster_ids)
+            raise TeamPopulationError(f"{str(e)}")
+        cls._add_fetched_characters(
+            teams, roster_ids, characters_data, reporter
+        )
 
-            try:
-                (
-                    name,
-                    alignment,
-                    base_stats,
-                ) = Character_Service.get_character_data(character_id)
-                character = Character(character_id, name, alignment, base_stats)
-                if character:
-                    self._add_character_to_team(character)
-                    character_id = None  # Reset character_id since the character was successfully added
-                else:
-                    print(
-                        "No se pudo agregar un personaje con ID"
-                        f" {character_id} al equipo {self.name}."
-                    )
+    @classmethod
+    def from_characters_data(
+        cls,
+        name: str,
+        characters_data: List[Tuple[int, str, str, Dict[str, float]]],
+        rng: Union[random.Random, None] = None,
+    ) -> "Team":
+        """
+        Create a team from already fetched character data.
 
-            except CharacterDataFetchError as e:
-                raise TeamPopulationError(f"{str(e)}")
+        Args:
+            name: The name of the team.
+            characters_data: The ID, name, alignment, and base stats of each member.
+            rng: The random number generator of the battle.
 
-        self._set_team_alignment()
-        self._calculate_FB_stats_HP_and_attcks_for_team_members(
-            self.team_alignment
+        Returns:
+            Team: The populated team.
+        """
+        team = cls(name, rng, size=len(characters_data))
+        for (
+            character_id,
+            character_name,
+            alignment,
+            base_stats,
+        ) in characters_data:
+            team._add_character_to_team(
+                Character(
+                    character_id,
+                    character_name,
+                    alignment,
+                    base_stats,
+                    team.rng,
+                )
+            )
+        team._set_team_alignment()
+        team._calculate_FB_stats_HP_and_attcks_for_team_members(
+            team.team_alignment
         )
+        return team
 
     def team_has_members(self) -> bool:
         """
@@ -104,11 +198,12 @@ class Team:
         Returns:
             Character: A random character from the team.
         """
-        return random.choice(self.members)
+        return self.rng.choice(self.members)
 
     def remove_member(self, member: Character) -> None:
         """
-        Remove a member from the team.
+        Remove a member from the team in constant time, moving the last
+        member into its position.
 
         Args:
             member: The character to remove from the team.
@@ -116,33 +211,121 @@ class Team:
         Returns:
             None.
         """
-        if member in self.members:
-            self.members.remove(member)
-        else:
+        position = self._positions.pop(member, None)
+        if position is None:
             print(
                 f"El personaje {member.name} no pertenece al equipo {self.name}"
             )
+            return
+        last_member = self.members.pop()
+        if last_member is not member:
+            self.members[position] = last_member
+            self._positions[last_member] = position
 
     ###########################################################
     # PRIVATE METHODS
     ###########################################################
 
-    @classmethod
-    def _is_character_in_any_team(cls, character_id: int) -> bool:
+    @staticmethod
+    def _draw_character_ids(
+        teams: Tuple["Team", ...]
+    ) -> Tuple[Roster, List[List[int]]]:
         """
-        Check if a character with the given ID exists in any team.
+        Draw the IDs of the characters missing in each team without
+        replacement, and take them in the roster of the first team, or in a
+        new roster shared by the teams.
 
         Args:
-            character_id: The ID of the character.
+            teams: The teams to populate.
 
         Returns:
-            bool: True if the character is in any team, False otherwise.
+            The roster the IDs were taken in, and the drawn IDs of each team.
+
+        Raises:
+            TeamPopulationError: If there are not enough characters left.
         """
-        for team in cls.teams:
+        rng = teams[0].rng
+        roster = teams[0].roster if teams[0].roster is not None else Roster()
+        for team in teams:
             for member in team.members:
-                if member.id == character_id:
-                    return True
-        return False
+                roster.take(member.id)
+
+        roster_ids = []
+        try:
+            for team in teams:
+                roster_ids.append(
+                    roster.sample(max(team.size - len(team.members), 0), rng)
+                )
+        except ValueError as e:
+            Team._release_character_ids(roster, roster_ids)
+            raise TeamPopulationError(f"{str(e)}")
+        return roster, roster_ids
+
+    @staticmethod
+    def _release_character_ids(
+        roster: Roster, roster_ids: List[List[int]]
+    ) -> None:
+        """
+        Make the drawn IDs available again after a failed fetch.
+
+        Args:
+            roster: The roster the IDs were taken in.
+            roster_ids: The drawn IDs of each team.
+
+        Returns:
+            None.
+        """
+        for team_ids in roster_ids:
+            for character_id in team_ids:
+                roster.release(character_id)
+
+    @staticmethod
+    def _add_fetched_characters(
+        teams: Tuple["Team", ...],
+        roster_ids: List[List[int]],
+        characters_data: List[Tuple[str, str, Dict[str, float]]],
+        reporter: Reporter,
+    ) -> None:
+        """
+        Add the fetched characters to their teams, and initialize their
+        stats once the alignment of each team is known.
+
+        Args:
+            teams: The teams to populate.
+            roster_ids: The drawn IDs of each team.
+            characters_data: The name, alignment and base stats of each
+                drawn character, in the order of the IDs.
+            reporter: The sink of the progress messages.
+
+        Returns:
+            None.
+        """
+        report_messages = reporter.is_interested("message")
+        characters_data = iter(characters_data)
+        for team, team_ids in zip(teams, roster_ids):
+            for character_id in team_ids:
+                (
+                    name,
+                    alignment,
+                    base_stats,
+                ) = next(characters_data)
+                character = Character(
+                    character_id, name, alignment, base_stats, team.rng
+                )
+                team._add_character_to_team(character)
+                if report_messages:
+                    reporter.report(
+                        "message",
+                        (
+                            f"Se ha agregado el personaje {character.name} con"
+                            f" ID {character.id} al equipo {team.name}",
+                        ),
+                    )
+
+            team._set_team_alignment()
+            team._calculate_FB_stats_HP_and_attcks_for_team_members(
+                team.team_alignment
+            )
 
     def _add_character_to_team(self, character: Character) -> None:
         """
@@ -154,11 +337,8 @@ class Team:
         Returns:
             None.
         """
+        self._positions[character] = len(self.members)
         self.members.append(character)
-        print(
-            f"Se ha agregado el personaje {character.name} con ID"
-            f" {character.id} al equipo {self.name}"
-        )
 
     def _set_team_alignment(
         self,
@@ -196,18 +376,3 @@ class Team:
         """
         for member in self.members:
             member.init_FB_stats_HP_and_attacks(self.team_alignment)
-
-    ###########################################################
-    # AUXILIAR METHODS
-    ###########################################################
-
-    @staticmethod
-    def _generate_random_character_id() -> int:
-        """
-        Generate a random character ID.
-
-        Returns:
-            int: A random character ID.
-
-        """
-        return random.randint(1, 731)
@@ -0,0 +1,24 @@
+import argparse
+from .utils import ConsoleReporter, EventReplay, print_header
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path", type=str, help="Battle recording file path")
+    parser.add_argument(
+        "-round", type=int, default=1, help="Round to start the replay at"
+    )
+    parser.add_argument(
+        "-speed",
+        type=float,
+        help="Rounds per second, as fast as possible if omitted",
+    )
+    args = parser.parse_args()
+
+    # Replay a battle recorded with --record, without simulating it again
+    with EventReplay(args.path) as replay:
+        print_header("REPETICION DE LA BATALLA")
+        print(f"Rondas grabadas: {replay.rounds}")
+        try:
+            replay.replay(ConsoleReporter(), args.round, args.speed)
+        except ValueError as e:
+            print(str(e))
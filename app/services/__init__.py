@@ -1,2 +1,7 @@
+from .http_client import Http_Client
+from .character_cache import Character_Cache
+from .roster_snapshot import Roster_Snapshot
 from .character_service import Character_Service
+from .email_queue import Email_Queue
 from .email_service import Email_Service
+from .battle_history import Battle_History, BattleRecord, WinRate
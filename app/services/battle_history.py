@@ -0,0 +1,438 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Union
+
+from ..config import BATTLE_HISTORY_PATH
+
+INDEX_FILE_NAME = "index.db"
+
+
+class BattleRecord(NamedTuple):
+    """
+    The summary of a battle kept in the battle history.
+    """
+
+    seed: int
+    winner: str
+    rounds: int
+    teams: Dict[str, List[int]]  # team name -> character IDs
+    recorded_at: float
+
+
+class WinRate(NamedTuple):
+    """
+    The wins of a character or a team among the battles it took part in.
+    """
+
+    wins: int
+    battles: int
+
+    @property
+    def rate(self) -> float:
+        return self.wins / self.battles if self.battles else 0.0
+
+
+class Battle_History:
+    """
+    An append-only history of battles, kept across runs.
+
+    Battles are appended as JSON lines to one file per day, and indexed in an
+    SQLite database by character ID, team and winner, so statistics over
+    many battles are answered from the index without reading the files. The
+    index remembers how much of each file it has read, so records appended by
+    other processes are indexed incrementally with `reindex`.
+    """
+
+    ###########################################################
+    # CLASS CONSTRUCTOR
+    ###########################################################
+
+    def __init__(self, path: str = BATTLE_HISTORY_PATH) -> None:
+        """
+        Initialize a Battle_History instance.
+
+        Args:
+            path: The directory of the daily files and of the index.
+        """
+        self.path = path
+        self._connection = None
+        self._lock = threading.Lock()
+
+    ###########################################################
+    # PUBLIC METHODS
+    ###########################################################
+
+    def record(self, battle_records: Iterable[BattleRecord]) -> int:
+        """
+        Append battles to the history and index them, in a single transaction.
+
+        Args:
+            battle_records: The battles to append.
+
+        Returns:
+            int: The number of battles appended.
+        """
+        lines_by_partition: Dict[str, List[str]] = {}
+        for battle_record in battle_records:
+            lines_by_partition.setdefault(
+                self._partition_name(battle_record.recorded_at), []
+            ).append(
+                json.dumps(battle_record._asdict(), ensure_ascii=False) + "\n"
+            )
+
+        with self._lock:
+            connection = self._get_connection()
+            self._begin_indexing(connection)
+            for partition, lines in lines_by_partition.items():
+                # A single write keeps the lines of concurrent writers whole
+                with open(
+                    os.path.join(self.path, partition), "a", encoding="utf-8"
+                ) as file:
+                    file.write("".join(lines))
+                self._index_partition(connection, partition)
+            connection.commit()
+        return sum(len(lines) for lines in lines_by_partition.values())
+
+    def reindex(self) -> int:
+        """
+        Index the battles appended to the daily files since they were last
+        indexed.
+
+        Returns:
+            int: The number of battles indexed.
+        """
+        with self._lock:
+            connection = self._get_connection()
+            self._begin_indexing(connection)
+            indexed = sum(
+                self._index_partition(connection, partition)
+                for partition in self.partitions()
+            )
+            connection.commit()
+        return indexed
+
+    def partitions(self) -> List[str]:
+        """
+        Get the names of the daily files of the history, oldest first.
+
+        Returns:
+            List[str]: The file names.
+        """
+        if not os.path.isdir(self.path):
+            return []
+        return sorted(
+            name
+            for name in os.listdir(self.path)
+            if name.startswith("battles-") and name.endswith(".jsonl")
+        )
+
+    def count(self) -> int:
+        """
+        Get the number of indexed battles.
+
+        Returns:
+            int: The number of battles.
+        """
+        with self._lock:
+            return (
+                self._get_connection()
+                .execute("SELECT COUNT(*) FROM battles")
+                .fetchone()[0]
+            )
+
+    def character_win_rate(
+        self, character_id: int, last: Union[int, None] = None
+    ) -> WinRate:
+        """
+        Get the wins of a character among the battles it took part in.
+
+        Args:
+            character_id: The ID of the character.
+            last: The number of most recent battles of the history to count.
+                Every battle is counted if not provided.
+
+        Returns:
+            WinRate: The wins and the battles of the character.
+        """
+        with self._lock:
+            battles, wins = (
+                self._get_connection()
+                .execute(
+                    "SELECT COUNT(*), COALESCE(SUM(won), 0) FROM participants"
+                    " WHERE character_id = ? AND battle_id > ?",
+                    (character_id, self._first_battle_id(last)),
+                )
+                .fetchone()
+            )
+        return WinRate(wins, battles)
+
+    def team_win_rate(
+        self, team: str, last: Union[int, None] = None
+    ) -> WinRate:
+        """
+        Get the wins of a team among the battles it took part in.
+
+        Args:
+            team: The name of the team.
+            last: The number of most recent battles of the history to count.
+                Every battle is counted if not provided.
+
+        Returns:
+            WinRate: The wins and the battles of the team.
+        """
+        with self._lock:
+            battles, wins = (
+                self._get_connection()
+                .execute(
+                    "SELECT COUNT(DISTINCT battle_id),"
+                    " COUNT(DISTINCT CASE WHEN won THEN battle_id END)"
+                    " FROM participants WHERE team = ? AND battle_id > ?",
+                    (team, self._first_battle_id(last)),
+                )
+                .fetchone()
+            )
+        return WinRate(wins, battles)
+
+    def wins_by_team(self, last: Union[int, None] = None) -> Dict[str, int]:
+        """
+        Get the number of battles won by each team.
+
+        Args:
+            last: The number of most recent battles of the history to count.
+                Every battle is counted if not provided.
+
+        Returns:
+            Dict[str, int]: The wins of each team, most wins first.
+        """
+        with self._lock:
+            rows = (
+                self._get_connection()
+                .execute(
+                    "SELECT winner, COUNT(*) FROM battles WHERE id > ?"
+                    " GROUP BY winner ORDER BY COUNT(*) DESC",
+                    (self._first_battle_id(last),),
+                )
+                .fetchall()
+            )
+        return dict(rows)
+
+    def find_battles(
+        self,
+        character_id: Union[int, None] = None,
+        winner: Union[str, None] = None,
+        limit: int = 100,
+    ) -> Iterator[BattleRecord]:
+        """
+        Find the most recent battles of a character, or won by a team, and
+        read them from the daily files.
+
+        Args:
+            character_id: The ID of a character that took part in the battles.
+            winner: The name of the team that won the battles.
+            limit: The maximum number of battles.
+
+        Returns:
+            Iterator[BattleRecord]: The battles, most recent first.
+        """
+        query = "SELECT partition, offset FROM battles"
+        conditions = []
+        parameters = []
+        if character_id is not None:
+            conditions.append(
+                "id IN (SELECT battle_id FROM participants"
+                " WHERE character_id = ?)"
+            )
+            parameters.append(character_id)
+        if winner is not None:
+            conditions.append("winner = ?")
+            parameters.append(winner)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY id DESC LIMIT ?"
+        parameters.append(limit)
+
+        with self._lock:
+            rows = self._get_connection().execute(query, parameters).fetchall()
+        for partition, offset in rows:
+            with open(os.path.join(self.path, partition), "rb") as file:
+                file.seek(offset)
+                yield self._parse_record(file.readline())
+
+    ###########################################################
+    # PRIVATE METHODS
+    ###########################################################
+
+    def _first_battle_id(self, last: Union[int, None]) -> int:
+        """
+        Get the ID before the first of the most recent battles. Battles are
+        numbered in the order they are indexed.
+
+        Args:
+            last: The number of most recent battles, or None for every battle.
+
+        Returns:
+            int: The ID the battles counted come after.
+        """
+        if last is None:
+            return 0
+        (last_id,) = (
+            self._get_connection()
+            .execute("SELECT COALESCE(MAX(id), 0) FROM battles")
+            .fetchone()
+        )
+        return last_id - last
+
+    @staticmethod
+    def _begin_indexing(connection: sqlite3.Connection) -> None:
+        """
+        Start the transaction of an indexing, taking the write lock of the
+        index before the indexed offsets are read. Indexings of other
+        processes wait for the commit, and then start from the new offsets,
+        so no line is indexed twice.
+
+        Args:
+            connection: The connection to the index.
+
+        Returns:
+            None.
+        """
+        connection.execute("BEGIN IMMEDIATE")
+
+    def _index_partition(
+        self, connection: sqlite3.Connection, partition: str
+    ) -> int:
+        """
+        Index the complete lines appended to a daily file since it was last
+        indexed. The caller starts the transaction with `_begin_indexing` and
+        commits it.
+
+        Args:
+            connection: The connection to the index.
+            partition: The name of the daily file.
+
+        Returns:
+            int: The number of battles indexed.
+        """
+        row = connection.execute(
+            "SELECT indexed_bytes FROM partitions WHERE name = ?",
+            (partition,),
+        ).fetchone()
+        offset = row[0] if row is not None else 0
+
+        indexed = 0
+        with open(os.path.join(self.path, partition), "rb") as file:
+            file.seek(offset)
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break  # A line still being written
+                battle_record = self._parse_record(line)
+                battle_id = connection.execute(
+                    "INSERT INTO battles"
+                    " (recorded_at, partition, offset, seed, winner, rounds)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        battle_record.recorded_at,
+                        partition,
+                        offset,
+                        battle_record.seed,
+                        battle_record.winner,
+                        battle_record.rounds,
+                    ),
+                ).lastrowid
+                connection.executemany(
+                    "INSERT INTO participants"
+                    " (battle_id, character_id, team, won)"
+                    " VALUES (?, ?, ?, ?)",
+                    [
+                        (
+                            battle_id,
+                            character_id,
+                            team,
+                            team == battle_record.winner,
+                        )
+                        for team, character_ids in battle_record.teams.items()
+                        for character_id in character_ids
+                    ],
+                )
+                offset += len(line)
+                indexed += 1
+
+        connection.execute(
+            "INSERT OR REPLACE INTO partitions (name, indexed_bytes)"
+            " VALUES (?, ?)",
+            (partition, offset),
+        )
+        return indexed
+
+    ###########################################################
+    # AUXILIARY METHODS
+    ###########################################################
+
+    @staticmethod
+    def _partition_name(recorded_at: float) -> str:
+        """
+        Get the name of the daily file of a battle.
+
+        Args:
+            recorded_at: The UNIX time the battle was recorded at.
+
+        Returns:
+            str: The file name, with the UTC date of the battle.
+        """
+        return time.strftime("battles-%Y-%m-%d.jsonl", time.gmtime(recorded_at))
+
+    @staticmethod
+    def _parse_record(line: bytes) -> BattleRecord:
+        """
+        Parse a line of a daily file.
+
+        Args:
+            line: The JSON line of the battle.
+
+        Returns:
+            BattleRecord: The battle.
+        """
+        return BattleRecord(**json.loads(line))
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Get the connection to the index, creating it on first use.
+
+        Returns:
+            sqlite3.Connection: The connection to the index.
+        """
+        if self._connection is None:
+            os.makedirs(self.path, exist_ok=True)
+            self._connection = sqlite3.connect(
+                os.path.join(self.path, INDEX_FILE_NAME),
+                check_same_thread=False,
+            )
+            self._connection.executescript(
+                "CREATE TABLE IF NOT EXISTS battles ("
+                " id INTEGER PRIMARY KEY,"
+                " recorded_at REAL NOT NULL,"
+                " partition TEXT NOT NULL,"
+                " offset INTEGER NOT NULL,"
+                " seed INTEGER NOT NULL,"
+                " winner TEXT NOT NULL,"
+                " rounds INTEGER NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS participants ("
+                " battle_id INTEGER NOT NULL,"
+                " character_id INTEGER NOT NULL,"
+                " team TEXT NOT NULL,"
+                " won INTEGER NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS partitions ("
+                " name TEXT PRIMARY KEY,"
+                " indexed_bytes INTEGER NOT NULL);"
+                "CREATE INDEX IF NOT EXISTS battles_by_winner"
+                " ON battles (winner, id);"
+                "CREATE INDEX IF NOT EXISTS participants_by_character"
+                " ON participants (character_id, battle_id);"
+                "CREATE INDEX IF NOT EXISTS participants_by_team"
+                " ON participants (team, battle_id);"
+            )
+            self._connection.commit()
+        return self._connection
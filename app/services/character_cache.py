@@ -0,0 +1,241 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Tuple, Union
+from urllib.parse import urlsplit
+
+from ..config import (
+    SUPERHERO_API_URL,
+    CHARACTER_CACHE_PATH,
+    CHARACTER_CACHE_TTL,
+    CHARACTER_CACHE_MAX_ENTRIES,
+)
+
+# Pending access times written to the database at once
+ACCESS_FLUSH_SIZE = 100
+# Version of the database layout, kept in SQLite's user_version
+SCHEMA_VERSION = 1
+
+
+class Character_Cache:
+    """
+    A persistent SQLite cache for character data fetched from the Superhero API.
+
+    Hits only read the database: their access times are kept in memory and
+    written in batches, before evicting entries or every ACCESS_FLUSH_SIZE
+    hits, so reads never wait for a disk commit.
+
+    Entries are kept apart by the host of the API they were fetched from, so
+    a local stand-in such as the fake Superhero API server never serves its
+    characters to, or takes them from, runs against the real API.
+    """
+
+    ###########################################################
+    # CLASS CONSTRUCTOR
+    ###########################################################
+
+    def __init__(
+        self,
+        path: str = CHARACTER_CACHE_PATH,
+        ttl: float = CHARACTER_CACHE_TTL,
+        max_entries: int = CHARACTER_CACHE_MAX_ENTRIES,
+        api_url: str = SUPERHERO_API_URL,
+    ) -> None:
+        """
+        Initialize a Character_Cache instance.
+
+        Args:
+            path: The path of the SQLite database file.
+            ttl: The time to live of each entry, in seconds.
+            max_entries: The maximum number of entries kept for the API.
+            api_url: The URL of the API the characters are fetched from.
+        """
+        self.path = path
+        # The host only, leaving the API key in the URL path out of the file
+        self.source = urlsplit(api_url).netloc
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._lock = threading.Lock()
+        # Access times of the hits not written to the database yet
+        self._pending_accesses: Dict[int, float] = {}
+
+    ###########################################################
+    # PUBLIC METHODS
+    ###########################################################
+
+    def get(
+        self, character_id: int
+    ) -> Union[Tuple[str, str, Dict[str, int]], None]:
+        """
+        Get the cached data of a character.
+
+        Args:
+            character_id: The ID of the character.
+
+        Returns:
+            A tuple containing the name, alignment, and base stats of the
+            character, or None if it is not cached or its entry expired.
+        """
+        now = time.time()
+        with self._lock:
+            connection = self._get_connection()
+            row = connection.execute(
+                "SELECT name, alignment, base_stats, fetched_at"
+                " FROM characters WHERE source = ? AND id = ?",
+                (self.source, character_id),
+            ).fetchone()
+
+            if row is None or now - row[3] > self.ttl:
+                if row is not None:
+                    self._pending_accesses.pop(character_id, None)
+                    connection.execute(
+                        "DELETE FROM characters WHERE source = ? AND id = ?",
+                        (self.source, character_id),
+                    )
+                    connection.commit()
+                self.misses += 1
+                return None
+
+            self._pending_accesses[character_id] = now
+            if len(self._pending_accesses) >= ACCESS_FLUSH_SIZE:
+                self._write_pending_accesses(connection)
+                connection.commit()
+            self.hits += 1
+
+        name, alignment, base_stats, _ = row
+        return name, alignment, json.loads(base_stats)
+
+    def put(
+        self,
+        character_id: int,
+        name: str,
+        alignment: str,
+        base_stats: Dict[str, int],
+    ) -> None:
+        """
+        Store the data of a character, evicting the least recently used
+        entries if the cache is full.
+
+        Args:
+            character_id: The ID of the character.
+            name: The name of the character.
+            alignment: The alignment of the character.
+            base_stats: The base stats of the character.
+
+        Returns:
+            None.
+        """
+        now = time.time()
+        with self._lock:
+            connection = self._get_connection()
+            # Evict by the latest access times, including the pending ones
+            self._write_pending_accesses(connection)
+            connection.execute(
+                "INSERT OR REPLACE INTO characters"
+                " (source, id, name, alignment, base_stats, fetched_at,"
+                " last_access) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.source,
+                    character_id,
+                    name,
+                    alignment,
+                    json.dumps(base_stats),
+                    now,
+                    now,
+                ),
+            )
+            connection.execute(
+                "DELETE FROM characters WHERE source = ? AND id IN"
+                " (SELECT id FROM characters WHERE source = ?"
+                " ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.source, self.source, self.max_entries),
+            )
+            connection.commit()
+
+    def clear(self) -> None:
+        """
+        Remove every entry of the API from the cache and reset its counters.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            connection = self._get_connection()
+            self._pending_accesses.clear()
+            connection.execute(
+                "DELETE FROM characters WHERE source = ?", (self.source,)
+            )
+            connection.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the hit and miss counters of the cache.
+
+        Returns:
+            Dict[str, int]: The number of hits and misses since the cache was created.
+        """
+        return {"hits": self.hits, "misses": self.misses}
+
+    ###########################################################
+    # AUXILIARY METHODS
+    ###########################################################
+
+    def _write_pending_accesses(self, connection: sqlite3.Connection) -> None:
+        """
+        Write the pending access times to the database. The caller holds the
+        lock and commits the transaction.
+
+        Args:
+            connection: The connection to the cache database.
+
+        Returns:
+            None.
+        """
+        if self._pending_accesses:
+            connection.executemany(
+                "UPDATE characters SET last_access = ?"
+                " WHERE source = ? AND id = ?",
+                [
+                    (last_access, self.source, character_id)
+                    for character_id, last_access in self._pending_accesses.items()
+                ],
+            )
+            self._pending_accesses.clear()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Get the connection to the cache database, creating it on first use.
+
+        Returns:
+            sqlite3.Connection: The connection to the cache database.
+        """
+        if self._connection is None:
+            self._connection = sqlite3.connect(
+                self.path, check_same_thread=False
+            )
+            (version,) = self._connection.execute(
+                "PRAGMA user_version"
+            ).fetchone()
+            if version < SCHEMA_VERSION:
+                # Older caches did not record the API of their entries
+                self._connection.execute("DROP TABLE IF EXISTS characters")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS characters ("
+                " source TEXT NOT NULL,"
+                " id INTEGER NOT NULL,"
+                " name TEXT NOT NULL,"
+                " alignment TEXT NOT NULL,"
+                " base_stats TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL,"
+                " last_access REAL NOT NULL,"
+                " PRIMARY KEY (source, id))"
+            )
+            self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._connection.commit()
+        return self._connection
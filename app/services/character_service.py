@@ -1,14 +1,21 @@
-import random
-import time
-from typing import Dict, Union, Tuple
-import requests
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Sequence, Tuple
 from requests.exceptions import (
     RequestException,
 )
 from ..utils import (
     CharacterDataFetchError,
 )
-from ..config import SUPERHERO_API_URL
+from .character_cache import Character_Cache
+from .roster_snapshot import Roster_Snapshot
+from .http_client import Http_Client
+from ..config import (
+    SUPERHERO_API_URL,
+    SUPERHERO_API_MAX_CONCURRENT_REQUESTS,
+    SUPERHERO_API_LAST_CHARACTER_ID,
+    HTTP_POOL_SIZE,
+)
 
 
 class Character_Service:
@@ -16,6 +23,10 @@ class Character_Service:
     A class for fetching character data from the Superhero API.
     """
 
+    cache = Character_Cache()  # Class attribute
+    snapshot = None  # Class attribute
+    executor = None  # Class attribute, created on first async fetch
+
     ###########################################################
     # PUBLIC METHODS
     ###########################################################
@@ -25,7 +36,8 @@ class Character_Service:
         cls, character_id
     ) -> Tuple[str, str, Dict[str, float]]:
         """
-        Fetch character data from the Superhero API.
+        Fetch character data, from the loaded roster snapshot or the local
+        cache if available, or from the Superhero API otherwise.
 
         Args:
             character_id: The ID of the character
@@ -34,48 +46,180 @@ class Character_Service:
         Raises:
             CharacterFetchError: If there is an error fetching character data from the Superhero API.
         """
-        retry_counter = 0
-        max_retries = 3
-        response = None
-
-        while retry_counter < max_retries:
-            try:
-                response = requests.get(f"{SUPERHERO_API_URL}/{character_id}")
-                response.raise_for_status()
-
-                character_data = response.json()
-                name = character_data["name"]
-                alignment = character_data["biography"]["alignment"]
-                intelligence = character_data["powerstats"]["intelligence"]
-                strength = character_data["powerstats"]["strength"]
-                speed = character_data["powerstats"]["speed"]
-                durability = character_data["powerstats"]["durability"]
-                power = character_data["powerstats"]["power"]
-                combat = character_data["powerstats"]["combat"]
-
-                base_stats = Character_Service._parse_base_stats_data(
-                    intelligence, strength, speed, durability, power, combat
+        if cls.snapshot is not None and character_id in cls.snapshot:
+            return cls.snapshot.get(character_id)
+
+        cached_data = cls.cache.get(character_id)
+        if cached_data is not None:
+            return cached_data
+
+        name, alignment, base_stats = cls._fetch_character_data(character_id)
+        cls.cache.put(character_id, name, alignment, base_stats)
+        return name, alignment, base_stats
+
+    @classmethod
+    def get_many_character_data(
+        cls,
+        character_ids: Iterable[int],
+        max_workers: int = SUPERHERO_API_MAX_CONCURRENT_REQUESTS,
+    ) -> List[Tuple[str, str, Dict[str, float]]]:
+        """
+        Fetch the data of several characters concurrently from the Superhero API.
+
+        Args:
+            character_ids: The IDs of the characters.
+            max_workers: The maximum number of requests in flight at once.
+        Returns:
+            A list with the name, alignment, and base stats of each character,
+            in the same order as the given IDs.
+        Raises:
+            CharacterFetchError: If there is an error fetching any of the characters.
+        """
+        character_ids = list(character_ids)
+        if not character_ids:
+            return []
+
+        workers = max(1, min(max_workers, len(character_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(cls.get_character_data, character_ids))
+
+    @classmethod
+    async def get_many_character_data_async(
+        cls,
+        character_ids: Iterable[int],
+        max_workers: int = SUPERHERO_API_MAX_CONCURRENT_REQUESTS,
+    ) -> List[Tuple[str, str, Dict[str, float]]]:
+        """
+        Fetch the data of several characters concurrently without blocking
+        the event loop. Requests, and their retries, run in a thread pool
+        shared by every event loop, so concurrent battles are not limited
+        by the small default executor of the loop.
+
+        Args:
+            character_ids: The IDs of the characters.
+            max_workers: The maximum number of requests in flight at once.
+        Returns:
+            A list with the name, alignment, and base stats of each character,
+            in the same order as the given IDs.
+        Raises:
+            CharacterFetchError: If there is an error fetching any of the characters.
+        """
+        loop = asyncio.get_running_loop()
+        executor = cls._get_executor()
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def get_character_data(
+            character_id: int,
+        ) -> Tuple[str, str, Dict[str, float]]:
+            async with semaphore:
+                return await loop.run_in_executor(
+                    executor, cls.get_character_data, character_id
                 )
 
-                return name, alignment, base_stats
-            except RequestException as e:
-                print(
-                    "No se pudo obtener la información del personaje con ID"
-                    f" {character_id}."
+        return list(
+            await asyncio.gather(
+                *(
+                    get_character_data(character_id)
+                    for character_id in character_ids
                 )
-                print("Reintentando en 5 segundos...")
-                retry_counter += 1
-                time.sleep(5)
-                if retry_counter == max_retries:
-                    raise CharacterDataFetchError(
-                        "No se pudo obtener la data de personajes en Superhero"
-                        f" API.\n{str(e)}"
-                    )
+            )
+        )
+
+    @classmethod
+    def load_snapshot(cls, path: str) -> None:
+        """
+        Serve character data from a roster snapshot instead of the Superhero API.
+
+        Args:
+            path: The path of the snapshot file.
+
+        Returns:
+            None.
+        """
+        cls.snapshot = Roster_Snapshot.load(path)
+
+    @classmethod
+    def available_character_ids(cls) -> Sequence[int]:
+        """
+        Get the IDs of the characters that can be fetched.
+
+        Returns:
+            Sequence[int]: The IDs in the loaded snapshot, or every ID of the
+            Superhero API if no snapshot is loaded.
+        """
+        if cls.snapshot is not None:
+            return cls.snapshot.ids
+        return range(1, SUPERHERO_API_LAST_CHARACTER_ID + 1)
 
     ###########################################################
     # AUXILIARY METHODS
     ###########################################################
 
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """
+        Get the thread pool of the async fetches, creating it on first use.
+
+        Returns:
+            ThreadPoolExecutor: The thread pool of the service.
+        """
+        if cls.executor is None:
+            cls.executor = ThreadPoolExecutor(
+                max_workers=HTTP_POOL_SIZE,
+                thread_name_prefix="character-service",
+            )
+        return cls.executor
+
+    @staticmethod
+    def _fetch_character_data(
+        character_id,
+    ) -> Tuple[str, str, Dict[str, float]]:
+        """
+        Fetch character data from the Superhero API, through the shared
+        HTTP client that retries failed requests.
+
+        Args:
+            character_id: The ID of the character
+        Returns:
+            A tuple containing the name, alignment, and base stats of the character.
+        Raises:
+            CharacterFetchError: If there is an error fetching character data from the Superhero API.
+        """
+        try:
+            response = Http_Client.shared().get(
+                f"{SUPERHERO_API_URL}/{character_id}"
+            )
+            character_data = response.json()
+        except RequestException as e:
+            print(
+                "No se pudo obtener la información del personaje con ID"
+                f" {character_id}."
+            )
+            raise CharacterDataFetchError(
+                "No se pudo obtener la data de personajes en Superhero"
+                f" API.\n{str(e)}"
+            )
+
+        if character_data.get("response") == "error":
+            raise CharacterDataFetchError(
+                f"El personaje con ID {character_id} no existe en"
+                " Superhero API."
+            )
+        name = character_data["name"]
+        alignment = character_data["biography"]["alignment"]
+        intelligence = character_data["powerstats"]["intelligence"]
+        strength = character_data["powerstats"]["strength"]
+        speed = character_data["powerstats"]["speed"]
+        durability = character_data["powerstats"]["durability"]
+        power = character_data["powerstats"]["power"]
+        combat = character_data["powerstats"]["combat"]
+
+        base_stats = Character_Service._parse_base_stats_data(
+            intelligence, strength, speed, durability, power, combat
+        )
+
+        return name, alignment, base_stats
+
     @staticmethod
     def _parse_base_stats_data(
         intelligence: str,
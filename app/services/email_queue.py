@@ -0,0 +1,148 @@
+import queue
+import threading
+from typing import Callable, Dict, List, Tuple
+
+from ..utils import EmailServiceError
+from ..config import EMAIL_QUEUE_BATCH_SIZE
+
+
+class Email_Queue:
+    """
+    A background delivery queue for emails.
+
+    A worker thread takes the queued emails and groups the ones with the same
+    content into a single request with several recipients, so callers never
+    wait for the mail API. Each request is sent once: retrying is left to the
+    send function, which goes through the retrying HTTP client.
+    """
+
+    ###########################################################
+    # CLASS CONSTRUCTOR
+    ###########################################################
+
+    def __init__(
+        self,
+        send: Callable[[List[str], str, str], None],
+        batch_size: int = EMAIL_QUEUE_BATCH_SIZE,
+    ) -> None:
+        """
+        Initialize an Email_Queue instance.
+
+        Args:
+            send: The function sending one email to a list of recipients,
+                given the recipients, the text content and the HTML content.
+                It must raise EmailServiceError on failure.
+            batch_size: The maximum number of recipients per request.
+        """
+        self.send = send
+        self.batch_size = batch_size
+        self.sent = 0
+        self.failed = 0
+        self._queue: "queue.Queue[Tuple[str, str, str]]" = queue.Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+
+    ###########################################################
+    # PUBLIC METHODS
+    ###########################################################
+
+    def enqueue(self, recipient: str, content: str, html: str) -> None:
+        """
+        Queue an email for delivery and return immediately.
+
+        Args:
+            recipient: The recipient's email address.
+            content: The text content of the email.
+            html: The HTML content of the email.
+
+        Returns:
+            None.
+        """
+        self._start_worker()
+        self._queue.put((recipient, content, html))
+
+    def flush(self) -> None:
+        """
+        Wait until every queued email has been sent or dropped.
+
+        Returns:
+            None.
+        """
+        self._queue.join()
+
+    def pending(self) -> int:
+        """
+        Get the number of emails waiting to be delivered.
+
+        Returns:
+            int: The number of queued emails.
+        """
+        return self._queue.unfinished_tasks
+
+    ###########################################################
+    # PRIVATE METHODS
+    ###########################################################
+
+    def _start_worker(self) -> None:
+        """
+        Start the worker thread if it is not running yet.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="email-queue", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        """
+        Deliver queued emails forever.
+
+        Returns:
+            None.
+        """
+        while True:
+            jobs = [self._queue.get()]
+            while len(jobs) < self.batch_size:
+                try:
+                    jobs.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                batches: Dict[Tuple[str, str], List[str]] = {}
+                for recipient, content, html in jobs:
+                    batches.setdefault((content, html), []).append(recipient)
+
+                for (content, html), recipients in batches.items():
+                    self._deliver(recipients, content, html)
+            finally:
+                # Waiting callers must be released even if a batch failed
+                for _ in jobs:
+                    self._queue.task_done()
+
+    def _deliver(self, recipients: List[str], content: str, html: str) -> None:
+        """
+        Send one batch of recipients, dropping it if the request fails.
+
+        Args:
+            recipients: The recipients' email addresses.
+            content: The text content of the email.
+            html: The HTML content of the email.
+
+        Returns:
+            None.
+        """
+        try:
+            self.send(recipients, content, html)
+            self.sent += len(recipients)
+        except EmailServiceError as e:
+            self.failed += len(recipients)
+            print(f"Error en Servicio de Email. {str(e)}")
+        except Exception as e:
+            # Any other error would stop the worker and every later email
+            self.failed += len(recipients)
+            print(f"Error inesperado en Servicio de Email. {str(e)}")
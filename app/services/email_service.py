@@ -1,7 +1,8 @@
-import argparse
-from typing import Union
+import asyncio
+import io
+import json
+from typing import Dict, Iterable, List, Union
 from datetime import date
-import requests
 from requests.exceptions import (
     RequestException,
 )
@@ -16,17 +17,13 @@ from ..utils import (
 from ..config import (
     MAILGUN_API_KEY,
     MAILGUN_API_URL,
-    ROOT_DIRECTORY_PATH,
+    BATTLE_LOG_PATH,
 )
+from .email_queue import Email_Queue
+from .http_client import Http_Client
 from ..utils import (
-    extract_team_names,
-    extract_round_details,
-    extract_winning_team,
-    generate_html_header,
-    generate_html_footer,
-    generate_html_battle_results_header,
-    generate_html_round_details_table,
-    generate_html_winning_team,
+    read_battle_records,
+    write_html_report,
 )
 
 
@@ -35,55 +32,115 @@ class Email_Service:
     A class for sending battle results via email.
     """
 
+    queue = None  # Class attribute, created on first use
+
     ###########################################################
     # PUBLIC METHODS
     ###########################################################
 
     @classmethod
-    def process_email(cls, email_address: str) -> None:
+    def process_email(
+        cls,
+        email_address: str,
+        log_records: Union[Iterable[Dict], None] = None,
+    ) -> None:
+        """
+        Validate an email address and queue the battle results for delivery
+        in the background.
+
+        Args:
+            email_address: The recipient's email address.
+            log_records: The log records of the battle. The battle log file
+                is read if not provided.
+
+        Returns:
+            None.
+        """
         try:
             Email_Service._validate_email_address(email_address)
-            Email_Service._send_email(
+            cls._get_queue().enqueue(
                 email_address,
-                "Resultados de Batalla",
                 "Aqui los resultados de la batalla.",
+                Email_Service._parse_log_file_to_html(log_records),
             )
-        except (
-            EmailValidationError,
-            EmailServiceError,
-        ) as e:
+        except EmailValidationError as e:
             print(f"Error en Servicio de Email. {str(e)}")
 
     @classmethod
-    def get_email_provided_by_user(cls) -> Union[str, None]:
+    async def process_email_async(
+        cls,
+        email_address: str,
+        log_records: Union[Iterable[Dict], None] = None,
+    ) -> None:
+        """
+        Validate an email address and queue the battle results for delivery
+        like `process_email`, without blocking the event loop.
+
+        Args:
+            email_address: The recipient's email address.
+            log_records: The log records of the battle. The battle log file
+                is read if not provided.
+
+        Returns:
+            None.
+        """
+        await asyncio.to_thread(cls.process_email, email_address, log_records)
+
+    @classmethod
+    async def wait_for_pending_emails_async(cls) -> None:
+        """
+        Wait until every queued email has been delivered or dropped, without
+        blocking the event loop.
+
+        Returns:
+            None.
+        """
+        await asyncio.to_thread(cls.wait_for_pending_emails)
+
+    @classmethod
+    def wait_for_pending_emails(cls) -> None:
         """
-        Get the email address provided by the user.
+        Block until every queued email has been delivered or dropped.
 
         Returns:
-            Union[str, None]: The email address provided by the user, or None if not provided.
+            None.
         """
-        parser = argparse.ArgumentParser()
-        parser.add_argument("-email", nargs="?", type=str, help="Email address")
-        args = parser.parse_args()
-        return args.email if args.email else None
+        if cls.queue is not None and cls.queue.pending():
+            print("Esperando el envío de emails pendientes...")
+            cls.queue.flush()
 
     ###########################################################
     # AUXILIARY METHODS
     ###########################################################
 
+    @classmethod
+    def _get_queue(cls) -> Email_Queue:
+        """
+        Get the delivery queue, creating it on first use.
+
+        Returns:
+            Email_Queue: The delivery queue of the service.
+        """
+        if cls.queue is None:
+            cls.queue = Email_Queue(Email_Service._send_email)
+        return cls.queue
+
     @staticmethod
     def _send_email(
-        recipient: str,
-        subject: str,
+        recipients: List[str],
         content: str,
+        html: str,
     ) -> None:
         """
-        Send an email to the recipient.
+        Send an email to one or more recipients.
+
+        Recipients of a batch receive individual copies, since Mailgun is
+        given recipient variables for them.
 
         Args:
-            recipient: The recipient's email address.
-            subject: The subject of the email.
-            content: The content of the email.
+            recipients: The recipients' email addresses.
+            content: The text content of the email.
+            html: The HTML content of the email.
 
         Returns:
             None.
@@ -95,21 +152,24 @@ class Email_Service:
         auth = ("api", MAILGUN_API_KEY)
         data = {
             "from": "Superhero Battle <bigsamu@superherobattle.com>",
-            "to": recipient,
+            "to": recipients,
             "subject": (
                 f"SuperHero Battle Simulation from BigSamu - {date.today()}"
             ),
             "text": content,
-            "html": Email_Service._parse_log_file_to_html(),
+            "html": html,
         }
+        if len(recipients) > 1:
+            data["recipient-variables"] = json.dumps(
+                {recipient: {} for recipient in recipients}
+            )
         try:
-            response = requests.post(
+            Http_Client.shared().post(
                 url,
                 auth=auth,
                 data=data,
             )
-            response.raise_for_status()
-            print(f"Email enviado a {recipient}")
+            print(f"Email enviado a {', '.join(recipients)}")
         except RequestException as e:
             raise EmailServiceError(
                 f"No se pudo conectart con Mailgun API.\n{e}"
@@ -143,28 +203,21 @@ class Email_Service:
             )
 
     @staticmethod
-    def _parse_log_file_to_html() -> str:
+    def _parse_log_file_to_html(
+        log_records: Union[Iterable[Dict], None] = None,
+    ) -> str:
         """
-        Parse the battle log file into HTML format for detailed email content.
+        Parse the battle log into HTML format for detailed email content.
+
+        Args:
+            log_records: The log records of the battle. The battle log file
+                is read if not provided.
 
         Returns:
             str: The HTML content representing the battle results.
         """
-        log_path = f"{ROOT_DIRECTORY_PATH}/battle_log.txt"
-        with open(log_path, "r") as file:
-            log_content = file.readlines()
-
-        (
-            team_1,
-            team_2,
-        ) = extract_team_names(log_content)
-        round_details = extract_round_details(log_content)
-        winning_team = extract_winning_team(log_content)
-
-        html = generate_html_header()
-        html += generate_html_battle_results_header(team_1, team_2)
-        html += generate_html_round_details_table(round_details)
-        html += generate_html_winning_team(winning_team)
-        html += generate_html_footer()
-
-        return html
+        if log_records is None:
+            log_records = read_battle_records(BATTLE_LOG_PATH)
+        html = io.StringIO()
+        write_html_report(log_records, html)
+        return html.getvalue()
@@ -0,0 +1,220 @@
+import random
+import threading
+import time
+from typing import Dict, List
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import (
+    HTTPError,
+    RequestException,
+)
+
+from ..utils import CircuitOpenError
+from ..config import (
+    HTTP_TIMEOUT,
+    HTTP_MAX_RETRIES,
+    HTTP_BACKOFF_BASE,
+    HTTP_BACKOFF_MAX,
+    HTTP_CIRCUIT_BREAKER_THRESHOLD,
+    HTTP_CIRCUIT_BREAKER_RESET,
+    HTTP_POOL_SIZE,
+)
+
+
+class Http_Client:
+    """
+    A shared HTTP client for the external APIs.
+
+    It keeps connections alive in a pool, retries failed requests with
+    exponential backoff and full jitter, applies a timeout to every request
+    and stops calling an API host for a while after too many consecutive
+    failures on it (circuit breaking), so one failing API does not block
+    the others.
+    """
+
+    _shared = None  # Class attribute, created on first use
+    _shared_lock = threading.Lock()  # Class attribute
+
+    ###########################################################
+    # CLASS CONSTRUCTOR
+    ###########################################################
+
+    def __init__(
+        self,
+        timeout: float = HTTP_TIMEOUT,
+        max_retries: int = HTTP_MAX_RETRIES,
+        backoff_base: float = HTTP_BACKOFF_BASE,
+        backoff_max: float = HTTP_BACKOFF_MAX,
+        failure_threshold: int = HTTP_CIRCUIT_BREAKER_THRESHOLD,
+        reset_timeout: float = HTTP_CIRCUIT_BREAKER_RESET,
+        pool_size: int = HTTP_POOL_SIZE,
+    ) -> None:
+        """
+        Initialize an Http_Client instance.
+
+        Args:
+            timeout: The timeout of each request, in seconds.
+            max_retries: The number of retries after the first attempt.
+            backoff_base: The maximum delay before the first retry, in seconds.
+            backoff_max: The cap of the delay between retries, in seconds.
+            failure_threshold: The consecutive failures on a host that open
+                its circuit.
+            reset_timeout: The time a circuit stays open, in seconds.
+            pool_size: The number of connections kept alive per host.
+        """
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Consecutive failures and opening time of the circuit of each host
+        self._circuits: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "Http_Client":
+        """
+        Get the client shared by all the services, creating it on first use.
+
+        Returns:
+            Http_Client: The shared client.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    ###########################################################
+    # PUBLIC METHODS
+    ###########################################################
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Send a GET request. See `request`.
+        """
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """
+        Send a POST request. See `request`.
+        """
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request, retrying connection errors, timeouts, HTTP 429 and
+        HTTP 5xx responses.
+
+        Args:
+            method: The HTTP method.
+            url: The URL of the request.
+            kwargs: Extra arguments for `requests.Session.request`.
+
+        Returns:
+            requests.Response: The successful response.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open.
+            RequestException: If the request failed after all the retries.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        host = urlsplit(url).netloc
+        attempt = 0
+        while True:
+            self._check_circuit(host)
+            try:
+                response = self.session.request(method, url, **kwargs)
+                response.raise_for_status()
+                self._record_success(host)
+                return response
+            except RequestException as e:
+                if not self._is_retryable(e):
+                    self._record_success(host)
+                    raise
+                circuit_opened = self._record_failure(host)
+                if circuit_opened or attempt >= self.max_retries:
+                    raise
+            time.sleep(self._backoff_delay(attempt))
+            attempt += 1
+
+    ###########################################################
+    # AUXILIARY METHODS
+    ###########################################################
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Compute the delay before a retry, using full jitter.
+
+        Args:
+            attempt: The number of the failed attempt, starting at 0.
+
+        Returns:
+            float: The delay, in seconds.
+        """
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_base * 2**attempt)
+        )
+
+    @staticmethod
+    def _is_retryable(error: RequestException) -> bool:
+        """
+        Check if a failed request is worth retrying.
+
+        Args:
+            error: The error raised by the request.
+
+        Returns:
+            bool: False for HTTP 4xx responses other than 429, True otherwise.
+        """
+        if isinstance(error, HTTPError) and error.response is not None:
+            status = error.response.status_code
+            return status == 429 or status >= 500
+        return True
+
+    def _check_circuit(self, host: str) -> None:
+        """
+        Refuse the request if the circuit of the host is open. Once the reset
+        timeout has passed, one more failure opens it again.
+
+        Args:
+            host: The host of the request.
+
+        Returns:
+            None.
+
+        Raises:
+            CircuitOpenError: If the circuit of the host is open.
+        """
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit[1] is None:
+                return
+            if time.monotonic() - circuit[1] < self.reset_timeout:
+                raise CircuitOpenError(
+                    f"Demasiados errores consecutivos en {host}, se suspenden"
+                    " las solicitudes temporalmente."
+                )
+            circuit[0] = self.failure_threshold - 1
+            circuit[1] = None
+
+    def _record_success(self, host: str) -> None:
+        with self._lock:
+            self._circuits.pop(host, None)
+
+    def _record_failure(self, host: str) -> bool:
+        with self._lock:
+            circuit = self._circuits.setdefault(host, [0, None])
+            circuit[0] += 1
+            if circuit[0] >= self.failure_threshold:
+                circuit[1] = time.monotonic()
+                return True
+            return False
@@ -0,0 +1,267 @@
+import mmap
+import struct
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Tuple, Union
+
+from ..utils import CharacterDataFetchError
+from ..config import SUPERHERO_API_MAX_CONCURRENT_REQUESTS
+
+STAT_NAMES = (
+    "intelligence",
+    "strength",
+    "speed",
+    "durability",
+    "power",
+    "combat",
+)
+
+
+class Roster_Snapshot:
+    """
+    A versioned, columnar binary snapshot of the Superhero API roster.
+
+    The file stores a fixed header followed by one column per field: character
+    IDs, base stats, alignment codes and the offsets of the names inside a
+    single UTF-8 blob.
+    """
+
+    MAGIC = b"SHRS"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHI")
+
+    ###########################################################
+    # CLASS CONSTRUCTOR
+    ###########################################################
+
+    def __init__(
+        self,
+        ids: array,
+        stats: array,
+        alignment_codes: array,
+        alignments: List[str],
+        name_offsets: array,
+        names: bytes,
+    ) -> None:
+        """
+        Initialize a Roster_Snapshot instance from its columns.
+
+        Args:
+            ids: The IDs of the characters.
+            stats: The base stats of the characters, six values per character.
+            alignment_codes: The index of each character's alignment in `alignments`.
+            alignments: The distinct alignments in the snapshot.
+            name_offsets: The offsets of each character's name in `names`.
+            names: The UTF-8 encoded names of all the characters.
+        """
+        self.ids = ids
+        self.stats = stats
+        self.alignment_codes = alignment_codes
+        self.alignments = alignments
+        self.name_offsets = name_offsets
+        self.names = names
+        self._rows = {character_id: row for row, character_id in enumerate(ids)}
+
+    ###########################################################
+    # PUBLIC METHODS
+    ###########################################################
+
+    def get(
+        self, character_id: int
+    ) -> Union[Tuple[str, str, Dict[str, int]], None]:
+        """
+        Get the data of a character stored in the snapshot.
+
+        Args:
+            character_id: The ID of the character.
+
+        Returns:
+            A tuple containing the name, alignment, and base stats of the
+            character, or None if it is not in the snapshot.
+        """
+        row = self._rows.get(character_id)
+        if row is None:
+            return None
+
+        name = self.names[
+            self.name_offsets[row] : self.name_offsets[row + 1]
+        ].decode("utf-8")
+        alignment = self.alignments[self.alignment_codes[row]]
+        base_stats = dict(zip(STAT_NAMES, self.stats[row * 6 : row * 6 + 6]))
+        return name, alignment, base_stats
+
+    def character_ids(self) -> List[int]:
+        """
+        Get the IDs of every character in the snapshot.
+
+        Returns:
+            List[int]: The IDs of the characters.
+        """
+        return list(self.ids)
+
+    def __contains__(self, character_id: int) -> bool:
+        return character_id in self._rows
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def load(cls, path: str) -> "Roster_Snapshot":
+        """
+        Load a snapshot file by memory-mapping it.
+
+        Args:
+            path: The path of the snapshot file.
+
+        Returns:
+            Roster_Snapshot: The loaded snapshot.
+
+        Raises:
+            ValueError: If the file is not a snapshot of a supported version.
+        """
+        with open(path, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as data:
+            magic, version, count = cls.HEADER.unpack_from(data, 0)
+            if magic != cls.MAGIC or version != cls.VERSION:
+                raise ValueError(
+                    f"{path} no es un snapshot de personajes compatible."
+                )
+            offset = cls.HEADER.size
+
+            (alignment_count,) = struct.unpack_from("<B", data, offset)
+            offset += 1
+            alignments = []
+            for _ in range(alignment_count):
+                (length,) = struct.unpack_from("<B", data, offset)
+                offset += 1
+                alignments.append(
+                    bytes(data[offset : offset + length]).decode("utf-8")
+                )
+                offset += length
+
+            ids, offset = cls._read_column(data, offset, "H", count)
+            stats, offset = cls._read_column(data, offset, "H", count * 6)
+            alignment_codes, offset = cls._read_column(data, offset, "B", count)
+            name_offsets, offset = cls._read_column(
+                data, offset, "I", count + 1
+            )
+            names = bytes(data[offset : offset + name_offsets[-1]])
+
+        return cls(ids, stats, alignment_codes, alignments, name_offsets, names)
+
+    @classmethod
+    def write(
+        cls,
+        path: str,
+        characters: Iterable[Tuple[int, str, str, Dict[str, int]]],
+    ) -> None:
+        """
+        Write a snapshot file.
+
+        Args:
+            path: The path of the snapshot file.
+            characters: The ID, name, alignment, and base stats of each character.
+
+        Returns:
+            None.
+        """
+        ids = array("H")
+        stats = array("H")
+        alignment_codes = array("B")
+        alignments = []
+        name_offsets = array("I", [0])
+        names = bytearray()
+
+        for character_id, name, alignment, base_stats in sorted(characters):
+            if alignment not in alignments:
+                alignments.append(alignment)
+            ids.append(character_id)
+            stats.extend(base_stats[stat] for stat in STAT_NAMES)
+            alignment_codes.append(alignments.index(alignment))
+            names += name.encode("utf-8")
+            name_offsets.append(len(names))
+
+        with open(path, "wb") as file:
+            file.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(ids)))
+            file.write(struct.pack("<B", len(alignments)))
+            for alignment in alignments:
+                encoded = alignment.encode("utf-8")
+                file.write(struct.pack("<B", len(encoded)))
+                file.write(encoded)
+            for column in (ids, stats, alignment_codes, name_offsets):
+                if sys.byteorder != "little":
+                    column = array(column.typecode, column)
+                    column.byteswap()
+                file.write(column.tobytes())
+            file.write(names)
+
+    @classmethod
+    def download(
+        cls,
+        path: str,
+        character_ids: Iterable[int],
+        max_workers: int = SUPERHERO_API_MAX_CONCURRENT_REQUESTS,
+    ) -> int:
+        """
+        Download the given characters from the Superhero API into a snapshot file.
+
+        Characters that cannot be fetched are left out of the snapshot.
+
+        Args:
+            path: The path of the snapshot file.
+            character_ids: The IDs of the characters to download.
+            max_workers: The maximum number of requests in flight at once.
+
+        Returns:
+            int: The number of characters written to the snapshot.
+        """
+        from .character_service import Character_Service
+
+        def fetch(character_id: int):
+            try:
+                return (
+                    character_id,
+                    *Character_Service.get_character_data(character_id),
+                )
+            except CharacterDataFetchError as e:
+                print(f"Se omite el personaje con ID {character_id}. {str(e)}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            characters = [
+                character
+                for character in executor.map(fetch, character_ids)
+                if character is not None
+            ]
+
+        cls.write(path, characters)
+        return len(characters)
+
+    ###########################################################
+    # AUXILIARY METHODS
+    ###########################################################
+
+    @staticmethod
+    def _read_column(
+        data: mmap.mmap, offset: int, typecode: str, count: int
+    ) -> Tuple[array, int]:
+        """
+        Read a little-endian column of fixed-width values.
+
+        Args:
+            data: The mapped snapshot file.
+            offset: The position where the column starts.
+            typecode: The array typecode of the values.
+            count: The number of values in the column.
+
+        Returns:
+            Tuple[array, int]: The column and the position right after it.
+        """
+        column = array(typecode)
+        end = offset + column.itemsize * count
+        column.frombytes(data[offset:end])
+        if sys.byteorder != "little":
+            column.byteswap()
+        return column, end
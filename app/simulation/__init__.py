@@ -0,0 +1,10 @@
+from .duel_solver import (
+    DuelOutcome,
+    attacks_to_defeat,
+    solve_duel,
+    solve_character_duel,
+)
+from .battle_solver import BattleSolution, BattleSolver
+from .monte_carlo import MonteCarloEngine, MonteCarloResult
+from .tournament import PairingResult, Tournament, TournamentStanding
+from .batch import BatchBattleResult, BatchSimulation
@@ -0,0 +1,174 @@
+import multiprocessing
+import random
+import time
+from typing import Dict, Iterator, List, NamedTuple, Tuple, Union
+
+from ..config import TEAM_SIZE
+from ..models import Battle, FreeForAllBattle, Team
+from ..utils import SilentReporter
+
+CharacterData = Tuple[int, str, str, Dict[str, float]]
+
+
+class BatchBattleResult(NamedTuple):
+    """
+    The result of one battle of a batch.
+    """
+
+    battle: int
+    seed: int
+    winner: str
+    rounds: int
+
+
+class BatchSimulation:
+    """
+    A batch of battles between the same rosters. With more than two teams,
+    every battle is a free-for-all.
+
+    The rosters are fetched once and every battle rebuilds the teams from
+    them with its own seed, so AS and FB are drawn again on each battle
+    without calling the Superhero API. Battles are spread across a process
+    pool and their results are streamed back in battle order.
+    """
+
+    ###########################################################
+    # CLASS CONSTRUCTOR
+    ###########################################################
+
+    def __init__(
+        self,
+        battles: int,
+        workers: Union[int, None] = None,
+        seed: Union[int, None] = None,
+        team_count: int = 2,
+        team_size: int = TEAM_SIZE,
+    ) -> None:
+        """
+        Initialize a BatchSimulation instance.
+
+        Args:
+            battles: The number of battles to play.
+            workers: The number of worker processes. Defaults to the number of
+                CPUs. With a single worker, battles are played in this process.
+            seed: The seed used to draw the rosters and to seed every battle.
+            team_count: The number of teams of every battle.
+            team_size: The number of characters in each team.
+        """
+        self.battles = battles
+        self.workers = workers or multiprocessing.cpu_count()
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.team_count = team_count
+        self.team_size = team_size
+        self.rosters: Dict[str, List[CharacterData]] = {}
+        self.elapsed = 0.0
+
+    ###########################################################
+    # PUBLIC METHODS
+    ###########################################################
+
+    def build_teams(self) -> None:
+        """
+        Draw the rosters of the teams and fetch their characters.
+
+        Returns:
+            None.
+
+        Raises:
+            TeamPopulationError: If the teams cannot be populated with characters.
+        """
+        rng = random.Random(self.seed)
+        teams = [
+            Team(f"Team {team_number}", rng, size=self.team_size)
+            for team_number in range(1, self.team_count + 1)
+        ]
+        Team.populate_teams(*teams, reporter=SilentReporter())
+        self.rosters = {
+            team.name: [
+                (member.id, member.name, member.alignment, member.base_stats)
+                for member in team.members
+            ]
+            for team in teams
+        }
+
+    def run(self) -> Iterator[BatchBattleResult]:
+        """
+        Play every battle of the batch.
+
+        Returns:
+            Iterator[BatchBattleResult]: The result of each battle, in battle order.
+        """
+        if not self.rosters:
+            self.build_teams()
+
+        start = time.perf_counter()
+        if self.workers == 1:
+            yield from map(_play_battle, self._generate_tasks())
+        else:
+            with multiprocessing.Pool(self.workers) as pool:
+                yield from pool.imap(
+                    _play_battle, self._generate_tasks(), chunksize=16
+                )
+        self.elapsed = time.perf_counter() - start
+
+    @property
+    def battles_per_second(self) -> float:
+        return self.battles / self.elapsed if self.elapsed else 0.0
+
+    ###########################################################
+    # PRIVATE METHODS
+    ###########################################################
+
+    def _generate_tasks(
+        self,
+    ) -> Iterator[Tuple[int, int, Dict[str, List[CharacterData]]]]:
+        """
+        Lazily generate one task per battle, with a deterministic seed.
+
+        Returns:
+            Iterator: The number of each battle, its seed and the rosters.
+        """
+        rng = random.Random(self.seed)
+        for battle_number in range(1, self.battles + 1):
+            yield battle_number, rng.randrange(2**32), self.rosters
+
+
+###########################################################
+# WORKERS
+###########################################################
+
+
+def _play_battle(
+    task: Tuple[int, int, Dict[str, List[CharacterData]]]
+) -> BatchBattleResult:
+    """
+    Play one battle of a batch.
+
+    Args:
+        task: The number of the battle, its seed and the rosters.
+
+    Returns:
+        BatchBattleResult: The winner of the battle and the rounds played.
+    """
+    battle_number, seed, rosters = task
+    rng = random.Random(seed)
+    teams = [
+        Team.from_characters_data(name, roster, rng)
+        for name, roster in rosters.items()
+    ]
+    # The battle RNG is seeded from the team RNG, so it does not replay the
+    # draws of the AS, FB and attacks of the members
+    battle_seed = rng.randrange(2**32)
+    if len(teams) == 2:
+        battle = Battle(
+            *teams, reporter=SilentReporter(), log=False, seed=battle_seed
+        )
+    else:
+        battle = FreeForAllBattle(
+            teams, reporter=SilentReporter(), seed=battle_seed
+        )
+    winner = battle.simulate()
+    rounds = sum(len(roster) for roster in rosters.values()) - len(
+        winner.members
+    )
+    return BatchBattleResult(battle_number, seed, winner.name, rounds)
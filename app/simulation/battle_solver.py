@@ -0,0 +1,159 @@
+from typing import Dict, NamedTuple, Tuple
+
+import numpy as np
+
+from ..models import Team
+from .duel_solver import solve_character_duel
+
+
+class BattleSolution(NamedTuple):
+    """
+    The exact outcome of a battle between two teams.
+    """
+
+    team_1_win_probability: float
+    team_2_win_probability: float
+    expected_rounds: float
+    expected_moves: float
+
+
+class BattleSolver:
+    """
+    An exact solver of the outcome of a battle between two populated teams.
+
+    It follows the rules of Battle._simulate_round: each round a random member
+    of each team fights a duel, Team 1 attacks first, the loser is removed
+    from its team and the winner recovers its full HP. Every round starts
+    with full HP, so the state of a battle is just the set of members still
+    standing in each team, and the outcome of every state is computed once
+    from the exact duel probabilities.
+    """
+
+    ###########################################################
+    # CLASS CONSTRUCTOR
+    ###########################################################
+
+    def __init__(self, team_1: Team, team_2: Team) -> None:
+        """
+        Initialize a BattleSolver instance.
+
+        Args:
+            team_1: The first team, already populated.
+            team_2: The second team, already populated.
+
+        Raises:
+            SimulationError: If a duel between two members can never end.
+        """
+        self.team_1 = team_1
+        self.team_2 = team_2
+        duels = [
+            [
+                solve_character_duel(member_1, member_2)
+                for member_2 in team_2.members
+            ]
+            for member_1 in team_1.members
+        ]
+        self.win_probabilities = np.array(
+            [[duel.attacker_win_probability for duel in row] for row in duels]
+        )
+        self.expected_moves = np.array(
+            [[duel.expected_moves for duel in row] for row in duels]
+        )
+        self._solutions: Dict[Tuple[int, int], Tuple[float, float, float]] = {}
+
+    ###########################################################
+    # PUBLIC METHODS
+    ###########################################################
+
+    def solve(self) -> BattleSolution:
+        """
+        Compute the exact outcome of the battle.
+
+        Returns:
+            BattleSolution: The win probability of each team and the expected
+            number of rounds and moves of the battle.
+        """
+        team_1_win_probability, rounds, moves = self._solve_state(
+            (1 << len(self.team_1.members)) - 1,
+            (1 << len(self.team_2.members)) - 1,
+        )
+        return BattleSolution(
+            float(team_1_win_probability),
+            float(1 - team_1_win_probability),
+            float(rounds),
+            float(moves),
+        )
+
+    ###########################################################
+    # PRIVATE METHODS
+    ###########################################################
+
+    def _solve_state(
+        self, alive_1: int, alive_2: int
+    ) -> Tuple[float, float, float]:
+        """
+        Compute the outcome of the battle from a given state.
+
+        Args:
+            alive_1: The bit mask of the Team 1 members still standing.
+            alive_2: The bit mask of the Team 2 members still standing.
+
+        Returns:
+            The probability that Team 1 wins and the expected number of
+            remaining rounds and moves.
+        """
+        if alive_2 == 0:
+            return 1.0, 0.0, 0.0
+        if alive_1 == 0:
+            return 0.0, 0.0, 0.0
+
+        state = (alive_1, alive_2)
+        solution = self._solutions.get(state)
+        if solution is not None:
+            return solution
+
+        members_1 = self._members(alive_1)
+        members_2 = self._members(alive_2)
+        win_probability = 0.0
+        rounds = 0.0
+        moves = 0.0
+        for member_1 in members_1:
+            lost_1 = self._solve_state(alive_1 & ~(1 << member_1), alive_2)
+            for member_2 in members_2:
+                won_1 = self._solve_state(alive_1, alive_2 & ~(1 << member_2))
+                duel = self.win_probabilities[member_1, member_2]
+                win_probability += duel * won_1[0] + (1 - duel) * lost_1[0]
+                rounds += duel * won_1[1] + (1 - duel) * lost_1[1]
+                moves += (
+                    self.expected_moves[member_1, member_2]
+                    + duel * won_1[2]
+                    + (1 - duel) * lost_1[2]
+                )
+
+        pairings = len(members_1) * len(members_2)
+        solution = (
+            win_probability / pairings,
+            1 + rounds / pairings,
+            moves / pairings,
+        )
+        self._solutions[state] = solution
+        return solution
+
+    ###########################################################
+    # AUXILIARY METHODS
+    ###########################################################
+
+    @staticmethod
+    def _members(alive: int) -> Tuple[int, ...]:
+        """
+        Get the indexes of the members in a bit mask.
+
+        Args:
+            alive: The bit mask of the members still standing.
+
+        Returns:
+            Tuple[int, ...]: The indexes of the members.
+        """
+        return tuple(
+            index for index in range(alive.bit_length()) if alive >> index & 1
+        )
@@ -0,0 +1,416 @@
+from functools import lru_cache
+import math
+from typing import NamedTuple, Tuple, Union
+
+import numpy as np
+
+from ..config import (
+    DUEL_SOLVER_CACHE_SIZE,
+    DUEL_SOLVER_TOLERANCE,
+    DUEL_SOLVER_MAX_ATTACKS,
+    DUEL_SOLVER_BLOCK_SIZE,
+)
+from ..models import Character
+from ..utils import SimulationError
+
+
+class DuelOutcome(NamedTuple):
+    """
+    The exact outcome distribution of a duel between two characters.
+    """
+
+    attacker_win_probability: float
+    defender_win_probability: float
+    expected_moves: float
+
+
+###########################################################
+# DUEL SOLVER
+###########################################################
+
+
+def solve_character_duel(
+    attacker: Character, defender: Character
+) -> DuelOutcome:
+    """
+    Solve the duel of a round of Battle._simulate_round, in which both
+    characters start with their full HP and the attacker moves first.
+
+    Args:
+        attacker: The character attacking first, from the first team.
+        defender: The character attacking second, from the second team.
+
+    Returns:
+        DuelOutcome: The win probability of each character and the expected
+        number of moves of the duel.
+
+    Raises:
+        SimulationError: If neither character can defeat the other.
+    """
+    return solve_duel(
+        tuple(attacker.attacks.values()),
+        attacker.max_HP,
+        tuple(defender.attacks.values()),
+        defender.max_HP,
+    )
+
+
+@lru_cache(maxsize=DUEL_SOLVER_CACHE_SIZE)
+def solve_duel(
+    attacker_attacks: Tuple[float, ...],
+    attacker_HP: float,
+    defender_attacks: Tuple[float, ...],
+    defender_HP: float,
+) -> DuelOutcome:
+    """
+    Solve a duel in which each move the attacking character uses one of its
+    attacks, chosen uniformly at random, and the characters take turns until
+    the HP of one of them drops below 0.
+
+    The attacks of each character do not depend on the other one, so the
+    duel is decided by the number of attacks each one needs to defeat its
+    opponent: the first character wins at its n-th attack (move 2n - 1) if
+    the second one needs n attacks or more, and loses at the m-th attack of
+    its opponent (move 2m) otherwise. Results are memoized; use
+    `solve_duel.cache_info()` to inspect the hit rate.
+
+    Args:
+        attacker_attacks: The attack values of the character moving first.
+        attacker_HP: The HP of the character moving first.
+        defender_attacks: The attack values of the character moving second.
+        defender_HP: The HP of the character moving second.
+
+    Returns:
+        DuelOutcome: The win probability of each character and the expected
+        number of moves of the duel.
+
+    Raises:
+        SimulationError: If neither character can defeat the other.
+    """
+    # The duel is over once the character needing fewer attacks at most is
+    # done, so neither distribution is needed beyond that point
+    limit = min(
+        _max_attacks_to_defeat(attacker_attacks, defender_HP),
+        _max_attacks_to_defeat(defender_attacks, attacker_HP),
+    )
+    limit = None if math.isinf(limit) else int(limit)
+    attacker_kills = np.array(
+        attacks_to_defeat(attacker_attacks, defender_HP, limit)
+    )
+    defender_kills = np.array(
+        attacks_to_defeat(defender_attacks, attacker_HP, limit)
+    )
+    if attacker_kills.sum() == 0 and defender_kills.sum() == 0:
+        raise SimulationError(
+            "Ninguno de los personajes puede derrotar al otro, el round no"
+            " terminaría."
+        )
+
+    length = max(len(attacker_kills), len(defender_kills)) + 1
+    attacker_kills = np.pad(attacker_kills, (0, length - len(attacker_kills)))
+    defender_kills = np.pad(defender_kills, (0, length - len(defender_kills)))
+    attacks = np.arange(length)
+
+    # P(the defender needs n attacks or more) and P(the attacker needs more
+    # than m attacks), including the chance of needing more than `limit`
+    defender_needs_at_least = 1 - np.concatenate(
+        ([0.0], np.cumsum(defender_kills)[:-1])
+    )
+    attacker_needs_more = 1 - np.cumsum(attacker_kills)
+
+    attacker_wins = attacker_kills * defender_needs_at_least
+    defender_wins = defender_kills * attacker_needs_more
+    attacker_win_probability = float(attacker_wins.sum())
+    defender_win_probability = float(defender_wins.sum())
+    expected_moves = float(
+        (attacker_wins * (2 * attacks - 1)).sum()
+        + (defender_wins * (2 * attacks)).sum()
+    )
+    return DuelOutcome(
+        attacker_win_probability,
+        defender_win_probability,
+        expected_moves,
+    )
+
+
+@lru_cache(maxsize=DUEL_SOLVER_CACHE_SIZE)
+def attacks_to_defeat(
+    attacks: Tuple[float, ...],
+    HP: float,
+    limit: Union[int, None] = None,
+    tolerance: float = DUEL_SOLVER_TOLERANCE,
+    max_attacks: int = DUEL_SOLVER_MAX_ATTACKS,
+) -> Tuple[float, ...]:
+    """
+    Compute the distribution of the number of attacks a character needs to
+    drop an opponent's HP below 0, when each attack is chosen uniformly at
+    random among its attack values.
+
+    Attacks never heal, so the opponent is defeated within n attacks exactly
+    when the damage of n attacks exceeds its HP. That damage only depends on
+    how many times each attack was used, so the chance of the opponent still
+    standing is a sum over the uses of the strongest attack of a binomial
+    distribution function of the uses of the middle one. It is only computed
+    for the attack numbers around HP / mean attack, outside of which it is
+    below `tolerance` * 1e-6 or above 1 minus that by Hoeffding's inequality,
+    so the cost grows with the number of attacks instead of its square.
+
+    Args:
+        attacks: The attack values of the character.
+        HP: The full HP of the opponent.
+        limit: The number of attacks after which the computation stops. If
+            not provided, it stops once the opponent is defeated.
+        tolerance: The probability of the opponent still standing below
+            which the computation stops.
+        max_attacks: The number of attacks after which an opponent still
+            standing with a probability above `tolerance` is an error.
+
+    Returns:
+        Tuple[float, ...]: The probability of defeating the opponent with
+        exactly n attacks, at index n. The missing probability, if any, is
+        the chance of needing more than `limit` attacks or never defeating it.
+
+    Raises:
+        SimulationError: If the computation does not converge within
+            `max_attacks` attacks.
+    """
+    if max(attacks) <= 0:
+        return (0.0,)
+
+    attacks = tuple(sorted(attacks))
+    precision = tolerance * 1e-6
+    first, last = _attack_numbers_to_defeat(attacks, HP, precision)
+    if limit is not None:
+        last = min(last, limit)
+    if first >= last:
+        return (0.0,) * (last + 1)
+
+    attack_numbers = np.arange(first, min(last, max_attacks) + 1)
+    log_factorials = _log_factorials(int(attack_numbers[-1]))
+    standing = np.concatenate(
+        [
+            _standing_probabilities(
+                attack_numbers[start : start + DUEL_SOLVER_BLOCK_SIZE],
+                attacks,
+                HP,
+                precision,
+                log_factorials,
+            )
+            for start in range(0, len(attack_numbers), DUEL_SOLVER_BLOCK_SIZE)
+        ]
+    )
+    converged = np.flatnonzero(standing <= tolerance)
+    if len(converged) > 0:
+        standing = standing[: converged[0] + 1]
+    elif last > max_attacks:
+        raise SimulationError(
+            f"El personaje no fue derrotado después de {max_attacks}"
+            " ataques."
+        )
+
+    # Any chance of defeating the opponent earlier is negligible, and is
+    # counted at the first computed attack
+    probabilities = np.zeros(first + len(standing))
+    probabilities[first:] = np.maximum(
+        -np.diff(np.concatenate(([1.0], standing))), 0.0
+    )
+    return tuple(probabilities.tolist())
+
+
+###########################################################
+# AUXILIARY FUNCTIONS
+###########################################################
+
+
+def _max_attacks_to_defeat(attacks: Tuple[float, ...], HP: float) -> float:
+    """
+    Compute the number of attacks that always defeats an opponent.
+
+    Args:
+        attacks: The attack values of the character.
+        HP: The full HP of the opponent.
+
+    Returns:
+        float: The number of attacks, or infinity if some attack does no damage.
+    """
+    weakest_attack = min(attacks)
+    if weakest_attack <= 0:
+        return math.inf
+    return math.floor(HP / weakest_attack) + 1
+
+
+def _attack_numbers_to_defeat(
+    attacks: Tuple[float, ...], HP: float, precision: float
+) -> Tuple[int, int]:
+    """
+    Bound the attack numbers at which an opponent may be defeated, using
+    Hoeffding's inequality on the damage of the attacks.
+
+    Args:
+        attacks: The attack values of the character, in increasing order.
+        HP: The full HP of the opponent.
+        precision: The chance of defeating the opponent before the first
+            attack number, or not after the last one, that is neglected.
+
+    Returns:
+        Tuple[int, int]: The first and last attack numbers to compute.
+    """
+    weakest, _, strongest = attacks
+    mean_attack = sum(attacks) / len(attacks)
+    # The damage of n attacks is within `margin` * sqrt(n) of its mean
+    # except with a probability below `precision`
+    margin = (strongest - weakest) * math.sqrt(math.log(1 / precision) / 2)
+    root = math.sqrt(margin**2 + 4 * mean_attack * HP)
+    first = math.floor(((root - margin) / (2 * mean_attack)) ** 2)
+    last = math.ceil(((root + margin) / (2 * mean_attack)) ** 2)
+    # No opponent is defeated while even the strongest attacks do not exceed
+    # its HP
+    first = max(first - 1, math.floor(HP / strongest) - 1, 0)
+    return first, last + 1
+
+
+def _standing_probabilities(
+    attack_numbers: np.ndarray,
+    attacks: Tuple[float, ...],
+    HP: float,
+    precision: float,
+    log_factorials: np.ndarray,
+) -> np.ndarray:
+    """
+    Compute the chance of an opponent still standing after several attack
+    numbers.
+
+    Args:
+        attack_numbers: The attack numbers, in increasing order.
+        attacks: The attack values of the character, in increasing order.
+        HP: The full HP of the opponent.
+        precision: The neglected probability of the uses of each attack.
+        log_factorials: The logarithm of the factorial of each number, up to
+            the last attack number.
+
+    Returns:
+        np.ndarray: The chance of the opponent still standing after each
+        attack number.
+    """
+    weakest, middle, strongest = attacks
+    attack_numbers = attack_numbers[:, None]
+
+    # Uses of the strongest attack, within reach of a third of the attacks
+    reach = math.ceil(
+        math.sqrt(math.log(2 / precision) / 2 * attack_numbers[-1, 0])
+    )
+    strongest_uses = attack_numbers // 3 + np.arange(-reach, reach + 1)
+    possible = (strongest_uses >= 0) & (strongest_uses <= attack_numbers)
+    strongest_uses = np.clip(strongest_uses, 0, attack_numbers)
+    other_attacks = attack_numbers - strongest_uses
+    strongest_probabilities = np.where(
+        possible,
+        np.exp(
+            log_factorials[attack_numbers]
+            - log_factorials[strongest_uses]
+            - log_factorials[other_attacks]
+            + strongest_uses * math.log(1 / 3)
+            + other_attacks * math.log(2 / 3)
+        ),
+        0.0,
+    )
+
+    # Most uses of the middle attack among the other attacks with which the
+    # opponent is still standing
+    def damage(middle_uses: np.ndarray) -> np.ndarray:
+        return (
+            weakest * (other_attacks - middle_uses)
+            + middle * middle_uses
+            + strongest * strongest_uses
+        )
+
+    if middle == weakest:
+        standing = (damage(0) <= HP).astype(float)
+    else:
+        middle_uses = np.floor((HP - damage(0)) / (middle - weakest)).clip(
+            -1, other_attacks
+        )
+        middle_uses = middle_uses.astype(np.int64)
+        middle_uses = np.where(
+            (middle_uses < other_attacks) & (damage(middle_uses + 1) <= HP),
+            middle_uses + 1,
+            middle_uses,
+        )
+        middle_uses = np.where(
+            (middle_uses >= 0) & (damage(middle_uses) > HP),
+            middle_uses - 1,
+            middle_uses,
+        )
+        standing = _binomial_half_cdf(
+            other_attacks, middle_uses, precision, log_factorials
+        )
+    # Normalized so the rounding errors of the probabilities do not add up
+    return (strongest_probabilities * standing).sum(
+        axis=1
+    ) / strongest_probabilities.sum(axis=1)
+
+
+def _binomial_half_cdf(
+    trials: np.ndarray,
+    successes: np.ndarray,
+    precision: float,
+    log_factorials: np.ndarray,
+) -> np.ndarray:
+    """
+    Compute the chance of at most a number of successes in a number of
+    trials with a success probability of one half, from a table of the
+    distribution function of every number of trials.
+
+    Args:
+        trials: The numbers of trials.
+        successes: The numbers of successes, of the same shape.
+        precision: The neglected probability of the numbers of successes
+            left out of the table.
+        log_factorials: The logarithm of the factorial of each number, up to
+            the largest number of trials.
+
+    Returns:
+        np.ndarray: The chance of each number of successes at most.
+    """
+    fewest_trials = int(trials.min())
+    table_trials = np.arange(fewest_trials, int(trials.max()) + 1)[:, None]
+    reach = math.ceil(
+        math.sqrt(math.log(2 / precision) / 2 * table_trials[-1, 0])
+    )
+    table_successes = table_trials // 2 + np.arange(-reach, reach + 1)
+    possible = (table_successes >= 0) & (table_successes <= table_trials)
+    table_successes = np.clip(table_successes, 0, table_trials)
+    table = np.cumsum(
+        np.where(
+            possible,
+            np.exp(
+                log_factorials[table_trials]
+                - log_factorials[table_successes]
+                - log_factorials[table_trials - table_successes]
+                - table_trials * math.log(2)
+            ),
+            0.0,
+        ),
+        axis=1,
+    )
+
+    column = successes - (trials // 2 - reach)
+    cdf = table[trials - fewest_trials, np.clip(column, 0, 2 * reach)]
+    cdf = np.where(column < 0, 0.0, cdf)
+    cdf = np.where(column > 2 * reach, 1.0, cdf)
+    cdf = np.where(successes < 0, 0.0, cdf)
+    return np.where(successes >= trials, 1.0, cdf)
+
+
+def _log_factorials(number: int) -> np.ndarray:
+    """
+    Compute the logarithm of the factorial of every number up to a number.
+
+    Args:
+        number: The largest number.
+
+    Returns:
+        np.ndarray: The logarithm of the factorial of each number, at its
+        index.
+    """
+    return np.array([math.lgamma(n + 1) for n in range(number + 1)])
@@ -0,0 +1,305 @@
+from typing import Dict, List, NamedTuple, Union
+
+import numpy as np
+
+from ..models import Team
+from ..utils import SimulationError
+from .duel_solver import solve_character_duel
+
+
+class MonteCarloResult(NamedTuple):
+    """
+    Aggregated results of a batch of simulated battles.
+    """
+
+    battles: int
+    team_1_wins: int
+    team_2_wins: int
+    round_counts: Dict[int, int]
+    kill_counts: Dict[str, List[int]]
+
+    @property
+    def team_1_win_rate(self) -> float:
+        return self.team_1_wins / self.battles
+
+    @property
+    def team_2_win_rate(self) -> float:
+        return self.team_2_wins / self.battles
+
+
+class MonteCarloEngine:
+    """
+    A headless engine that simulates many battles between two teams at once.
+
+    The HP and attack values of both teams are stored as NumPy arrays and every
+    battle of a batch advances in lockstep, following the same rules as
+    Battle._simulate_round: each round a random member of each team fights a
+    duel, Team 1 attacks first, attacks are chosen uniformly at random, the
+    loser is removed from its team and the winner recovers its full HP.
+
+    In analytic mode the moves of each duel are not simulated: its winner is
+    drawn from the exact win probabilities computed by the duel solver.
+    """
+
+    ###########################################################
+    # CLASS CONSTRUCTOR
+    ###########################################################
+
+    def __init__(
+        self,
+        team_1: Team,
+        team_2: Team,
+        seed: Union[int, None] = None,
+        max_moves_per_round: int = 100_000,
+        analytic: bool = False,
+    ) -> None:
+        """
+        Initialize a MonteCarloEngine instance.
+
+        Args:
+            team_1: The first team, already populated.
+            team_2: The second team, already populated.
+            seed: The seed of the random number generator.
+            max_moves_per_round: The number of moves after which a round is
+                considered endless.
+            analytic: Whether the winner of each duel is drawn from its exact
+                win probability instead of simulating its moves.
+
+        Raises:
+            SimulationError: In analytic mode, if a duel between two members
+                can never end.
+        """
+        self.team_1 = team_1
+        self.team_2 = team_2
+        self.rng = np.random.default_rng(seed)
+        self.max_moves_per_round = max_moves_per_round
+        self.HP_1, self.attacks_1 = self._team_arrays(team_1)
+        self.HP_2, self.attacks_2 = self._team_arrays(team_2)
+        self.win_probabilities = (
+            self._win_probabilities(team_1, team_2) if analytic else None
+        )
+
+    ###########################################################
+    # PUBLIC METHODS
+    ###########################################################
+
+    def run(self, battles: int, batch_size: int = 100_000) -> MonteCarloResult:
+        """
+        Simulate a number of independent battles.
+
+        Args:
+            battles: The number of battles to simulate.
+            batch_size: The maximum number of battles simulated in lockstep.
+
+        Returns:
+            MonteCarloResult: The aggregated results of the battles.
+
+        Raises:
+            SimulationError: If a round does not finish within `max_moves_per_round` moves.
+        """
+        team_1_wins = 0
+        round_counts = np.zeros(0, dtype=np.int64)
+        kills_1 = np.zeros(len(self.HP_1), dtype=np.int64)
+        kills_2 = np.zeros(len(self.HP_2), dtype=np.int64)
+
+        remaining = battles
+        while remaining > 0:
+            size = min(batch_size, remaining)
+            remaining -= size
+            (
+                batch_team_1_wins,
+                batch_rounds,
+                batch_kills_1,
+                batch_kills_2,
+            ) = self._simulate_batch(size)
+
+            team_1_wins += batch_team_1_wins
+            batch_round_counts = np.bincount(batch_rounds)
+            if len(batch_round_counts) > len(round_counts):
+                round_counts = np.pad(
+                    round_counts,
+                    (0, len(batch_round_counts) - len(round_counts)),
+                )
+            round_counts[: len(batch_round_counts)] += batch_round_counts
+            kills_1 += batch_kills_1
+            kills_2 += batch_kills_2
+
+        return MonteCarloResult(
+            battles=battles,
+            team_1_wins=team_1_wins,
+            team_2_wins=battles - team_1_wins,
+            round_counts={
+                rounds: int(count)
+                for rounds, count in enumerate(round_counts)
+                if count
+            },
+            kill_counts={
+                self.team_1.name: kills_1.tolist(),
+                self.team_2.name: kills_2.tolist(),
+            },
+        )
+
+    ###########################################################
+    # PRIVATE METHODS
+    ###########################################################
+
+    def _simulate_batch(self, size: int):
+        """
+        Simulate a batch of battles in lockstep.
+
+        Args:
+            size: The number of battles in the batch.
+
+        Returns:
+            The number of battles won by Team 1, the number of rounds of each
+            battle and the kills of each member of both teams.
+        """
+        alive_1 = np.ones((size, len(self.HP_1)), dtype=bool)
+        alive_2 = np.ones((size, len(self.HP_2)), dtype=bool)
+        rounds = np.zeros(size, dtype=np.int64)
+        kills_1 = np.zeros(len(self.HP_1), dtype=np.int64)
+        kills_2 = np.zeros(len(self.HP_2), dtype=np.int64)
+
+        active = np.arange(size)
+        while len(active) > 0:
+            fighter_1 = self._select_random_members(alive_1[active])
+            fighter_2 = self._select_random_members(alive_2[active])
+            if self.win_probabilities is not None:
+                team_1_won = self._sample_duels(fighter_1, fighter_2)
+            else:
+                team_1_won = self._simulate_duels(fighter_1, fighter_2)
+
+            winners_1 = active[team_1_won]
+            winners_2 = active[~team_1_won]
+            alive_2[winners_1, fighter_2[team_1_won]] = False
+            alive_1[winners_2, fighter_1[~team_1_won]] = False
+            np.add.at(kills_1, fighter_1[team_1_won], 1)
+            np.add.at(kills_2, fighter_2[~team_1_won], 1)
+            rounds[active] += 1
+
+            active = active[
+                alive_1[active].any(axis=1) & alive_2[active].any(axis=1)
+            ]
+
+        team_1_wins = int(alive_1.any(axis=1).sum())
+        return team_1_wins, rounds, kills_1, kills_2
+
+    def _simulate_duels(
+        self, fighter_1: np.ndarray, fighter_2: np.ndarray
+    ) -> np.ndarray:
+        """
+        Simulate one round of every active battle.
+
+        Args:
+            fighter_1: The index of the Team 1 member fighting in each battle.
+            fighter_2: The index of the Team 2 member fighting in each battle.
+
+        Returns:
+            np.ndarray: Whether the Team 1 member won each duel.
+        """
+        HP_1 = self.HP_1[fighter_1]
+        HP_2 = self.HP_2[fighter_2]
+        attacks_1 = self.attacks_1[fighter_1]
+        attacks_2 = self.attacks_2[fighter_2]
+        team_1_won = np.zeros(len(fighter_1), dtype=bool)
+
+        pending = np.arange(len(fighter_1))
+        for move_number in range(self.max_moves_per_round):
+            if len(pending) == 0:
+                return team_1_won
+
+            attack_types = self.rng.integers(0, 3, size=len(pending))
+            if move_number % 2 == 0:
+                HP_2[pending] -= attacks_1[pending, attack_types]
+                defeated = HP_2[pending] < 0
+                team_1_won[pending[defeated]] = True
+            else:
+                HP_1[pending] -= attacks_2[pending, attack_types]
+                defeated = HP_1[pending] < 0
+            pending = pending[~defeated]
+
+        if len(pending) > 0:
+            raise SimulationError(
+                f"Un round no terminó después de {self.max_moves_per_round}"
+                " movimientos."
+            )
+        return team_1_won
+
+    def _sample_duels(
+        self, fighter_1: np.ndarray, fighter_2: np.ndarray
+    ) -> np.ndarray:
+        """
+        Draw the winner of one round of every active battle from the exact
+        duel win probabilities.
+
+        Args:
+            fighter_1: The index of the Team 1 member fighting in each battle.
+            fighter_2: The index of the Team 2 member fighting in each battle.
+
+        Returns:
+            np.ndarray: Whether the Team 1 member won each duel.
+        """
+        return (
+            self.rng.random(len(fighter_1))
+            < self.win_probabilities[fighter_1, fighter_2]
+        )
+
+    ###########################################################
+    # AUXILIARY METHODS
+    ###########################################################
+
+    @staticmethod
+    def _win_probabilities(team_1: Team, team_2: Team) -> np.ndarray:
+        """
+        Build the matrix of duel win probabilities of Team 1 members.
+
+        Args:
+            team_1: The first team, already populated.
+            team_2: The second team, already populated.
+
+        Returns:
+            np.ndarray: The probability that each Team 1 member (row) defeats
+            each Team 2 member (column).
+        """
+        return np.array(
+            [
+                [
+                    solve_character_duel(
+                        member_1, member_2
+                    ).attacker_win_probability
+                    for member_2 in team_2.members
+                ]
+                for member_1 in team_1.members
+            ]
+        )
+
+    def _select_random_members(self, alive: np.ndarray) -> np.ndarray:
+        """
+        Select a random alive member in each battle.
+
+        Args:
+            alive: Whether each member is alive, one row per battle.
+
+        Returns:
+            np.ndarray: The index of the selected member in each battle.
+        """
+        scores = self.rng.random(alive.shape)
+        scores[~alive] = -1.0
+        return scores.argmax(axis=1)
+
+    @staticmethod
+    def _team_arrays(team: Team):
+        """
+        Build the HP and attack arrays of a team.
+
+        Args:
+            team: The team, already populated.
+
+        Returns:
+            The full HP of each member and its attack values, one row per member.
+        """
+        HP = np.array([member.max_HP for member in team.members])
+        attacks = np.array(
+            [list(member.attacks.values()) for member in team.members]
+        )
+        return HP, attacks
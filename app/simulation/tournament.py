@@ -0,0 +1,252 @@
+import itertools
+import multiprocessing
+import random
+from typing import Dict, Iterator, List, NamedTuple, Tuple, Union
+
+from ..config import TEAM_SIZE
+from ..models import Battle, Roster, Team
+from ..services import Character_Service
+from ..utils import SilentReporter
+
+CharacterData = Tuple[int, str, str, Dict[str, float]]
+
+
+class PairingResult(NamedTuple):
+    """
+    The results of all the battles played between two teams.
+    """
+
+    team_1: str
+    team_2: str
+    winners: List[str]
+
+
+class TournamentStanding:
+    """
+    The standing of a team in a tournament.
+    """
+
+    def __init__(self, name: str, rating: float) -> None:
+        """
+        Initialize a TournamentStanding instance.
+
+        Args:
+            name: The name of the team.
+            rating: The initial Elo rating of the team.
+        """
+        self.name = name
+        self.rating = rating
+        self.wins = 0
+        self.losses = 0
+
+    @property
+    def battles(self) -> int:
+        return self.wins + self.losses
+
+
+class Tournament:
+    """
+    A round-robin tournament between teams built from the Superhero API roster.
+
+    Every pairing of teams plays a number of battles. Pairings are distributed
+    across a process pool and their results are streamed back in a fixed order,
+    so standings and Elo ratings only depend on the tournament seed.
+    """
+
+    ###########################################################
+    # CLASS CONSTRUCTOR
+    ###########################################################
+
+    def __init__(
+        self,
+        team_count: int = 8,
+        battles_per_pairing: int = 10,
+        workers: Union[int, None] = None,
+        seed: Union[int, None] = None,
+        k_factor: float = 32,
+        initial_rating: float = 1500,
+        team_size: int = TEAM_SIZE,
+    ) -> None:
+        """
+        Initialize a Tournament instance.
+
+        Args:
+            team_count: The number of teams in the tournament.
+            battles_per_pairing: The number of battles played by each pair of teams.
+            workers: The number of worker processes. Defaults to the number of CPUs.
+            seed: The seed used to build the teams and to seed every battle.
+            k_factor: The K-factor of the Elo rating updates.
+            initial_rating: The Elo rating every team starts with.
+            team_size: The number of characters in each team.
+        """
+        self.team_count = team_count
+        self.battles_per_pairing = battles_per_pairing
+        self.workers = workers or multiprocessing.cpu_count()
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.k_factor = k_factor
+        self.initial_rating = initial_rating
+        self.team_size = team_size
+        self.rosters: Dict[str, List[CharacterData]] = {}
+        self.standings: Dict[str, TournamentStanding] = {}
+
+    ###########################################################
+    # PUBLIC METHODS
+    ###########################################################
+
+    def build_teams(self) -> None:
+        """
+        Draw distinct characters from the roster and group them into teams.
+
+        Returns:
+            None.
+
+        Raises:
+            CharacterDataFetchError: If the characters cannot be fetched.
+        """
+        rng = random.Random(self.seed)
+        character_ids = Roster().sample(self.team_count * self.team_size, rng)
+        characters_data = Character_Service.get_many_character_data(
+            character_ids
+        )
+
+        self.rosters = {}
+        self.standings = {}
+        for team_index in range(self.team_count):
+            name = f"Team {team_index + 1}"
+            start = team_index * self.team_size
+            end = start + self.team_size
+            self.rosters[name] = [
+                (character_id, *character_data)
+                for character_id, character_data in zip(
+                    character_ids[start:end], characters_data[start:end]
+                )
+            ]
+            self.standings[name] = TournamentStanding(name, self.initial_rating)
+
+    def run(self) -> Iterator[PairingResult]:
+        """
+        Play every pairing of the tournament, updating the standings as
+        results arrive.
+
+        Returns:
+            Iterator[PairingResult]: The results of each pairing, in pairing order.
+        """
+        if not self.rosters:
+            self.build_teams()
+
+        with multiprocessing.Pool(self.workers) as pool:
+            for result in pool.imap(
+                _play_pairing, self._generate_tasks(), chunksize=4
+            ):
+                self._record_pairing(result)
+                yield result
+
+    def play(self) -> List[TournamentStanding]:
+        """
+        Play the whole tournament.
+
+        Returns:
+            List[TournamentStanding]: The final standings, sorted by rating.
+        """
+        for _ in self.run():
+            pass
+        return self.ranking()
+
+    def ranking(self) -> List[TournamentStanding]:
+        """
+        Get the current standings sorted by rating.
+
+        Returns:
+            List[TournamentStanding]: The standings, best rated team first.
+        """
+        return sorted(
+            self.standings.values(),
+            key=lambda standing: standing.rating,
+            reverse=True,
+        )
+
+    ###########################################################
+    # PRIVATE METHODS
+    ###########################################################
+
+    def _generate_tasks(
+        self,
+    ) -> Iterator[
+        Tuple[str, str, List[CharacterData], List[CharacterData], List[int]]
+    ]:
+        """
+        Lazily generate one task per pairing of teams, with a deterministic
+        seed for each of its battles.
+
+        Returns:
+            Iterator: The teams of each pairing, their rosters and the battle seeds.
+        """
+        rng = random.Random(self.seed)
+        for team_1, team_2 in itertools.combinations(self.rosters, 2):
+            seeds = [
+                rng.randrange(2**32) for _ in range(self.battles_per_pairing)
+            ]
+            yield (
+                team_1,
+                team_2,
+                self.rosters[team_1],
+                self.rosters[team_2],
+                seeds,
+            )
+
+    def _record_pairing(self, result: PairingResult) -> None:
+        """
+        Update the standings and Elo ratings with the results of a pairing.
+
+        Args:
+            result: The results of the pairing.
+
+        Returns:
+            None.
+        """
+        for winner in result.winners:
+            loser = result.team_2 if winner == result.team_1 else result.team_1
+            winner_standing = self.standings[winner]
+            loser_standing = self.standings[loser]
+            expected = 1 / (
+                1
+                + 10 ** ((loser_standing.rating - winner_standing.rating) / 400)
+            )
+            change = self.k_factor * (1 - expected)
+            winner_standing.rating += change
+            loser_standing.rating -= change
+            winner_standing.wins += 1
+            loser_standing.losses += 1
+
+
+###########################################################
+# WORKERS
+###########################################################
+
+
+def _play_pairing(
+    task: Tuple[str, str, List[CharacterData], List[CharacterData], List[int]]
+) -> PairingResult:
+    """
+    Play all the battles of a pairing in a worker process. Teams swap sides
+    every battle, since Team 1 always attacks first in each round.
+
+    Args:
+        task: The teams of the pairing, their rosters and the battle seeds.
+
+    Returns:
+        PairingResult: The winner of each battle.
+    """
+    team_1, team_2, roster_1, roster_2, seeds = task
+    winners = []
+    for battle_number, seed in enumerate(seeds):
+        rng = random.Random(seed)
+        teams = (
+            Team.from_characters_data(team_1, roster_1, rng),
+            Team.from_characters_data(team_2, roster_2, rng),
+        )
+        if battle_number % 2 == 1:
+            teams = teams[::-1]
+        battle = Battle(*teams, reporter=SilentReporter(), log=False, seed=seed)
+        winners.append(battle.simulate().name)
+    return PairingResult(team_1, team_2, winners)
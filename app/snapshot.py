@@ -0,0 +1,25 @@
+import argparse
+from .services import Roster_Snapshot
+from .config import (
+    ROSTER_SNAPSHOT_PATH,
+    SUPERHERO_API_LAST_CHARACTER_ID,
+)
+
+if __name__ == "__main__":
+    # Download the whole Superhero API roster into a snapshot file
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-output",
+        nargs="?",
+        type=str,
+        default=ROSTER_SNAPSHOT_PATH,
+        help="Snapshot file path",
+    )
+    args = parser.parse_args()
+
+    print("Descargando personajes de Superhero API...")
+    count = Roster_Snapshot.download(
+        args.output,
+        range(1, SUPERHERO_API_LAST_CHARACTER_ID + 1),
+    )
+    print(f"Snapshot con {count} personajes guardado en {args.output}")
@@ -0,0 +1,43 @@
+import argparse
+import os
+from .config import ROSTER_SNAPSHOT_PATH, TEAM_SIZE
+from .services import Character_Service
+from .simulation import Tournament
+from .utils import print_header, print_tournament_standings
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-teams", type=int, default=8, help="Number of teams")
+    parser.add_argument(
+        "-battles", type=int, default=10, help="Battles per pairing"
+    )
+    parser.add_argument("-workers", type=int, help="Worker processes")
+    parser.add_argument("-seed", type=int, help="Tournament seed")
+    parser.add_argument(
+        "-team-size", type=int, default=TEAM_SIZE, help="Characters per team"
+    )
+    args = parser.parse_args()
+
+    # Serve characters from the roster snapshot if one has been downloaded
+    if os.path.exists(ROSTER_SNAPSHOT_PATH):
+        Character_Service.load_snapshot(ROSTER_SNAPSHOT_PATH)
+
+    # Play a round-robin tournament and print the final standings
+    tournament = Tournament(
+        team_count=args.teams,
+        battles_per_pairing=args.battles,
+        workers=args.workers,
+        team_size=args.team_size,
+        seed=args.seed,
+    )
+    print_header("TORNEO")
+    print(f"Semilla del torneo: {tournament.seed}")
+    tournament.build_teams()
+    for result in tournament.run():
+        print(
+            f"{result.team_1} v/s {result.team_2}: "
+            f"{result.winners.count(result.team_1)}"
+            f" - {result.winners.count(result.team_2)}"
+        )
+    print_header("POSICIONES")
+    print_tournament_standings(tournament.ranking())
@@ -6,6 +6,7 @@ from .exceptions import (
     SimulationError,
     EmailValidationError,
     EmailServiceError,
+    CircuitOpenError,
 )
 
 from .printers import (
@@ -19,6 +20,35 @@ from .printers import (
     print_move_details,
     print_move_results,
     print_battle_winner,
+    print_tournament_standings,
+)
+
+from .formatters import (
+    format_header,
+    format_subheader,
+    format_character_info,
+    format_team_stats,
+    format_intro_message,
+    format_round_details,
+    format_round_results,
+    format_move_details,
+    format_move_results,
+    format_battle_winner,
+    character_info_fields,
+    team_stats_fields,
+)
+
+from .reporters import (
+    EVENT_FIELDS,
+    ALL_EVENTS,
+    SILENT_EVENTS,
+    render_event,
+    Reporter,
+    SilentReporter,
+    ConsoleReporter,
+    BufferedReporter,
+    JsonLinesReporter,
+    MultiReporter,
 )
 
 from .html_generators import (
@@ -26,17 +56,37 @@ from .html_generators import (
     generate_html_footer,
     generate_html_battle_results_header,
     generate_html_round_details_table,
+    generate_html_round_details_table_header,
+    generate_html_round_details_row,
+    generate_html_round_details_table_footer,
     generate_html_winning_team,
+    generate_html_report,
+    write_html_report,
 )
 
 from .log_extractors import (
+    read_battle_records,
     extract_team_names,
     extract_round_details,
     extract_winning_team,
 )
 
 from .loggers import (
+    log_record,
     log_battle_teams,
     log_battle_winner,
     log_round_results,
+    battle_teams_record,
+    battle_winner_record,
+    round_results_record,
+)
+
+from .instrumentation import (
+    HOT_PATHS,
+    Instrumentation,
+)
+
+from .event_stream import (
+    EventRecorder,
+    EventReplay,
 )
@@ -0,0 +1,313 @@
+import mmap
+import struct
+import time
+from typing import Dict, Iterator, List, Tuple, Union
+
+from .reporters import Reporter
+
+###########################################################
+# RECORD FORMAT
+###########################################################
+
+# Recorded events, by code, and the layout of their fields: "n" is stored in
+# the number slot, "s" in the next string slot and "f" in the next value slot
+EVENT_LAYOUTS: Tuple[Tuple[str, str], ...] = (
+    ("round", "nsfsf"),
+    ("move", "nsssf"),
+    ("move_result", "sf"),
+    ("round_result", "ss"),
+    ("hp_reset", "sf"),
+    ("winner", "s"),
+)
+EVENT_CODES: Dict[str, int] = {
+    event: code for code, (event, _) in enumerate(EVENT_LAYOUTS)
+}
+
+MAGIC = b"SHEV"
+VERSION = 1
+# Magic, version and offset of the footer
+HEADER = struct.Struct("<4sHQ")
+# Event code, three string indexes, a number and two values
+RECORD = struct.Struct("<BxHHHIdd")
+
+
+class EventRecorder(Reporter):
+    """
+    A reporter that records the events of a battle to a binary file.
+
+    Every event is a fixed-width record, with its strings stored once in a
+    table at the end of the file, next to the offset of the first record of
+    each round. The recording can then be replayed, or read from any round,
+    with EventReplay.
+    """
+
+    events = frozenset(EVENT_CODES)
+
+    ###########################################################
+    # CLASS CONSTRUCTOR
+    ###########################################################
+
+    def __init__(self, path: str) -> None:
+        """
+        Initialize an EventRecorder instance.
+
+        Args:
+            path: The path of the recording file.
+        """
+        self.path = path
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0))
+        self._offset = HEADER.size
+        self._strings: Dict[str, int] = {}
+        self._round_offsets: List[int] = []
+
+    ###########################################################
+    # PUBLIC METHODS
+    ###########################################################
+
+    def report(self, event: str, data: tuple = ()) -> None:
+        if event == "round":
+            self._round_offsets.append(self._offset)
+
+        strings = [0, 0, 0]
+        number = 0
+        values = [0.0, 0.0]
+        string_slot = 0
+        value_slot = 0
+        for kind, value in zip(EVENT_LAYOUTS[EVENT_CODES[event]][1], data):
+            if kind == "n":
+                number = value
+            elif kind == "s":
+                strings[string_slot] = self._intern(value)
+                string_slot += 1
+            else:
+                values[value_slot] = value
+                value_slot += 1
+
+        self._file.write(
+            RECORD.pack(EVENT_CODES[event], *strings, number, *values)
+        )
+        self._offset += RECORD.size
+
+    def close(self) -> None:
+        """
+        Write the string table and the round index, and close the file.
+
+        Returns:
+            None.
+        """
+        if self._file.closed:
+            return
+        footer_offset = self._offset
+        self._file.write(struct.pack("<I", len(self._strings)))
+        for string in self._strings:
+            encoded = string.encode("utf-8")
+            self._file.write(struct.pack("<H", len(encoded)))
+            self._file.write(encoded)
+        self._file.write(struct.pack("<I", len(self._round_offsets)))
+        self._file.write(
+            struct.pack(f"<{len(self._round_offsets)}Q", *self._round_offsets)
+        )
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, footer_offset))
+        self._file.close()
+
+    ###########################################################
+    # AUXILIARY METHODS
+    ###########################################################
+
+    def _intern(self, string: str) -> int:
+        """
+        Get the index of a string in the string table, adding it if needed.
+
+        Args:
+            string: The string.
+
+        Returns:
+            int: The index of the string.
+        """
+        index = self._strings.get(string)
+        if index is None:
+            index = self._strings[string] = len(self._strings)
+        return index
+
+
+class EventReplay:
+    """
+    A battle recording made by EventRecorder, memory-mapped for reading.
+
+    Rounds are found through the round index, so reading from any round
+    takes the same time however long the battle was, and nothing is
+    simulated again.
+    """
+
+    ###########################################################
+    # CLASS CONSTRUCTOR
+    ###########################################################
+
+    def __init__(self, path: str) -> None:
+        """
+        Open a recording.
+
+        Args:
+            path: The path of the recording file.
+
+        Raises:
+            ValueError: If the file is not a complete recording of a
+                supported version.
+        """
+        self._file = open(path, "rb")
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, footer_offset = HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION or footer_offset == 0:
+            self.close()
+            raise ValueError(
+                f"{path} no es una grabación de batalla compatible."
+            )
+        self._end = footer_offset
+
+        offset = footer_offset
+        (string_count,) = struct.unpack_from("<I", self._data, offset)
+        offset += 4
+        self.strings: List[str] = []
+        for _ in range(string_count):
+            (length,) = struct.unpack_from("<H", self._data, offset)
+            offset += 2
+            self.strings.append(
+                bytes(self._data[offset : offset + length]).decode("utf-8")
+            )
+            offset += length
+        (round_count,) = struct.unpack_from("<I", self._data, offset)
+        offset += 4
+        self.round_offsets = struct.unpack_from(
+            f"<{round_count}Q", self._data, offset
+        )
+
+    def __len__(self) -> int:
+        return (self._end - HEADER.size) // RECORD.size
+
+    def __enter__(self) -> "EventReplay":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    ###########################################################
+    # PROPERTIES
+    ###########################################################
+
+    @property
+    def rounds(self) -> int:
+        return len(self.round_offsets)
+
+    ###########################################################
+    # PUBLIC METHODS
+    ###########################################################
+
+    def seek(self, round_number: int) -> int:
+        """
+        Find the first record of a round.
+
+        Args:
+            round_number: The number of the round, starting at 1.
+
+        Returns:
+            int: The offset of the record in the file.
+
+        Raises:
+            ValueError: If the battle has no such round.
+        """
+        if not 1 <= round_number <= self.rounds:
+            raise ValueError(
+                f"La batalla no tiene una ronda {round_number}, solo"
+                f" {self.rounds}."
+            )
+        return self.round_offsets[round_number - 1]
+
+    def events(self, from_round: int = 1) -> Iterator[Tuple[str, tuple]]:
+        """
+        Read the recorded events, from the start of a round to the end of
+        the battle.
+
+        Args:
+            from_round: The number of the first round to read.
+
+        Returns:
+            Iterator[Tuple[str, tuple]]: The type and the values of the fields
+            of each event, as listed in `EVENT_FIELDS`.
+
+        Raises:
+            ValueError: If the battle has no such round.
+        """
+        start = self.seek(from_round) if self.rounds else HEADER.size
+        for offset in range(start, self._end, RECORD.size):
+            yield self._decode(RECORD.unpack_from(self._data, offset))
+
+    def replay(
+        self,
+        reporter: Reporter,
+        from_round: int = 1,
+        speed: Union[float, None] = None,
+    ) -> None:
+        """
+        Send the recorded events to a reporter.
+
+        Args:
+            reporter: The sink of the events.
+            from_round: The number of the first round to replay.
+            speed: The rounds replayed per second. As fast as possible if
+                not provided.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If the battle has no such round.
+        """
+        next_round_at = time.monotonic()
+        for event, data in self.events(from_round):
+            if event == "round" and speed:
+                delay = next_round_at - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                next_round_at = max(next_round_at, time.monotonic()) + 1 / speed
+            if reporter.is_interested(event):
+                reporter.report(event, data)
+
+    def close(self) -> None:
+        """
+        Close the recording file.
+
+        Returns:
+            None.
+        """
+        self._data.close()
+        self._file.close()
+
+    ###########################################################
+    # AUXILIARY METHODS
+    ###########################################################
+
+    def _decode(self, record: tuple) -> Tuple[str, tuple]:
+        """
+        Decode a record into an event.
+
+        Args:
+            record: The unpacked fields of the record.
+
+        Returns:
+            Tuple[str, tuple]: The type and the values of the fields of the event.
+        """
+        code, *string_indexes, number, value_1, value_2 = record
+        event, layout = EVENT_LAYOUTS[code]
+        strings = iter(string_indexes)
+        values = iter((value_1, value_2))
+        data = []
+        for kind in layout:
+            if kind == "n":
+                data.append(number)
+            elif kind == "s":
+                data.append(self.strings[next(strings)])
+            else:
+                data.append(next(values))
+        return event, tuple(data)
@@ -1,3 +1,5 @@
+from requests.exceptions import RequestException
+
 ###########################################################
 # CUSTOM EXCEPTIONS
 ###########################################################
@@ -57,3 +59,11 @@ class EmailServiceError(Exception):
     """
 
     pass
+
+
+class CircuitOpenError(RequestException):
+    """
+    Exception raised when a request is refused because too many consecutive requests to the same API have failed.
+    """
+
+    pass
@@ -0,0 +1,302 @@
+from typing import Iterable, Tuple
+
+###########################################################
+# HEADER AND SUBHEADER FORMATTERS
+###########################################################
+
+
+def format_header(text: str) -> str:
+    """
+    Format a header.
+
+    Args:
+        text: The text of the header.
+
+    Returns:
+        str: The formatted header.
+    """
+    char_count = 100
+    text_length = len(text)
+    space = " " * ((char_count - text_length) // 2)
+    return "\n".join(
+        [
+            " ",
+            "*" * char_count,
+            space + text + space,
+            "*" * char_count,
+            " ",
+        ]
+    )
+
+
+def format_subheader(text: str) -> str:
+    """
+    Format a subheader.
+
+    Args:
+        text: The text of the subheader.
+
+    Returns:
+        str: The formatted subheader.
+    """
+    char_count = 100
+    return "\n".join(["-" * char_count, text, "-" * char_count])
+
+
+###########################################################
+# CHARACTER FORMATTERS
+###########################################################
+
+
+def format_character_info(
+    name: str,
+    id: int,
+    alignment: str,
+    AS: float,
+    FB: float,
+    HP: float,
+    stats: Iterable[Tuple[str, float]],
+    attacks: Iterable[Tuple[str, float]],
+) -> str:
+    """
+    Format detailed information about a character.
+
+    Args:
+        name: The name of the character.
+        id: The ID of the character.
+        alignment: The alignment of the character.
+        AS: The Actual Stamina of the character.
+        FB: The Filiation Coefficient of the character.
+        HP: The Health Points of the character.
+        stats: The name and value of each stat of the character.
+        attacks: The type and value of each attack of the character.
+
+    Returns:
+        str: The formatted character information.
+    """
+    lines = [
+        f" - {name}:",
+        f"    - ID: {id}",
+        f"    - Alignment: {alignment}",
+        f"    - AS (Actual Stamina): {AS:.2f}",
+        f"    - FB (Filiation Coefficient): {FB:.2f}",
+        f"    - HP (Health Points): {HP:.2f}",
+        f"    - Stats:",
+    ]
+    lines.extend(f"       - {stat}: {value:.2f}" for stat, value in stats)
+    lines.append(f"    - Attacks:")
+    lines.extend(
+        f"       - {attack_type}: {attack_value:.2f}"
+        for attack_type, attack_value in attacks
+    )
+    return "\n".join(lines)
+
+
+def character_info_fields(character: "Character") -> tuple:
+    """
+    Capture the fields of a character shown by `format_character_info`.
+
+    Args:
+        character: The character.
+
+    Returns:
+        tuple: The arguments of `format_character_info` for the character.
+    """
+    return (
+        character.name,
+        character.id,
+        character.alignment,
+        character.AS,
+        character.FB,
+        character.HP,
+        tuple(character.stats.items()),
+        tuple(character.attacks.items()),
+    )
+
+
+###########################################################
+# TEAM FORMATTERS
+###########################################################
+
+
+def format_team_stats(
+    name: str,
+    team_alignment: str,
+    members: Iterable[tuple],
+) -> str:
+    """
+    Format the statistics of a team.
+
+    Args:
+        name: The name of the team.
+        team_alignment: The alignment of the team.
+        members: The arguments of `format_character_info` for each member.
+
+    Returns:
+        str: The formatted team statistics.
+    """
+    lines = [
+        f"Team: {name}",
+        f"Team Alignment: {team_alignment}",
+        "Team Members:",
+    ]
+    lines.extend(format_character_info(*member) for member in members)
+    return "\n".join(lines)
+
+
+def team_stats_fields(team: "Team") -> tuple:
+    """
+    Capture the fields of a team shown by `format_team_stats`.
+
+    Args:
+        team: The team.
+
+    Returns:
+        tuple: The arguments of `format_team_stats` for the team.
+    """
+    return (
+        team.name,
+        team.team_alignment,
+        tuple(character_info_fields(member) for member in team.members),
+    )
+
+
+###########################################################
+# BATTLE FORMATTERS
+###########################################################
+
+
+def format_intro_message(team_count: int = 2, team_size: int = 5) -> str:
+    """
+    Format the introduction message for the battle.
+
+    Args:
+        team_count: The number of teams in the battle.
+        team_size: The number of characters in each team.
+
+    Returns:
+        str: The formatted introduction message.
+    """
+    teams = "dos" if team_count == 2 else str(team_count)
+    return "\n".join(
+        [
+            format_header("BIENVENIDO A SUPERHERO BATTLE"),
+            f"En este juego, se enfrentarán {teams} equipos de {team_size}"
+            " superhéroes cada uno.",
+            "El equipo vencedor será quien tenga al último (o últimos)"
+            " personajes en pie.",
+            "¡Que comience la batalla!",
+        ]
+    )
+
+
+def format_round_details(
+    round_number: int,
+    attacking_character_name: str,
+    attacking_character_HP: float,
+    defending_character_name: str,
+    defending_character_HP: float,
+) -> str:
+    """
+    Format the details of a round.
+
+    Args:
+        round_number: The number of the round.
+        attacking_character_name: The name of the attacking character.
+        attacking_character_HP: The HP of the attacking character.
+        defending_character_name: The name of the defending character.
+        defending_character_HP: The HP of the defending character.
+
+    Returns:
+        str: The formatted round details.
+    """
+    return (
+        f"ROUND {round_number} - {attacking_character_name} (HP:"
+        f" {attacking_character_HP:.2f}) v/s"
+        f" {defending_character_name} (HP: {defending_character_HP:.2f})"
+    )
+
+
+def format_round_results(
+    attacking_character_name: str,
+    defending_character_name: str,
+) -> str:
+    """
+    Format the results of a round.
+
+    Args:
+        attacking_character_name: The name of the winning character.
+        defending_character_name: The name of the defeated character.
+
+    Returns:
+        str: The formatted round results.
+    """
+    return (
+        f"{' '*7} {defending_character_name} ha sido derrotado. Ganador:"
+        f" {attacking_character_name}"
+    )
+
+
+def format_move_details(
+    move_number: int,
+    attacking_character_name: str,
+    defending_character_name: str,
+    attack_type: str,
+    attack_value: float,
+) -> str:
+    """
+    Format the details of a move in a round.
+
+    Args:
+        move_number: The number of the move.
+        attacking_character_name: The name of the attacking character.
+        defending_character_name: The name of the defending character.
+        attack_type: The type of attack.
+        attack_value: The value of the attack.
+
+    Returns:
+        str: The formatted move details.
+    """
+    return (
+        f"Move {move_number}: {attacking_character_name} ataca a"
+        f" {defending_character_name} con {attack_type} attack y causa"
+        f" {attack_value:.2f} de daño."
+    )
+
+
+def format_move_results(
+    defending_character_name: str,
+    defending_character_HP: float,
+) -> str:
+    """
+    Format the results of a move in a round.
+
+    Args:
+        defending_character_name: The name of the defending character.
+        defending_character_HP: The remaining HP of the defending character.
+
+    Returns:
+        str: The formatted move results.
+    """
+    return (
+        f"{' '*7} {defending_character_name} tiene"
+        f" {defending_character_HP:.2f} HP restantes."
+    )
+
+
+def format_battle_winner(team_name: str) -> str:
+    """
+    Format the winner of the battle.
+
+    Args:
+        team_name: The name of the winning team.
+
+    Returns:
+        str: The formatted battle winner.
+    """
+    return "\n".join(
+        [
+            format_header("RESULTADOS FIANLES"),
+            f"El equipo ganador es {team_name}.",
+        ]
+    )
@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import Dict, Iterable, Iterator, List, TextIO, Tuple
 
 ###########################################################
 # HTML GENERATORS
@@ -45,16 +45,13 @@ def generate_html_battle_results_header(team_1: str, team_2: str) -> str:
     Returns:
         str: The HTML header for the battle results.
     """
-    return (
-        f"<h1>Battle Results</h1>\n<h2>Team {team_1} v/s Team"
-        f" {team_2}</h2>\n"
-    )
+    return f"<h1>Battle Results</h1>\n<h2>{team_1} v/s {team_2}</h2>\n"
 
 
 def generate_html_round_details_table(
     round_details: List[
         Tuple[
-            str,
+            int,
             str,
             float,
             str,
@@ -73,33 +70,69 @@ def generate_html_round_details_table(
         str: The HTML table for the round details.
     """
 
-    table_header = (
+    return "".join(
+        [
+            generate_html_round_details_table_header(),
+            *(
+                generate_html_round_details_row(*round_detail)
+                for round_detail in round_details
+            ),
+            generate_html_round_details_table_footer(),
+        ]
+    )
+
+
+def generate_html_round_details_table_header() -> str:
+    """
+    Generate the opening of the HTML table for the round details.
+
+    Returns:
+        str: The opening tag and header row of the table.
+    """
+    return (
         "<table>\n<tr><th>Round</th><th>Member Team 1</th><th>Member Team"
         " 2</th><th>Winner</th></tr>\n"
     )
-    table_rows = ""
-
-    for round_detail in round_details:
-        (
-            round_number,
-            attacking_character,
-            attacking_character_hp,
-            defending_character,
-            defending_character_hp,
-            winner,
-        ) = round_detail
-        table_row = f"<tr><td>{round_number}</td>"
-        table_row += (
-            f"<td>{attacking_character} (HP: {attacking_character_hp})</td>"
-        )
-        table_row += (
-            f"<td>{defending_character} (HP:"
-            f" {defending_character_hp})</td><td>{winner}</td></tr>\n"
-        )
-        table_rows += table_row
-
-    table = f"{table_header}{table_rows}</table>\n"
-    return table
+
+
+def generate_html_round_details_row(
+    round_number: int,
+    attacking_character: str,
+    attacking_character_hp: float,
+    defending_character: str,
+    defending_character_hp: float,
+    winner: str,
+) -> str:
+    """
+    Generate the HTML table row of a round.
+
+    Args:
+        round_number: The number of the round.
+        attacking_character: The name of the character that attacked first.
+        attacking_character_hp: Its HP at the start of the round.
+        defending_character: The name of the character that defended first.
+        defending_character_hp: Its HP at the start of the round.
+        winner: The name of the winning character.
+
+    Returns:
+        str: The HTML table row of the round.
+    """
+    return (
+        f"<tr><td>{round_number}</td>"
+        f"<td>{attacking_character} (HP: {attacking_character_hp:.2f})</td>"
+        f"<td>{defending_character} (HP:"
+        f" {defending_character_hp:.2f})</td><td>{winner}</td></tr>\n"
+    )
+
+
+def generate_html_round_details_table_footer() -> str:
+    """
+    Generate the closing of the HTML table for the round details.
+
+    Returns:
+        str: The closing tag of the table.
+    """
+    return "</table>\n"
 
 
 def generate_html_winning_team(
@@ -114,4 +147,60 @@ def generate_html_winning_team(
     Returns:
         str: The HTML section for the winning team.
     """
-    return f"<h3>Winner: Team {winning_team}</h3>\n"
+    return f"<h3>Winner: {winning_team}</h3>\n"
+
+
+###########################################################
+# HTML REPORTS
+###########################################################
+
+
+def generate_html_report(log_records: Iterable[Dict]) -> Iterator[str]:
+    """
+    Generate an HTML report from battle log records, one chunk at a time.
+
+    The records are consumed as they are produced, so a report of any number
+    of battles only keeps the current record in memory.
+
+    Args:
+        log_records: The records of one or more battle logs, in order.
+
+    Returns:
+        Iterator[str]: The chunks of the HTML report.
+    """
+    yield generate_html_header()
+    for record in log_records:
+        record_type = record["type"]
+        if record_type == "round":
+            yield generate_html_round_details_row(
+                record["round"],
+                record["attacking_character"],
+                record["attacking_character_HP"],
+                record["defending_character"],
+                record["defending_character_HP"],
+                record["winner"],
+            )
+        elif record_type == "battle":
+            yield generate_html_battle_results_header(
+                record["team_1"], record["team_2"]
+            )
+            yield generate_html_round_details_table_header()
+        elif record_type == "winner":
+            yield generate_html_round_details_table_footer()
+            yield generate_html_winning_team(record["team"])
+    yield generate_html_footer()
+
+
+def write_html_report(log_records: Iterable[Dict], stream: TextIO) -> None:
+    """
+    Write an HTML report from battle log records to a file or buffer.
+
+    Args:
+        log_records: The records of one or more battle logs, in order.
+        stream: The file or buffer to write to.
+
+    Returns:
+        None.
+    """
+    for chunk in generate_html_report(log_records):
+        stream.write(chunk)
@@ -0,0 +1,255 @@
+import functools
+import importlib
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+###########################################################
+# INSTRUMENTED HOT PATHS
+###########################################################
+
+# Metric name, module, class (None for module functions) and attribute of
+# each instrumented call. Module functions are patched in the module that
+# calls them, since they are imported by name.
+HOT_PATHS: Tuple[Tuple[str, str, str, str], ...] = (
+    (
+        "character_service.get_character_data",
+        "app.services.character_service",
+        "Character_Service",
+        "get_character_data",
+    ),
+    (
+        "character_service.fetch_character_data",
+        "app.services.character_service",
+        "Character_Service",
+        "_fetch_character_data",
+    ),
+    ("team.populate_teams", "app.models.team", "Team", "populate_teams"),
+    ("battle.simulate_round", "app.models.battle", "Battle", "_simulate_round"),
+    ("battle.simulate_duel", "app.models.battle", "Battle", "_simulate_duel"),
+    (
+        "free_for_all_battle.simulate_round",
+        "app.models.free_for_all_battle",
+        "FreeForAllBattle",
+        "_simulate_round",
+    ),
+    ("console.report", "app.utils.reporters", "ConsoleReporter", "report"),
+    ("log.record", "app.models.battle", None, "log_record"),
+    (
+        "email_service.send_email",
+        "app.services.email_service",
+        "Email_Service",
+        "_send_email",
+    ),
+)
+
+METRIC_PREFIX = "superhero_battle"
+
+
+class Instrumentation:
+    """
+    Opt-in timers and counters around the hot paths of the simulation.
+
+    Nothing is measured until `enable` is called: it wraps the calls listed
+    in `HOT_PATHS` in place, and `disable` restores the original ones, so the
+    simulation runs the unmodified code when instrumentation is off.
+    """
+
+    timers: Dict[str, List[float]] = {}  # name -> [calls, seconds, max seconds]
+    counters: Dict[str, int] = {}
+    _patches: List[Tuple[object, str, object]] = []
+    _lock = threading.Lock()
+
+    ###########################################################
+    # PUBLIC METHODS
+    ###########################################################
+
+    @classmethod
+    def enable(
+        cls, hot_paths: Tuple[Tuple[str, str, str, str], ...] = HOT_PATHS
+    ) -> None:
+        """
+        Start timing the given calls.
+
+        Args:
+            hot_paths: The metric name, module, class and attribute of each
+                call to time.
+
+        Returns:
+            None.
+        """
+        if cls._patches:
+            return
+        for name, module_name, class_name, attribute in hot_paths:
+            owner = importlib.import_module(module_name)
+            if class_name is not None:
+                owner = getattr(owner, class_name)
+            original = vars(owner)[attribute]
+            if isinstance(original, (classmethod, staticmethod)):
+                wrapped = type(original)(cls._timed(name, original.__func__))
+            else:
+                wrapped = cls._timed(name, original)
+            setattr(owner, attribute, wrapped)
+            cls._patches.append((owner, attribute, original))
+
+    @classmethod
+    def disable(cls) -> None:
+        """
+        Stop timing calls, restoring the original ones. Recorded metrics are kept.
+
+        Returns:
+            None.
+        """
+        while cls._patches:
+            owner, attribute, original = cls._patches.pop()
+            setattr(owner, attribute, original)
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return bool(cls._patches)
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Discard every recorded metric.
+
+        Returns:
+            None.
+        """
+        with cls._lock:
+            cls.timers.clear()
+            cls.counters.clear()
+
+    @classmethod
+    def count(cls, name: str, value: int = 1) -> None:
+        """
+        Increase a counter.
+
+        Args:
+            name: The name of the counter.
+            value: The amount to add.
+
+        Returns:
+            None.
+        """
+        with cls._lock:
+            cls.counters[name] = cls.counters.get(name, 0) + value
+
+    @classmethod
+    def record(cls, name: str, seconds: float) -> None:
+        """
+        Record the duration of one call.
+
+        Args:
+            name: The name of the timer.
+            seconds: The duration of the call.
+
+        Returns:
+            None.
+        """
+        with cls._lock:
+            timer = cls.timers.get(name)
+            if timer is None:
+                cls.timers[name] = [1, seconds, seconds]
+            else:
+                timer[0] += 1
+                timer[1] += seconds
+                if seconds > timer[2]:
+                    timer[2] = seconds
+
+    @classmethod
+    def summary(cls) -> str:
+        """
+        Format the recorded metrics as a table. Times are inclusive, so a call
+        made inside another timed call is counted in both.
+
+        Returns:
+            str: The timers, slowest total first, followed by the counters.
+        """
+        lines = [
+            f"{'Medicion':<42}{'Llamadas':>10}{'Total (s)':>12}"
+            f"{'Media (ms)':>12}{'Max (ms)':>12}"
+        ]
+        for name, (calls, seconds, max_seconds) in sorted(
+            cls.timers.items(), key=lambda item: item[1][1], reverse=True
+        ):
+            lines.append(
+                f"{name:<42}{calls:>10}{seconds:>12.4f}"
+                f"{seconds / calls * 1000:>12.4f}{max_seconds * 1000:>12.4f}"
+            )
+        for name, value in sorted(cls.counters.items()):
+            lines.append(f"{name:<42}{value:>10}")
+        return "\n".join(lines)
+
+    @classmethod
+    def to_prometheus(cls) -> str:
+        """
+        Format the recorded metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The timers as summaries and the counters as counters.
+        """
+        seconds_metric = f"{METRIC_PREFIX}_call_seconds"
+        lines = [
+            f"# HELP {seconds_metric} Time spent in instrumented calls.",
+            f"# TYPE {seconds_metric} summary",
+        ]
+        for name, (calls, seconds, _) in sorted(cls.timers.items()):
+            lines.append(f'{seconds_metric}_count{{name="{name}"}} {calls}')
+            lines.append(f'{seconds_metric}_sum{{name="{name}"}} {seconds!r}')
+        max_metric = f"{METRIC_PREFIX}_call_max_seconds"
+        lines.append(f"# HELP {max_metric} Slowest instrumented call.")
+        lines.append(f"# TYPE {max_metric} gauge")
+        for name, (_, _, max_seconds) in sorted(cls.timers.items()):
+            lines.append(f'{max_metric}{{name="{name}"}} {max_seconds!r}')
+        events_metric = f"{METRIC_PREFIX}_events_total"
+        lines.append(f"# HELP {events_metric} Instrumented event counters.")
+        lines.append(f"# TYPE {events_metric} counter")
+        for name, value in sorted(cls.counters.items()):
+            lines.append(f'{events_metric}{{name="{name}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def write_prometheus(cls, path: str) -> None:
+        """
+        Write the recorded metrics to a Prometheus text file.
+
+        Args:
+            path: The path of the file.
+
+        Returns:
+            None.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(cls.to_prometheus())
+
+    ###########################################################
+    # AUXILIARY METHODS
+    ###########################################################
+
+    @classmethod
+    def _timed(cls, name: str, function: Callable) -> Callable:
+        """
+        Wrap a function to record the duration of its calls, and count the
+        calls that raise an exception.
+
+        Args:
+            name: The name of the timer.
+            function: The function to wrap.
+
+        Returns:
+            Callable: The wrapped function.
+        """
+
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            except Exception:
+                cls.count(f"{name}.errors")
+                raise
+            finally:
+                cls.record(name, time.perf_counter() - start)
+
+        return timed
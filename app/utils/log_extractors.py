@@ -1,5 +1,26 @@
-import re
-from typing import List, Tuple
+import json
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+###########################################################
+# LOG READERS
+###########################################################
+
+
+def read_battle_records(log_path: str) -> Iterator[Dict]:
+    """
+    Stream the records of a battle log, one at a time.
+
+    Args:
+        log_path: The path of the battle log.
+
+    Returns:
+        Iterator[Dict]: The records of the log, in order.
+    """
+    with open(log_path, "r", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
 
 ###########################################################
 # LOG EXTRACTORS
@@ -7,81 +28,60 @@ from typing import List, Tuple
 
 
 def extract_team_names(
-    log_content: List[str],
+    log_records: Iterable[Dict],
 ) -> Tuple[str, str]:
     """
-    Extract the team names from the battle log content.
+    Extract the team names from the battle log records.
 
     Args:
-        log_content: The content of the battle log.
+        log_records: The records of the battle log.
 
     Returns:
         Tuple[str, str]: The names of the two teams.
     """
-    team_line = log_content[0].strip()
-    team_1, team_2 = re.findall(r"TEAM (\d+)", team_line)
-    return team_1, team_2
+    for record in log_records:
+        if record["type"] == "battle":
+            return record["team_1"], record["team_2"]
 
 
 def extract_round_details(
-    log_content: List[str],
-) -> List[Tuple[str, str, str, str, str, str]]:
+    log_records: Iterable[Dict],
+) -> List[Tuple[int, str, float, str, float, str]]:
     """
-    Extract the round details from the battle log content.
+    Extract the round details from the battle log records.
 
     Args:
-        log_content: The content of the battle log.
+        log_records: The records of the battle log.
 
     Returns:
-        List[Tuple[str, str, str, str, str, str]]: A list of tuples containing the round details.
+        List[Tuple[int, str, float, str, float, str]]: A list of tuples containing the round details.
     """
-    round_lines = log_content[1:-1]  # Exclude the first and last lines
-    round_details = []
-
-    for line in round_lines:
-        round_match = re.search(
-            (
-                r"ROUND (\d+) - (.+?) \(HP: ([\d.]+)\) v/s (.+?) \(HP:"
-                r" ([\d.]+)\) - GANADOR: (.+)"
-            ),
-            line,
-        )
-        round_number = round_match.group(1)
-        attacking_character = round_match.group(2)
-        attacking_character_hp = round_match.group(3)
-        defending_character = round_match.group(4)
-        defending_character_hp = round_match.group(5)
-        winner = round_match.group(6)
-        round_details.append(
-            (
-                round_number,
-                attacking_character,
-                attacking_character_hp,
-                defending_character,
-                defending_character_hp,
-                winner,
-            )
+    return [
+        (
+            record["round"],
+            record["attacking_character"],
+            record["attacking_character_HP"],
+            record["defending_character"],
+            record["defending_character_HP"],
+            record["winner"],
         )
-
-    return round_details
+        for record in log_records
+        if record["type"] == "round"
+    ]
 
 
 def extract_winning_team(
-    log_content: List[str],
+    log_records: Iterable[Dict],
 ) -> str:
     """
-    Extract the winning team from the battle log content.
+    Extract the winning team from the battle log records.
 
     Args:
-        log_content: The content of the battle log.
+        log_records: The records of the battle log.
 
     Returns:
         str: The winning team.
     """
-    winner_line = log_content[-1].strip()
-    winner_match = re.search(
-        r"GANADOR: TEAM (\d+)",
-        winner_line,
-    )
-    winning_team = winner_match.group(1)
-    return winning_team
+    for record in log_records:
+        if record["type"] == "winner":
+            return record["team"]
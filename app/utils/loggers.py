@@ -1,22 +1,44 @@
+import json
 import logging
+from typing import Dict
+
+from ..config import BATTLE_LOGGER_NAME
 
 ###########################################################
 # BATTLE LOGGERS
 ###########################################################
 
+# Every log line is a JSON record with a "type" field: one "battle" record,
+# one "round" record per round and one "winner" record.
+battle_logger = logging.getLogger(BATTLE_LOGGER_NAME)
+
+
+def log_record(record: Dict) -> None:
+    """
+    Write a record to the battle log.
+
+    Args:
+        record: The record, as built by the record functions below.
+
+    Returns:
+        None.
+    """
+    battle_logger.info(json.dumps(record, ensure_ascii=False))
+
 
-def log_battle_teams(team_1: "Team", team_2: "Team") -> None:
+def log_battle_teams(team_1: "Team", team_2: "Team", seed: int) -> None:
     """
-    Log the teams participating in the battle.
+    Log the teams participating in the battle and the seed to replay it.
 
     Args:
         team_1: The first team.
         team_2: The second team.
+        seed: The seed of the battle RNG.
 
     Returns:
         None.
     """
-    logging.info(f"{team_1.name.upper()} v/s {team_2.name.upper()}")
+    log_record(battle_teams_record(team_1, team_2, seed))
 
 
 def log_battle_winner(
@@ -31,22 +53,110 @@ def log_battle_winner(
         None.
 
     """
-    logging.info(f"GANADOR: {winner_team.name.upper()}")
+    log_record(battle_winner_record(winner_team))
 
 
 def log_round_results(
-    round_details: str,
-    attacking_character: "Character",
+    round_number: int,
+    attacking_character_name: str,
+    attacking_character_HP: float,
+    defending_character_name: str,
+    defending_character_HP: float,
+    winner_name: str,
 ) -> None:
     """
     Log the results of a round.
 
     Args:
-        round_details: The details of the round.
-        attacking_character: The attacking character.
+        round_number: The number of the round.
+        attacking_character_name: The name of the character that attacked first.
+        attacking_character_HP: Its HP at the start of the round.
+        defending_character_name: The name of the character that defended first.
+        defending_character_HP: Its HP at the start of the round.
+        winner_name: The name of the winning character.
 
     Returns:
         None.
 
     """
-    logging.info(f"{round_details} - GANADOR: {attacking_character.name}")
+    log_record(
+        round_results_record(
+            round_number,
+            attacking_character_name,
+            attacking_character_HP,
+            defending_character_name,
+            defending_character_HP,
+            winner_name,
+        )
+    )
+
+
+###########################################################
+# BATTLE LOG RECORDS
+###########################################################
+
+
+def battle_teams_record(team_1: "Team", team_2: "Team", seed: int) -> Dict:
+    """
+    Build the record of the teams participating in the battle.
+
+    Args:
+        team_1: The first team.
+        team_2: The second team.
+        seed: The seed of the battle RNG.
+
+    Returns:
+        Dict: The "battle" record.
+    """
+    return {
+        "type": "battle",
+        "team_1": team_1.name,
+        "team_2": team_2.name,
+        "seed": seed,
+    }
+
+
+def battle_winner_record(winner_team: "Team") -> Dict:
+    """
+    Build the record of the winner of the battle.
+
+    Args:
+        winner_team: The winning team.
+
+    Returns:
+        Dict: The "winner" record.
+    """
+    return {"type": "winner", "team": winner_team.name}
+
+
+def round_results_record(
+    round_number: int,
+    attacking_character_name: str,
+    attacking_character_HP: float,
+    defending_character_name: str,
+    defending_character_HP: float,
+    winner_name: str,
+) -> Dict:
+    """
+    Build the record of the results of a round.
+
+    Args:
+        round_number: The number of the round.
+        attacking_character_name: The name of the character that attacked first.
+        attacking_character_HP: Its HP at the start of the round.
+        defending_character_name: The name of the character that defended first.
+        defending_character_HP: Its HP at the start of the round.
+        winner_name: The name of the winning character.
+
+    Returns:
+        Dict: The "round" record.
+    """
+    return {
+        "type": "round",
+        "round": round_number,
+        "attacking_character": attacking_character_name,
+        "attacking_character_HP": attacking_character_HP,
+        "defending_character": defending_character_name,
+        "defending_character_HP": defending_character_HP,
+        "winner": winner_name,
+    }
@@ -1,3 +1,18 @@
+from .formatters import (
+    format_header,
+    format_subheader,
+    format_character_info,
+    format_team_stats,
+    format_intro_message,
+    format_round_details,
+    format_round_results,
+    format_move_details,
+    format_move_results,
+    format_battle_winner,
+    character_info_fields,
+    team_stats_fields,
+)
+
 ###########################################################
 # HEADER AND SUBHEADER PRINTERS
 ###########################################################
@@ -10,14 +25,7 @@ def print_header(text) -> None:
     Returns:
         None.
     """
-    char_count = 100
-    text_length = len(text)
-    space = " " * ((char_count - text_length) // 2)
-    print(" ")
-    print("*" * char_count)
-    print(space + text + space)
-    print("*" * char_count)
-    print(" ")
+    print(format_header(text))
 
 
 def print_subheader(text) -> None:
@@ -27,10 +35,7 @@ def print_subheader(text) -> None:
     Returns:
         None.
     """
-    char_count = 100
-    print("-" * char_count)
-    print(text)
-    print("-" * char_count)
+    print(format_subheader(text))
 
 
 ###########################################################
@@ -47,24 +52,7 @@ def print_character_info(
     Returns:
         None.
     """
-    print(f" - {character.name}:")
-    print(f"    - ID: {character.id}")
-    print(f"    - Alignment: {character.alignment}")
-    print(f"    - AS (Actual Stamina): {character.AS:.2f}")
-    print(f"    - FB (Filiation Coefficient): {character.FB:.2f}")
-    print(f"    - HP (Health Points): {character.HP:.2f}")
-    print(f"    - Stats:")
-    for (
-        stat,
-        value,
-    ) in character.stats.items():
-        print(f"       - {stat}: {value:.2f}")
-    print(f"    - Attacks:")
-    for (
-        attack_type,
-        attack_value,
-    ) in character.attacks.items():
-        print(f"       - {attack_type}: {attack_value:.2f}")
+    print(format_character_info(*character_info_fields(character)))
 
 
 ###########################################################
@@ -79,11 +67,7 @@ def print_team_stats(team: "Team") -> None:
     Returns:
         None.
     """
-    print(f"Team: {team.name}")
-    print(f"Team Alignment: {team.team_alignment}")
-    print("Team Members:")
-    for member in team.members:
-        print_character_info(member)
+    print(format_team_stats(*team_stats_fields(team)))
 
 
 ###########################################################
@@ -91,23 +75,18 @@ def print_team_stats(team: "Team") -> None:
 ###########################################################
 
 
-def print_intro_message() -> None:
+def print_intro_message(team_count: int = 2, team_size: int = 5) -> None:
     """
     Print the introduction message for the battle.
 
+    Args:
+        team_count: The number of teams in the battle.
+        team_size: The number of characters in each team.
+
     Returns:
         None.
     """
-    print_header("BIENVENIDO A SUPERHERO BATTLE")
-    print(
-        "En este juego, se enfrentarán dos equipos de 5 superhéroes cada"
-        " uno."
-    )
-    print(
-        "El equipo vencedor será quien tenga al último (o últimos)"
-        " personajes en pie."
-    )
-    print("¡Que comience la batalla!")
+    print(format_intro_message(team_count, team_size))
 
 
 def print_and_return_round_details(
@@ -126,10 +105,12 @@ def print_and_return_round_details(
     Returns:
         The formatted round details string.
     """
-    round_details = (
-        f"ROUND {round_number} - {attacking_character.name} (HP:"
-        f" {attacking_character.HP:.2f}) v/s"
-        f" {defending_character.name} (HP: {defending_character.HP:.2f})"
+    round_details = format_round_details(
+        round_number,
+        attacking_character.name,
+        attacking_character.HP,
+        defending_character.name,
+        defending_character.HP,
     )
     print_subheader(round_details)
     return round_details
@@ -150,8 +131,7 @@ def print_round_results(
         None.
     """
     print(
-        f"{' '*7} {defending_character.name} ha sido derrotado. Ganador:"
-        f" {attacking_character.name}"
+        format_round_results(attacking_character.name, defending_character.name)
     )
 
 
@@ -175,12 +155,15 @@ def print_move_details(
     Returns:
         None.
     """
-    move_details = (
-        f"Move {move_number}: {attacking_character.name} ataca a"
-        f" {defending_character.name} con {attack_type} attack y causa"
-        f" {attack_value:.2f} de daño."
+    print(
+        format_move_details(
+            move_number,
+            attacking_character.name,
+            defending_character.name,
+            attack_type,
+            attack_value,
+        )
     )
-    print(move_details)
 
 
 def print_move_results(
@@ -195,10 +178,7 @@ def print_move_results(
     Returns:
         None.
     """
-    print(
-        f"{' '*7} {defending_character.name} tiene"
-        f" {defending_character.HP:.2f} HP restantes."
-    )
+    print(format_move_results(defending_character.name, defending_character.HP))
 
 
 def print_battle_winner(
@@ -213,5 +193,32 @@ def print_battle_winner(
     Returns:
         None.
     """
-    print_header("RESULTADOS FIANLES")
-    print(f"El equipo ganador es {team.name}.")
+    print(format_battle_winner(team.name))
+
+
+###########################################################
+# TOURNAMENT PRINTERS
+###########################################################
+
+
+def print_tournament_standings(
+    standings: "List[TournamentStanding]",
+) -> None:
+    """
+    Print the standings of a tournament.
+
+    Args:
+        standings: The standings of the teams, sorted by rating.
+
+    Returns:
+        None.
+    """
+    print_subheader(
+        f"{'#':>3}  {'Equipo':<20}{'Batallas':>10}{'Victorias':>11}"
+        f"{'Derrotas':>10}{'Elo':>10}"
+    )
+    for position, standing in enumerate(standings, start=1):
+        print(
+            f"{position:>3}  {standing.name:<20}{standing.battles:>10}"
+            f"{standing.wins:>11}{standing.losses:>10}{standing.rating:>10.1f}"
+        )
@@ -0,0 +1,266 @@
+import json
+import sys
+from typing import Dict, FrozenSet, Iterable, Iterator, List, TextIO, Tuple
+
+from .formatters import (
+    format_header,
+    format_team_stats,
+    format_intro_message,
+    format_round_details,
+    format_subheader,
+    format_round_results,
+    format_move_details,
+    format_move_results,
+    format_battle_winner,
+)
+
+###########################################################
+# BATTLE EVENTS
+###########################################################
+
+# Fields carried by each event, in order. Event data is always captured as
+# plain values so that it can be rendered long after the event happened.
+EVENT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "intro": ("team_count", "team_size"),
+    "header": ("text",),
+    "message": ("text",),
+    "team": ("name", "team_alignment", "members"),
+    "round": (
+        "round_number",
+        "attacking_character",
+        "attacking_character_HP",
+        "defending_character",
+        "defending_character_HP",
+    ),
+    "move": (
+        "move_number",
+        "attacking_character",
+        "defending_character",
+        "attack_type",
+        "attack_value",
+    ),
+    "move_result": ("defending_character", "defending_character_HP"),
+    "round_result": ("attacking_character", "defending_character"),
+    "hp_reset": ("character", "character_HP"),
+    "winner": ("team",),
+}
+
+ALL_EVENTS: FrozenSet[str] = frozenset(EVENT_FIELDS)
+
+# Events with no console text, only kept by the reporters recording them
+SILENT_EVENTS: FrozenSet[str] = frozenset({"hp_reset"})
+
+
+def render_event(event: str, data: tuple) -> str:
+    """
+    Render an event as the text shown in the console.
+
+    Args:
+        event: The type of the event.
+        data: The values of the event fields.
+
+    Returns:
+        str: The rendered event.
+    """
+    if event == "intro":
+        return format_intro_message(*data)
+    if event == "header":
+        return format_header(*data)
+    if event == "team":
+        return format_team_stats(*data)
+    if event == "round":
+        return format_subheader(format_round_details(*data))
+    if event == "move":
+        return format_move_details(*data)
+    if event == "move_result":
+        return format_move_results(*data)
+    if event == "round_result":
+        return format_round_results(*data)
+    if event == "winner":
+        return format_battle_winner(*data)
+    return data[0]
+
+
+###########################################################
+# REPORTERS
+###########################################################
+
+
+class Reporter:
+    """
+    Base class for the sinks of battle events. It ignores every event.
+
+    Producers check `is_interested` before building the data of an event, so
+    events nobody listens to cost a single set lookup.
+    """
+
+    events: FrozenSet[str] = frozenset()
+
+    def is_interested(self, event: str) -> bool:
+        """
+        Check if the reporter wants to receive an event type.
+
+        Args:
+            event: The type of the event.
+
+        Returns:
+            bool: True if the reporter handles the event, False otherwise.
+        """
+        return event in self.events
+
+    def report(self, event: str, data: tuple = ()) -> None:
+        """
+        Receive an event.
+
+        Args:
+            event: The type of the event.
+            data: The values of the event fields, as listed in `EVENT_FIELDS`.
+
+        Returns:
+            None.
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Release the resources held by the reporter.
+
+        Returns:
+            None.
+        """
+        pass
+
+
+class SilentReporter(Reporter):
+    """
+    A reporter that discards every event.
+    """
+
+    pass
+
+
+class ConsoleReporter(Reporter):
+    """
+    A reporter that prints events to the console as they happen.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO = None,
+        events: Iterable[str] = ALL_EVENTS,
+    ) -> None:
+        """
+        Initialize a ConsoleReporter instance.
+
+        Args:
+            stream: The stream to print to. Defaults to the standard output.
+            events: The event types to print.
+        """
+        self.stream = stream
+        self.events = frozenset(events) - SILENT_EVENTS
+
+    def report(self, event: str, data: tuple = ()) -> None:
+        print(render_event(event, data), file=self.stream or sys.stdout)
+
+
+class BufferedReporter(Reporter):
+    """
+    A reporter that keeps events in memory and renders them only on demand.
+    """
+
+    def __init__(self, events: Iterable[str] = ALL_EVENTS) -> None:
+        """
+        Initialize a BufferedReporter instance.
+
+        Args:
+            events: The event types to keep.
+        """
+        self.events = frozenset(events)
+        self.records: List[Tuple[str, tuple]] = []
+
+    def report(self, event: str, data: tuple = ()) -> None:
+        self.records.append((event, data))
+
+    def render(self) -> Iterator[str]:
+        """
+        Render the buffered events.
+
+        Returns:
+            Iterator[str]: The rendered text of each event.
+        """
+        for event, data in self.records:
+            if event not in SILENT_EVENTS:
+                yield render_event(event, data)
+
+    def flush(self, stream: TextIO = None) -> None:
+        """
+        Write the buffered events to a stream and empty the buffer.
+
+        Args:
+            stream: The stream to write to. Defaults to the standard output.
+
+        Returns:
+            None.
+        """
+        stream = stream or sys.stdout
+        for text in self.render():
+            stream.write(text)
+            stream.write("\n")
+        self.records.clear()
+
+
+class JsonLinesReporter(Reporter):
+    """
+    A reporter that writes each event as a JSON object on its own line.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        events: Iterable[str] = ALL_EVENTS,
+    ) -> None:
+        """
+        Initialize a JsonLinesReporter instance.
+
+        Args:
+            stream: The stream to write to.
+            events: The event types to write.
+        """
+        self.stream = stream
+        self.events = frozenset(events)
+
+    def report(self, event: str, data: tuple = ()) -> None:
+        record = {"event": event}
+        record.update(zip(EVENT_FIELDS[event], data))
+        self.stream.write(json.dumps(record, ensure_ascii=False))
+        self.stream.write("\n")
+
+    def close(self) -> None:
+        self.stream.flush()
+
+
+class MultiReporter(Reporter):
+    """
+    A reporter that forwards each event to the reporters interested in it.
+    """
+
+    def __init__(self, *reporters: Reporter) -> None:
+        """
+        Initialize a MultiReporter instance.
+
+        Args:
+            reporters: The reporters to forward the events to.
+        """
+        self.reporters = reporters
+        self.events = frozenset().union(
+            *(reporter.events for reporter in reporters)
+        )
+
+    def report(self, event: str, data: tuple = ()) -> None:
+        for reporter in self.reporters:
+            if reporter.is_interested(event):
+                reporter.report(event, data)
+
+    def close(self) -> None:
+        for reporter in self.reporters:
+            reporter.close()
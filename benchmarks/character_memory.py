@@ -0,0 +1,159 @@
+import random
+import timeit
+import tracemalloc
+from typing import Callable, Dict
+
+from app.models import Character
+
+###########################################################
+# REFERENCE IMPLEMENTATION
+###########################################################
+
+
+class DictCharacter:
+    """
+    The dictionary-based Character layout, kept as a baseline for comparison.
+    """
+
+    ATTACK_TYPES = {
+        "mental": {"intelligence": 0.7, "speed": 0.2, "combat": 0.1},
+        "strong": {"strength": 0.6, "power": 0.2, "combat": 0.2},
+        "fast": {"speed": 0.55, "durability": 0.25, "strength": 0.2},
+    }
+
+    def __init__(self, id, name, alignment, base_stats, rng):
+        self.id = id
+        self.name = name
+        self.base_stats = base_stats
+        self.alignment = alignment
+        self.rng = rng
+        self.AS = rng.randint(0, 10)
+        self.FB = None
+        self.stats = None
+        self.HP = None
+        self.max_HP = None
+        self.attacks = None
+
+    def init_FB_stats_HP_and_attacks(self, team_alignment):
+        if self.alignment == team_alignment:
+            self.FB = 1 + self.rng.randint(0, 9)
+        else:
+            self.FB = 1 / (1 + self.rng.randint(0, 9))
+        self.stats = {
+            k: ((2 * v + self.AS) / 1.1 * self.FB)
+            for k, v in self.base_stats.items()
+        }
+        self.max_HP = (
+            (
+                self.stats["strength"] * 0.8
+                + self.stats["durability"] * 0.7
+                + self.stats["power"]
+            )
+            / 2
+            * (1 + self.AS / 10)
+        ) + 100
+        self.HP = self.max_HP
+        self.attacks = {
+            attack_type: sum(
+                self.stats[stat] * coeff for stat, coeff in coefficients.items()
+            )
+            * self.FB
+            for attack_type, coefficients in self.ATTACK_TYPES.items()
+        }
+
+    def attack(self, opponent):
+        attack_type = self.rng.choice(list(self.attacks.keys()))
+        attack_value = self.attacks[attack_type]
+        opponent.HP -= attack_value
+        return attack_value, attack_type
+
+
+###########################################################
+# BENCHMARKS
+###########################################################
+
+
+def random_base_stats(rng: random.Random) -> Dict[str, int]:
+    """
+    Generate random base stats.
+
+    Args:
+        rng: The random number generator.
+
+    Returns:
+        Dict[str, int]: The base stats.
+    """
+    return {
+        stat: rng.randint(0, 100)
+        for stat in (
+            "intelligence",
+            "strength",
+            "speed",
+            "durability",
+            "power",
+            "combat",
+        )
+    }
+
+
+def measure_memory(character_class: Callable, count: int) -> float:
+    """
+    Measure the memory held by initialized characters, with their stats, HP
+    and attacks derived.
+
+    Args:
+        character_class: The class of the characters.
+        count: The number of characters to create.
+
+    Returns:
+        float: The allocated bytes per character.
+    """
+    rng = random.Random(0)
+    base_stats = [random_base_stats(rng) for _ in range(count)]
+    tracemalloc.start()
+    characters = []
+    for character_id, stats in enumerate(base_stats):
+        character = character_class(character_id, "Hero", "good", stats, rng)
+        character.init_FB_stats_HP_and_attacks("good")
+        # Character derives them on first use, the baseline eagerly
+        character.max_HP
+        characters.append(character)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / count
+
+
+def measure_attacks(character_class: Callable, moves: int) -> float:
+    """
+    Measure the time of repeated attacks between two characters.
+
+    Args:
+        character_class: The class of the characters.
+        moves: The number of attacks to perform.
+
+    Returns:
+        float: The nanoseconds per attack.
+    """
+    rng = random.Random(0)
+    attacker = character_class(1, "A", "good", random_base_stats(rng), rng)
+    defender = character_class(2, "B", "good", random_base_stats(rng), rng)
+    attacker.init_FB_stats_HP_and_attacks("good")
+    defender.init_FB_stats_HP_and_attacks("good")
+    seconds = timeit.timeit(lambda: attacker.attack(defender), number=moves)
+    return seconds / moves * 1e9
+
+
+if __name__ == "__main__":
+    # Run from the repository root: python -m benchmarks.character_memory
+    # Compare the slotted Character with the dictionary-based layout
+    count = 20_000
+    moves = 1_000_000
+    print(f"{'':<16}{'bytes/character':>18}{'ns/attack':>12}")
+    for label, character_class in (
+        ("dict-based", DictCharacter),
+        ("Character", Character),
+    ):
+        print(
+            f"{label:<16}{measure_memory(character_class, count):>18.0f}"
+            f"{measure_attacks(character_class, moves):>12.0f}"
+        )
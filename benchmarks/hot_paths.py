@@ -0,0 +1,446 @@
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+
+from app.models import Battle, Character, Team
+from app.models.character import derive_stats_HP_and_attacks
+from app.services import Character_Service
+from app.utils import (
+    SilentReporter,
+    read_battle_records,
+    extract_team_names,
+    extract_round_details,
+    extract_winning_team,
+    write_html_report,
+)
+
+from .character_memory import random_base_stats
+
+# A benchmark runs its operation a number of times and returns the elapsed
+# seconds and the number of operations actually timed
+Benchmark = Callable[[int], Tuple[float, int]]
+
+###########################################################
+# FIXTURES
+###########################################################
+
+
+def make_roster(
+    rng: random.Random, first_id: int = 1, size: int = 5
+) -> List[tuple]:
+    """
+    Generate the roster of a team with random characters.
+
+    Args:
+        rng: The random number generator.
+        first_id: The ID of the first character.
+        size: The number of characters.
+
+    Returns:
+        List[tuple]: The ID, name, alignment and base stats of the characters.
+    """
+    return [
+        (
+            character_id,
+            f"Hero {character_id}",
+            rng.choice(("good", "bad")),
+            random_base_stats(rng),
+        )
+        for character_id in range(first_id, first_id + size)
+    ]
+
+
+def make_battle(seed: int) -> Battle:
+    """
+    Build a silent battle between two random teams.
+
+    Args:
+        seed: The seed of the rosters and of the battle.
+
+    Returns:
+        Battle: A battle ready to be simulated.
+    """
+    rng = random.Random(seed)
+    roster_1 = make_roster(rng, 1)
+    roster_2 = make_roster(rng, 6)
+    team_1 = Team.from_characters_data("Team 1", roster_1, rng)
+    team_2 = Team.from_characters_data("Team 2", roster_2, rng)
+    return Battle(
+        team_1, team_2, reporter=SilentReporter(), log=False, seed=seed
+    )
+
+
+def make_log_records(rounds: int) -> List[Dict]:
+    """
+    Generate the battle log records of a battle.
+
+    Args:
+        rounds: The number of rounds of the battle.
+
+    Returns:
+        List[Dict]: The records, as written by the battle loggers.
+    """
+    rng = random.Random(0)
+    records = [
+        {"type": "battle", "team_1": "Team 1", "team_2": "Team 2", "seed": 0}
+    ]
+    for round_number in range(1, rounds + 1):
+        attacking_character = f"Hero {rng.randint(1, 5)}"
+        records.append(
+            {
+                "type": "round",
+                "round": round_number,
+                "attacking_character": attacking_character,
+                "attacking_character_HP": rng.uniform(100, 1000),
+                "defending_character": f"Hero {rng.randint(6, 10)}",
+                "defending_character_HP": rng.uniform(100, 1000),
+                "winner": attacking_character,
+            }
+        )
+    records.append({"type": "winner", "team": "Team 1"})
+    return records
+
+
+class Stub_Character_Service:
+    """
+    Replace the Superhero API calls of Character_Service with generated data.
+    """
+
+    def __enter__(self) -> "Stub_Character_Service":
+        self.original = Character_Service.__dict__["get_many_character_data"]
+        rng = random.Random(0)
+        data = {
+            character_id: (
+                f"Hero {character_id}",
+                rng.choice(("good", "bad")),
+                random_base_stats(rng),
+            )
+            for character_id in Character_Service.available_character_ids()
+        }
+        Character_Service.get_many_character_data = classmethod(
+            lambda cls, character_ids, max_workers=None: [
+                data[character_id] for character_id in character_ids
+            ]
+        )
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        Character_Service.get_many_character_data = self.original
+
+
+###########################################################
+# BENCHMARKS
+###########################################################
+
+
+def time_init_FB_stats_HP_and_attacks(number: int) -> Tuple[float, int]:
+    """
+    Time the initialization of the derived stats of new characters. The
+    stats, HP and attacks are derived on first use, so reading the max HP
+    forces them, keeping the timing comparable with eager initialization.
+    The characters are the same on every call, so their stats are in the
+    cache after the first one.
+    """
+    rng = random.Random(0)
+    characters = [
+        Character(character_id, "Hero", "good", random_base_stats(rng), rng)
+        for character_id in range(number)
+    ]
+    start = time.perf_counter()
+    for character in characters:
+        character.init_FB_stats_HP_and_attacks("good")
+        character.max_HP
+    return time.perf_counter() - start, number
+
+
+def bench_init_FB_stats_HP_and_attacks(number: int) -> Tuple[float, int]:
+    """
+    Time the initialization of the derived stats of new characters, deriving
+    every one of them.
+    """
+    derive_stats_HP_and_attacks.cache_clear()
+    return time_init_FB_stats_HP_and_attacks(number)
+
+
+def bench_init_FB_stats_HP_and_attacks_warm(
+    number: int,
+) -> Tuple[float, int]:
+    """
+    Time the initialization of the derived stats of new characters, with
+    their stats already in the cache.
+    """
+    derive_stats_HP_and_attacks.cache_clear()
+    time_init_FB_stats_HP_and_attacks(number)
+    return time_init_FB_stats_HP_and_attacks(number)
+
+
+def bench_attack(number: int) -> Tuple[float, int]:
+    """
+    Time repeated attacks between two characters.
+    """
+    rng = random.Random(0)
+    attacker = Character(1, "A", "good", random_base_stats(rng), rng)
+    defender = Character(2, "B", "good", random_base_stats(rng), rng)
+    attacker.init_FB_stats_HP_and_attacks("good")
+    defender.init_FB_stats_HP_and_attacks("good")
+    attack = attacker.attack
+    start = time.perf_counter()
+    for _ in range(number):
+        attack(defender)
+    return time.perf_counter() - start, number
+
+
+def bench_simulate_round(number: int) -> Tuple[float, int]:
+    """
+    Time the rounds of whole battles, excluding the building of the teams.
+    """
+    elapsed = 0.0
+    rounds = 0
+    seed = 0
+    while rounds < number:
+        battle = make_battle(seed)
+        start = time.perf_counter()
+        round_number = 1
+        while (
+            battle.team_1.team_has_members()
+            and battle.team_2.team_has_members()
+        ):
+            battle._simulate_round(round_number)
+            round_number += 1
+        elapsed += time.perf_counter() - start
+        rounds += round_number - 1
+        seed += 1
+    return elapsed, rounds
+
+
+def bench_battle(number: int) -> Tuple[float, int]:
+    """
+    Time whole battles, including the building of the teams from their rosters.
+    """
+    rng = random.Random(0)
+    roster_1 = make_roster(rng, 1)
+    roster_2 = make_roster(rng, 6)
+    start = time.perf_counter()
+    for seed in range(number):
+        battle_rng = random.Random(seed)
+        team_1 = Team.from_characters_data("Team 1", roster_1, battle_rng)
+        team_2 = Team.from_characters_data("Team 2", roster_2, battle_rng)
+        Battle(
+            team_1, team_2, reporter=SilentReporter(), log=False, seed=seed
+        ).simulate()
+    return time.perf_counter() - start, number
+
+
+def bench_from_characters_data(number: int) -> Tuple[float, int]:
+    """
+    Time the building of both teams of a battle from their rosters.
+    """
+    rng = random.Random(0)
+    roster_1 = make_roster(rng, 1)
+    roster_2 = make_roster(rng, 6)
+    start = time.perf_counter()
+    for seed in range(number):
+        battle_rng = random.Random(seed)
+        Team.from_characters_data("Team 1", roster_1, battle_rng)
+        Team.from_characters_data("Team 2", roster_2, battle_rng)
+    return time.perf_counter() - start, number
+
+
+def bench_populate_team(number: int) -> Tuple[float, int]:
+    """
+    Time the population of a team, with the Superhero API calls stubbed.
+    """
+    with Stub_Character_Service():
+        start = time.perf_counter()
+        for seed in range(number):
+            team = Team("Team 1", random.Random(seed))
+            Team.populate_teams(team, reporter=SilentReporter())
+        return time.perf_counter() - start, number
+
+
+def bench_log_extraction(number: int) -> Tuple[float, int]:
+    """
+    Time the extraction of the teams, rounds and winner from a log file.
+    """
+    records = make_log_records(9)
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".jsonl", delete=False, encoding="utf-8"
+    ) as file:
+        for record in records:
+            file.write(json.dumps(record) + "\n")
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            extract_team_names(read_battle_records(file.name))
+            extract_round_details(read_battle_records(file.name))
+            extract_winning_team(read_battle_records(file.name))
+        return time.perf_counter() - start, number
+    finally:
+        os.remove(file.name)
+
+
+def bench_html_report(number: int) -> Tuple[float, int]:
+    """
+    Time the rendering of the HTML report of a battle.
+    """
+    records = make_log_records(9)
+    start = time.perf_counter()
+    for _ in range(number):
+        write_html_report(records, io.StringIO())
+    return time.perf_counter() - start, number
+
+
+BENCHMARKS: Dict[str, Tuple[Benchmark, int, str]] = {
+    # name: (benchmark, operations per run, unit)
+    "character.init_FB_stats_HP_and_attacks": (
+        bench_init_FB_stats_HP_and_attacks,
+        20_000,
+        "character",
+    ),
+    "character.init_FB_stats_HP_and_attacks.warm": (
+        bench_init_FB_stats_HP_and_attacks_warm,
+        20_000,
+        "character",
+    ),
+    "character.attack": (bench_attack, 200_000, "attack"),
+    "battle.simulate_round": (bench_simulate_round, 20_000, "round"),
+    "battle.simulate": (bench_battle, 2_000, "battle"),
+    "team.from_characters_data": (
+        bench_from_characters_data,
+        5_000,
+        "battle",
+    ),
+    "team.populate_team": (bench_populate_team, 2_000, "team"),
+    "log.extraction": (bench_log_extraction, 2_000, "log"),
+    "html.report": (bench_html_report, 5_000, "report"),
+}
+
+
+###########################################################
+# RUNNER
+###########################################################
+
+
+def run_benchmarks(
+    names: List[str], repeat: int, scale: float
+) -> Dict[str, Dict[str, float]]:
+    """
+    Run benchmarks, keeping the best of several runs of each.
+
+    Args:
+        names: The names of the benchmarks to run.
+        repeat: The number of runs of each benchmark.
+        scale: The factor applied to the operations per run.
+
+    Returns:
+        Dict[str, Dict[str, float]]: The unit, operations per second and
+        nanoseconds per operation of each benchmark.
+    """
+    results = {}
+    for name in names:
+        benchmark, number, unit = BENCHMARKS[name]
+        number = max(1, int(number * scale))
+        best = min(
+            elapsed / operations
+            for elapsed, operations in (
+                benchmark(number) for _ in range(repeat)
+            )
+        )
+        results[name] = {
+            "unit": unit,
+            "ops_per_second": 1 / best,
+            "ns_per_op": best * 1e9,
+        }
+    return results
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    """
+    Compare benchmark results with a baseline.
+
+    Args:
+        results: The current results.
+        baseline: The results of a previous run.
+        tolerance: The allowed slowdown, as a fraction of the baseline.
+
+    Returns:
+        List[str]: A description of each benchmark slower than allowed.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        expected = baseline[name]["ops_per_second"]
+        if result["ops_per_second"] < expected * (1 - tolerance):
+            regressions.append(
+                f"{name}: {result['ops_per_second']:.0f} {result['unit']}/s"
+                f" (baseline {expected:.0f} {result['unit']}/s)"
+            )
+    return regressions
+
+
+if __name__ == "__main__":
+    # Run from the repository root: python -m benchmarks.hot_paths
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-only", nargs="*", choices=list(BENCHMARKS), help="Benchmarks to run"
+    )
+    parser.add_argument(
+        "-repeat", type=int, default=5, help="Runs per benchmark"
+    )
+    parser.add_argument(
+        "-scale",
+        type=float,
+        default=1.0,
+        help="Factor on the operations per run",
+    )
+    parser.add_argument("-output", type=str, help="JSON results file path")
+    parser.add_argument("-compare", type=str, help="Baseline JSON results file")
+    parser.add_argument(
+        "-tolerance",
+        type=float,
+        default=0.1,
+        help="Allowed slowdown against the baseline",
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks(
+        args.only or list(BENCHMARKS), args.repeat, args.scale
+    )
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+
+    for name, result in results.items():
+        print(
+            f"{name:<42}{result['ops_per_second']:>14.0f} {result['unit']}/s"
+            f"{result['ns_per_op']:>14.0f} ns/{result['unit']}",
+            file=sys.stderr,
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            baseline = json.load(file)["benchmarks"]
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"Regresion: {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
@@ -0,0 +1,220 @@
+import argparse
+import random
+import time
+from typing import Dict, List, Type
+
+from app.models import Battle, Character, FreeForAllBattle, Team
+from app.services import Character_Service
+from app.utils import SilentReporter
+
+from .hot_paths import make_roster
+
+###########################################################
+# REFERENCE IMPLEMENTATION
+###########################################################
+
+
+class ListRemoveTeam(Team):
+    """
+    A team removing its members with list.remove, kept as a baseline for
+    comparison.
+    """
+
+    def remove_member(self, member: Character) -> None:
+        self.members.remove(member)
+
+
+###########################################################
+# BENCHMARKS
+###########################################################
+
+
+def make_teams(
+    team_class: Type[Team], team_count: int, team_size: int, seed: int
+) -> List[Team]:
+    """
+    Build teams of random characters.
+
+    Args:
+        team_class: The class of the teams.
+        team_count: The number of teams.
+        team_size: The number of characters in each team.
+        seed: The seed of the rosters and of the battle.
+
+    Returns:
+        List[Team]: The populated teams.
+    """
+    rng = random.Random(seed)
+    return [
+        team_class.from_characters_data(
+            f"Team {team_number + 1}",
+            make_roster(rng, team_number * team_size + 1, team_size),
+            rng,
+        )
+        for team_number in range(team_count)
+    ]
+
+
+def time_removals(
+    team_class: Type[Team], team_size: int, removals: int
+) -> float:
+    """
+    Time drawing a random member and removing it until the team is empty,
+    excluding the building of the team and the duels, so only the cost of
+    the members list is measured.
+
+    Args:
+        team_class: The class of the teams.
+        team_size: The number of characters in each team.
+        removals: The minimum number of removals to time.
+
+    Returns:
+        float: The nanoseconds per removal.
+    """
+    elapsed = 0.0
+    removed = 0
+    seed = 0
+    while removed < removals:
+        (team,) = make_teams(team_class, 1, team_size, seed)
+        start = time.perf_counter()
+        while team.members:
+            team.remove_member(team.select_random_character())
+        elapsed += time.perf_counter() - start
+        removed += team_size
+        seed += 1
+    return elapsed / removed * 1e9
+
+
+def time_rounds(
+    team_class: Type[Team],
+    team_count: int,
+    team_size: int,
+    rounds: int,
+) -> float:
+    """
+    Time the rounds of whole battles, excluding the building of the teams.
+    The duels dominate the cost of a round, so this shows how much of it the
+    members list takes, not how the list scales.
+
+    Args:
+        team_class: The class of the teams.
+        team_count: The number of teams of each battle.
+        team_size: The number of characters in each team.
+        rounds: The minimum number of rounds to time.
+
+    Returns:
+        float: The nanoseconds per round.
+    """
+    elapsed = 0.0
+    played = 0
+    seed = 0
+    while played < rounds:
+        teams = make_teams(team_class, team_count, team_size, seed)
+        if team_count == 2:
+            battle = Battle(
+                *teams, reporter=SilentReporter(), log=False, seed=seed
+            )
+        else:
+            battle = FreeForAllBattle(
+                teams, reporter=SilentReporter(), seed=seed
+            )
+        start = time.perf_counter()
+        winner = battle.simulate()
+        elapsed += time.perf_counter() - start
+        played += team_count * team_size - len(winner.members)
+        seed += 1
+    return elapsed / played * 1e9
+
+
+def run_scaling(
+    team_sizes: List[int], team_counts: List[int], rounds: int, repeat: int
+) -> List[Dict[str, float]]:
+    """
+    Measure the cost of removing a member and of a whole round for every team
+    size and number of teams, keeping the best of several runs.
+
+    Args:
+        team_sizes: The numbers of characters in each team.
+        team_counts: The numbers of teams of each battle.
+        rounds: The minimum number of rounds, and of removals, timed per run.
+        repeat: The number of runs of each measurement.
+
+    Returns:
+        List[Dict[str, float]]: The nanoseconds per removal and per round of
+        the teams and of the list.remove baseline, for each team size and
+        number of teams.
+    """
+    removals = {
+        team_size: (
+            min(time_removals(Team, team_size, rounds) for _ in range(repeat)),
+            min(
+                time_removals(ListRemoveTeam, team_size, rounds)
+                for _ in range(repeat)
+            ),
+        )
+        for team_size in team_sizes
+    }
+    results = []
+    for team_count in team_counts:
+        for team_size in team_sizes:
+            results.append(
+                {
+                    "teams": team_count,
+                    "team_size": team_size,
+                    "ns_per_removal": removals[team_size][0],
+                    "list_remove_ns_per_removal": removals[team_size][1],
+                    "ns_per_round": min(
+                        time_rounds(Team, team_count, team_size, rounds)
+                        for _ in range(repeat)
+                    ),
+                    "list_remove_ns_per_round": min(
+                        time_rounds(
+                            ListRemoveTeam, team_count, team_size, rounds
+                        )
+                        for _ in range(repeat)
+                    ),
+                }
+            )
+    return results
+
+
+if __name__ == "__main__":
+    # Run from the repository root: python -m benchmarks.team_scaling
+    full_roster = len(Character_Service.available_character_ids()) // 2
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-sizes",
+        nargs="*",
+        type=int,
+        default=sorted([5, 50, 500, full_roster, 5000]),
+        help="Team sizes, half of the roster by default included",
+    )
+    parser.add_argument(
+        "-teams", nargs="*", type=int, default=[2, 8], help="Teams per battle"
+    )
+    parser.add_argument(
+        "-rounds", type=int, default=20_000, help="Rounds timed per run"
+    )
+    parser.add_argument(
+        "-repeat", type=int, default=3, help="Runs per measurement"
+    )
+    args = parser.parse_args()
+
+    results = run_scaling(args.sizes, args.teams, args.rounds, args.repeat)
+
+    print(f"{'Tamaño':>8}{'ns/baja':>14}{'list.remove':>14}")
+    for result in results:
+        if result["teams"] == args.teams[0]:
+            print(
+                f"{result['team_size']:>8}"
+                f"{result['ns_per_removal']:>14.0f}"
+                f"{result['list_remove_ns_per_removal']:>14.0f}"
+            )
+    print()
+    print(f"{'Equipos':>8}{'Tamaño':>8}{'ns/ronda':>14}{'list.remove':>14}")
+    for result in results:
+        print(
+            f"{result['teams']:>8}{result['team_size']:>8}"
+            f"{result['ns_per_round']:>14.0f}"
+            f"{result['list_remove_ns_per_round']:>14.0f}"
+        )